@@ -1,7 +1,19 @@
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils import timezone
 
-from .models import AdminNotification, DewormingTreatmentRecord, VaccinationRecord
+from .models import AdminNotification, AdminNotificationSyncCursor, DewormingTreatmentRecord, VaccinationRecord
+
+
+# The cursor row lives in ``AdminNotificationSyncCursor``; the cache only saves reading it.
+ADMIN_EXPIRY_SYNC_CURSOR_NAME = "expiry"
+ADMIN_EXPIRY_SYNC_CURSOR_KEY = "admin_expiry_sync_last_day_v1"
+# How far back a run looks when the last synced day is not known.
+ADMIN_EXPIRY_SYNC_LOOKBACK_DAYS = 7
+# Older missed days are not announced; their notices would only be noise by then.
+ADMIN_EXPIRY_SYNC_MAX_CATCHUP_DAYS = 31
 
 
 def _notification_target(registration_id):
@@ -19,69 +31,138 @@ def _registration_suffix(registration):
     return f" ({reg_no})"
 
 
-def _create_notification_once(*, event_key, title, message, url):
-    if AdminNotification.objects.filter(event_key=event_key).exists():
-        return False
-
-    AdminNotification.objects.create(
-        title=title,
-        message=message,
-        url=url,
-        event_key=event_key,
+def _insert_missing_notifications(notifications):
+    """Insert the notices whose ``event_key`` is not stored yet; returns how many were new."""
+    if not notifications:
+        return 0
+    existing_keys = set(
+        AdminNotification.objects.filter(
+            event_key__in=[notification.event_key for notification in notifications]
+        ).values_list("event_key", flat=True)
     )
-    return True
+    new_notifications = [
+        notification for notification in notifications if notification.event_key not in existing_keys
+    ]
+    # A concurrent run may have stored some keys meanwhile; the unique key skips those.
+    AdminNotification.objects.bulk_create(new_notifications, ignore_conflicts=True)
+    return len(new_notifications)
+
+
+def _last_synced_day():
+    last_synced = cache.get(ADMIN_EXPIRY_SYNC_CURSOR_KEY)
+    if last_synced is None:
+        last_synced = (
+            AdminNotificationSyncCursor.objects.filter(name=ADMIN_EXPIRY_SYNC_CURSOR_NAME)
+            .values_list("last_synced_day", flat=True)
+            .first()
+        )
+        if last_synced is not None:
+            cache.set(ADMIN_EXPIRY_SYNC_CURSOR_KEY, last_synced, None)
+    return last_synced
+
+
+def _store_last_synced_day(day):
+    cursor_rows = AdminNotificationSyncCursor.objects.filter(name=ADMIN_EXPIRY_SYNC_CURSOR_NAME)
+    if not cursor_rows.update(last_synced_day=day):
+        AdminNotificationSyncCursor.objects.bulk_create(
+            [AdminNotificationSyncCursor(name=ADMIN_EXPIRY_SYNC_CURSOR_NAME, last_synced_day=day)],
+            ignore_conflicts=True,
+        )
+    cache.set(ADMIN_EXPIRY_SYNC_CURSOR_KEY, day, None)
+
+
+def _sync_window(today, last_synced):
+    """First day to check: the day after the last synced one, within the catch-up limit."""
+    earliest = today - timedelta(days=ADMIN_EXPIRY_SYNC_MAX_CATCHUP_DAYS - 1)
+    if last_synced is None:
+        # Without a cursor, recheck a short window; stored keys make repeats no-ops.
+        return max(earliest, today - timedelta(days=ADMIN_EXPIRY_SYNC_LOOKBACK_DAYS))
+    return min(max(earliest, last_synced + timedelta(days=1)), today)
 
 
 def sync_expiry_notifications(today=None):
+    """Raise expiry notices for every day since the last run through ``today``; returns how many are new."""
     today = today or timezone.localdate()
-    created_any = False
-    created_any |= _sync_vaccination_card_expiry_notifications(today)
-    created_any |= _sync_medicine_expiry_notifications(today)
-    return created_any
+    last_synced = _last_synced_day()
+    since = _sync_window(today, last_synced)
+    created_count = _insert_missing_notifications(
+        _vaccination_card_expiry_notifications(since, today)
+        + _medicine_expiry_notifications(since, today)
+    )
+    if last_synced != today:
+        _store_last_synced_day(today)
+    return created_count
+
+
+def _expiry_title(expiry_date, today, subject):
+    if expiry_date == today:
+        return f"{subject} expires today"
+    return f"{subject} expired"
 
 
-def _sync_vaccination_card_expiry_notifications(today):
-    created_any = False
+def _expiry_phrase(expiry_date, today):
+    if expiry_date == today:
+        return f"expires today, {expiry_date:%B %d, %Y}"
+    return f"expired on {expiry_date:%B %d, %Y}"
+
+
+def _vaccination_card_expiry_notifications(since, today):
     records = (
         VaccinationRecord.objects.select_related("registration")
-        .filter(vaccination_expiry_date=today)
-        .order_by("registration_id", "id")
+        .filter(vaccination_expiry_date__range=(since, today))
+        .only(
+            "id",
+            "vaccination_expiry_date",
+            "registration__id",
+            "registration__reg_no",
+            "registration__name_of_pet",
+        )
+        .order_by("vaccination_expiry_date", "registration_id", "id")
     )
+    notifications = []
     for record in records:
         registration = record.registration
+        expiry_date = record.vaccination_expiry_date
         pet_name = registration.name_of_pet if registration else "Unassigned pet"
-        message = (
-            f"{pet_name}{_registration_suffix(registration)} vaccination card expires today, "
-            f"{today:%B %d, %Y}."
-        )
-        created_any |= _create_notification_once(
-            event_key=f"vaccination-card-expiry:{record.pk}:{today.isoformat()}",
-            title="Vaccination card expires today",
-            message=message,
+        notifications.append(AdminNotification(
+            title=_expiry_title(expiry_date, today, "Vaccination card"),
+            message=(
+                f"{pet_name}{_registration_suffix(registration)} vaccination card "
+                f"{_expiry_phrase(expiry_date, today)}."
+            ),
             url=_notification_target(getattr(registration, "id", None)),
-        )
-    return created_any
+            event_key=f"vaccination-card-expiry:{record.pk}:{expiry_date.isoformat()}",
+        ))
+    return notifications
 
 
-def _sync_medicine_expiry_notifications(today):
-    created_any = False
+def _medicine_expiry_notifications(since, today):
     records = (
         DewormingTreatmentRecord.objects.select_related("registration")
-        .filter(medicine_expiry_date=today)
-        .order_by("registration_id", "id")
+        .filter(medicine_expiry_date__range=(since, today))
+        .only(
+            "id",
+            "medicine_given",
+            "medicine_expiry_date",
+            "registration__id",
+            "registration__reg_no",
+            "registration__name_of_pet",
+        )
+        .order_by("medicine_expiry_date", "registration_id", "id")
     )
+    notifications = []
     for record in records:
         registration = record.registration
+        expiry_date = record.medicine_expiry_date
         pet_name = registration.name_of_pet if registration else "Unassigned pet"
         medicine_name = (record.medicine_given or "Medicine").strip()
-        message = (
-            f"{pet_name}{_registration_suffix(registration)} medicine {medicine_name} expires today, "
-            f"{today:%B %d, %Y}."
-        )
-        created_any |= _create_notification_once(
-            event_key=f"medicine-expiry:{record.pk}:{today.isoformat()}",
-            title="Medicine expires today",
-            message=message,
+        notifications.append(AdminNotification(
+            title=_expiry_title(expiry_date, today, "Medicine"),
+            message=(
+                f"{pet_name}{_registration_suffix(registration)} medicine {medicine_name} "
+                f"{_expiry_phrase(expiry_date, today)}."
+            ),
             url=_notification_target(getattr(registration, "id", None)),
-        )
-    return created_any
+            event_key=f"medicine-expiry:{record.pk}:{expiry_date.isoformat()}",
+        ))
+    return notifications
@@ -0,0 +1,284 @@
+"""Daily rollups behind the admin analytics dashboard.
+
+Each ``AnalyticsDailyCount`` row counts the records of one metric for a day,
+a place, a kind (request type or breed) and a status. Receivers in
+``dogadoption_admin.signals`` recount only the days a saved or deleted record
+falls on, before and after the change, so the dashboard reads a few rows per
+day instead of every post, request, dog and vaccination. Recounts run after
+the writer commits and upsert only the keys that changed, so two saves on the
+same day never collide on ``analytics_daily_unique``.
+
+Bulk ``update()`` calls recount the days they touch with
+``refresh_rollup_days`` themselves; ``manage.py reconcile_analytics_rollups``
+recounts any day that drifted anyway.
+"""
+from datetime import datetime, time, timedelta
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from .cache_utils import invalidate_analytics_dashboard_cache
+from .models import AnalyticsDailyCount, Dog, DogRegistration, Post, PostRequest, VaccinationRecord
+from user.models import DogCaptureRequest
+
+
+# A metric's day is its date field, falling back to the local date of its datetime field.
+ROLLUP_METRICS = {
+    "post": {
+        "model": Post,
+        "day": ("rescued_date", "created_at"),
+        "place": Coalesce("location", Value("")),
+        "status": F("status"),
+    },
+    "post_request": {
+        "model": PostRequest,
+        "day": (None, "created_at"),
+        "kind": F("request_type"),
+        "status": F("status"),
+    },
+    "adoption_outcome": {
+        "model": PostRequest,
+        "day": ("scheduled_appointment_date", "created_at"),
+        "kind": F("request_type"),
+        "filter": Q(
+            status="accepted",
+            request_type__in=["claim", "adopt"],
+            post__status__in=["reunited", "adopted"],
+        ),
+    },
+    "capture_request": {
+        "model": DogCaptureRequest,
+        "day": (None, "created_at"),
+        "status": F("status"),
+    },
+    "dog": {
+        "model": Dog,
+        "day": ("date_registered", None),
+        "place": Coalesce("barangay", Value("")),
+    },
+    "registration": {
+        "model": DogRegistration,
+        "day": (None, "date_registered"),
+    },
+    "vaccination": {
+        "model": VaccinationRecord,
+        "day": ("date", None),
+        "kind": F("registration__breed"),
+        "filter": Q(registration__isnull=False),
+        "total": Count("registration_id", distinct=True),
+    },
+}
+
+# Per sender: the fields a save must touch to move a count, and the metrics it
+# feeds with the lookup that finds its source rows.
+ROLLUP_SOURCES = {
+    Post: (
+        frozenset({"rescued_date", "created_at", "location", "status"}),
+        (("post", "pk"), ("adoption_outcome", "post_id")),
+    ),
+    PostRequest: (
+        frozenset({"post", "post_id", "request_type", "status", "scheduled_appointment_date", "created_at"}),
+        (("post_request", "pk"), ("adoption_outcome", "pk")),
+    ),
+    DogCaptureRequest: (
+        frozenset({"status", "created_at"}),
+        (("capture_request", "pk"),),
+    ),
+    Dog: (
+        frozenset({"date_registered", "barangay"}),
+        (("dog", "pk"),),
+    ),
+    DogRegistration: (
+        frozenset({"date_registered", "breed"}),
+        (("registration", "pk"), ("vaccination", "registration_id")),
+    ),
+    VaccinationRecord: (
+        frozenset({"date", "registration", "registration_id"}),
+        (("vaccination", "pk"),),
+    ),
+}
+
+_ROLLUP_COLUMNS = ("place", "kind", "status")
+
+
+def _day_expression(metric):
+    date_field, datetime_field = ROLLUP_METRICS[metric]["day"]
+    if date_field and datetime_field:
+        return Coalesce(date_field, TruncDate(datetime_field))
+    return F(date_field) if date_field else TruncDate(datetime_field)
+
+
+def _day_window(metric, days):
+    """Indexable filter for the rows of ``metric`` that fall on ``days``."""
+    date_field, datetime_field = ROLLUP_METRICS[metric]["day"]
+    if not datetime_field:
+        return Q(**{f"{date_field}__in": days})
+
+    on_datetime = Q()
+    for day in days:
+        starts_at = timezone.make_aware(datetime.combine(day, time.min))
+        on_datetime |= Q(**{
+            f"{datetime_field}__gte": starts_at,
+            f"{datetime_field}__lt": starts_at + timedelta(days=1),
+        })
+    if not date_field:
+        return on_datetime
+    return Q(**{f"{date_field}__in": days}) | (Q(**{f"{date_field}__isnull": True}) & on_datetime)
+
+
+def _clip(value, column):
+    return (value or "")[:AnalyticsDailyCount._meta.get_field(column).max_length]
+
+
+def _counted_rows(metric, days=None):
+    """``{(day, place, kind, status): total}`` counted from the source rows of ``metric``."""
+    spec = ROLLUP_METRICS[metric]
+    rows = spec["model"].objects.filter(spec.get("filter", Q()))
+    if days is not None:
+        rows = rows.filter(_day_window(metric, days))
+    rows = (
+        rows.annotate(
+            rollup_day=_day_expression(metric),
+            **{f"rollup_{column}": spec.get(column, Value("")) for column in _ROLLUP_COLUMNS},
+        )
+        .exclude(rollup_day__isnull=True)
+        .values("rollup_day", *(f"rollup_{column}" for column in _ROLLUP_COLUMNS))
+        .annotate(rollup_total=spec.get("total", Count("pk")))
+        .order_by()
+    )
+    counts = {}
+    for row in rows:
+        key = (row["rollup_day"], *(_clip(row[f"rollup_{column}"], column) for column in _ROLLUP_COLUMNS))
+        counts[key] = counts.get(key, 0) + row["rollup_total"]
+    return counts
+
+
+def _stored_rows(metric, days=None):
+    rows = AnalyticsDailyCount.objects.filter(metric=metric)
+    if days is not None:
+        rows = rows.filter(day__in=days)
+    return {
+        row[:-1]: row[-1]
+        for row in rows.values_list("day", *_ROLLUP_COLUMNS, "total")
+    }
+
+
+def _write_days(metric, days, counts, stored):
+    """Upsert the counted keys of ``days`` that changed and delete the ones that disappeared."""
+    changed = [
+        AnalyticsDailyCount(metric=metric, day=day, place=place, kind=kind, status=status, total=total)
+        for (day, place, kind, status), total in counts.items()
+        if day in days and stored.get((day, place, kind, status)) != total
+    ]
+    if changed:
+        # MySQL upserts on any unique key and rejects an explicit conflict target.
+        unique_fields = (
+            ["metric", "day", "place", "kind", "status"]
+            if connection.features.supports_update_conflicts_with_target
+            else None
+        )
+        AnalyticsDailyCount.objects.bulk_create(
+            changed,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=["total"],
+            batch_size=500,
+        )
+
+    gone = Q()
+    for day, place, kind, status in stored.keys() - counts.keys():
+        if day in days:
+            gone |= Q(day=day, place=place, kind=kind, status=status)
+    if gone:
+        AnalyticsDailyCount.objects.filter(gone, metric=metric).delete()
+    return bool(changed or gone)
+
+
+def _instance_day(metric, instance):
+    date_field, datetime_field = ROLLUP_METRICS[metric]["day"]
+    if date_field:
+        value = instance._meta.get_field(date_field).to_python(getattr(instance, date_field))
+        if value:
+            return value
+    if datetime_field and getattr(instance, datetime_field):
+        return timezone.localdate(getattr(instance, datetime_field))
+    return None
+
+
+def rollup_days_for_lookup(metric, lookup, value):
+    return set(
+        ROLLUP_METRICS[metric]["model"].objects.filter(**{lookup: value})
+        .annotate(rollup_day=_day_expression(metric))
+        .exclude(rollup_day__isnull=True)
+        .values_list("rollup_day", flat=True)
+        .distinct()
+    )
+
+
+def rollup_days_for(instance):
+    """``{metric: days}`` the stored source rows of ``instance`` are counted on right now."""
+    _source_fields, lookups = ROLLUP_SOURCES[type(instance)]
+    days_by_metric = {}
+    for metric, lookup in lookups:
+        days_by_metric.setdefault(metric, set()).update(rollup_days_for_lookup(metric, lookup, instance.pk))
+    return days_by_metric
+
+
+def saved_rollup_days(instance, created):
+    """Like ``rollup_days_for`` after a save, reading the instance's own day without a query.
+
+    A row that was just created has no dependent rows yet, so only its own metrics count.
+    """
+    _source_fields, lookups = ROLLUP_SOURCES[type(instance)]
+    days_by_metric = {}
+    for metric, lookup in lookups:
+        if lookup == "pk":
+            day = _instance_day(metric, instance)
+            days = {day} if day else set()
+        elif created:
+            continue
+        else:
+            days = rollup_days_for_lookup(metric, lookup, instance.pk)
+        days_by_metric.setdefault(metric, set()).update(days)
+    return days_by_metric
+
+
+def refresh_rollup_days(days_by_metric):
+    """Recount the given days of each metric from the source tables."""
+    days_by_metric = {metric: set(days) for metric, days in days_by_metric.items() if days}
+    changed = False
+    for metric, days in days_by_metric.items():
+        changed |= _write_days(metric, days, _counted_rows(metric, days), _stored_rows(metric, days))
+    if changed:
+        invalidate_analytics_dashboard_cache()
+
+
+def refresh_rollups_for(metric, rows):
+    """Recount the days of ``rows`` in ``metric`` after a bulk ``update()`` skipped the receivers."""
+    refresh_rollup_days({metric: {_instance_day(metric, row) for row in rows} - {None}})
+
+
+def refresh_rollup_days_on_commit(days_by_metric):
+    """Recount once the surrounding transaction commits, outside the writer's locks."""
+    if any(days_by_metric.values()):
+        transaction.on_commit(partial(refresh_rollup_days, days_by_metric))
+
+
+def reconcile_analytics_rollups():
+    """Recount every metric and rewrite the days that disagree; returns the number of days fixed."""
+    drifted_days = 0
+    for metric in ROLLUP_METRICS:
+        expected = _counted_rows(metric)
+        stored = _stored_rows(metric)
+        days = {key[0] for key in expected.keys() ^ stored.keys()}
+        days.update(key[0] for key, total in expected.items() if stored.get(key, total) != total)
+        if not days:
+            continue
+        _write_days(metric, days, expected, stored)
+        drifted_days += len(days)
+    if drifted_days:
+        invalidate_analytics_dashboard_cache()
+    return drifted_days
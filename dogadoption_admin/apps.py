@@ -5,4 +5,4 @@ class DogadoptionAdminConfig(AppConfig):
     name = 'dogadoption_admin'
 
     def ready(self):
-        import dogadoption_admin.signals
\ No newline at end of file
+        import dogadoption_admin.signals
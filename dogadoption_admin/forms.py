@@ -373,7 +373,11 @@ class ManagedStaffAccountForm(forms.Form):
             password_hash = make_password(raw_password)
             user.password = password_hash
         # Update without new password: keep existing user hash for profile row too.
-        user.save()
+        if user.pk:
+            # Naming the fields lets the search index notice a username change.
+            user.save(update_fields=["username", "is_staff", "is_active", "password"])
+        else:
+            user.save()
         if raw_password:
             profile_password = password_hash
         else:
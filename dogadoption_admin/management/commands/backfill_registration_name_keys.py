@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from dogadoption_admin.models import DogRegistration
+
+
+class Command(BaseCommand):
+    help = "Fill the normalized owner/pet name keys that registered dogs are matched on."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        updated = DogRegistration.backfill_name_keys(batch_size=max(options["batch_size"], 1))
+        if updated:
+            self.stdout.write(self.style.SUCCESS(f"Updated name keys for {updated} registration(s)."))
+            return
+
+        self.stdout.write("All registration name keys are up to date.")
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from dogadoption_admin.analytics_rollups import reconcile_analytics_rollups
+
+
+class Command(BaseCommand):
+    help = "Recount analytics dashboard rollup days that drifted from the source records."
+
+    def handle(self, *args, **options):
+        drifted_days = reconcile_analytics_rollups()
+        if drifted_days:
+            self.stdout.write(self.style.SUCCESS(f"Recounted {drifted_days} analytics rollup day(s)."))
+            return
+
+        self.stdout.write("All analytics rollups are up to date.")
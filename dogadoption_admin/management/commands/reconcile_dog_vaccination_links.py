@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from dogadoption_admin.vaccination_links import reconcile_dog_vaccination_links
+
+
+class Command(BaseCommand):
+    help = "Repair registered dog links to vaccination certificates that drifted from the records."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        drifted_ids = reconcile_dog_vaccination_links(batch_size=max(options["batch_size"], 1))
+        if drifted_ids:
+            self.stdout.write(
+                self.style.SUCCESS(f"Relinked vaccination records for {len(drifted_ids)} dog(s).")
+            )
+            return
+
+        self.stdout.write("All dog vaccination links are up to date.")
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from dogadoption_admin.models import PostRequestState
+
+
+class Command(BaseCommand):
+    help = "Repair post request summaries that drifted from the PostRequest rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        drifted_ids = PostRequestState.reconcile(batch_size=max(options["batch_size"], 1))
+        if drifted_ids:
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt request summaries for {len(drifted_ids)} post(s).")
+            )
+            return
+
+        self.stdout.write("All post request summaries are up to date.")
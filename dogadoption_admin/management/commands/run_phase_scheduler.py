@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from dogadoption_admin.phase_scheduler import (
+    PHASE_SCHEDULER_MAX_SLEEP_SECONDS,
+    hold_phase_scheduler_lease,
+    phase_scheduler_owner,
+    run_phase_scheduler,
+    sleep_until_next_run,
+)
+
+
+class Command(BaseCommand):
+    help = "Record rescue post phase transitions and refresh the caches they affect."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, sleeping until the next claim/adopt deadline between runs.",
+        )
+
+    def handle(self, *args, **options):
+        owner = phase_scheduler_owner()
+        while True:
+            if options["loop"] and not hold_phase_scheduler_lease(owner):
+                self.stdout.write("Another phase scheduler holds the lease; standing by.")
+                close_old_connections()
+                time.sleep(PHASE_SCHEDULER_MAX_SLEEP_SECONDS)
+                continue
+
+            transitions, next_deadline = run_phase_scheduler()
+            if transitions:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Recorded {len(transitions)} post phase transition(s).")
+                )
+            else:
+                self.stdout.write("No post phase transitions were due.")
+            if next_deadline is not None:
+                self.stdout.write(f"Next phase deadline: {next_deadline.isoformat()}")
+
+            if not options["loop"]:
+                return
+            close_old_connections()
+            sleep_until_next_run(next_deadline)
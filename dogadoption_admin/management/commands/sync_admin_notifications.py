@@ -9,11 +9,13 @@ class Command(BaseCommand):
     help = "Sync admin expiry notifications without waiting for a page request."
 
     def handle(self, *args, **options):
-        created_any = sync_expiry_notifications()
-        if created_any:
+        created_count = sync_expiry_notifications()
+        if created_count:
             cache.delete(ADMIN_NOTIFICATIONS_CACHE_KEY)
             self.stdout.write(
-                self.style.SUCCESS("Admin expiry notifications synced and cache refreshed.")
+                self.style.SUCCESS(
+                    f"Created {created_count} admin expiry notification(s) and refreshed the cache."
+                )
             )
             return
 
@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+ADOPTION_DAYS = 3
+MANUAL_PHASE_RESET_DAYS = 3
+
+
+def _phase_deadlines(post):
+    """Mirror Post.claim_deadline()/adoption_deadline()/phase_closes_at() for historical rows."""
+    claim_end = None
+    if post.created_at and post.claim_days is not None:
+        claim_end = post.created_at + timedelta(days=max(int(post.claim_days), 0))
+    adopt_end = claim_end + timedelta(days=ADOPTION_DAYS) if claim_end else None
+
+    is_closed = post.status in ["reunited", "adopted"]
+    override = (post.phase_override or "").strip()
+    started_at = post.phase_override_started_at
+    if is_closed or override not in {"claim", "adopt"}:
+        return claim_end, adopt_end, None if is_closed else adopt_end
+    if not started_at:
+        return claim_end, adopt_end, None
+
+    manual_days = timedelta(days=MANUAL_PHASE_RESET_DAYS)
+    if override == "claim":
+        claim_end = started_at + manual_days
+        adopt_end = claim_end + manual_days
+    else:
+        adopt_end = started_at + manual_days
+    return claim_end, adopt_end, adopt_end
+
+
+def backfill_phase_deadlines(apps, schema_editor):
+    Post = apps.get_model("dogadoption_admin", "Post")
+    batch = []
+    for post in Post.objects.only(
+        "id",
+        "status",
+        "created_at",
+        "claim_days",
+        "phase_override",
+        "phase_override_started_at",
+    ).iterator(chunk_size=500):
+        post.claim_ends_at, post.adopt_ends_at, post.phase_ends_at = _phase_deadlines(post)
+        batch.append(post)
+        if len(batch) >= 500:
+            Post.objects.bulk_update(batch, ["claim_ends_at", "adopt_ends_at", "phase_ends_at"])
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ["claim_ends_at", "adopt_ends_at", "phase_ends_at"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0052_image_optimizer_derivatives'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='claim_ends_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='adopt_ends_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='phase_ends_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_history', 'status', 'phase_ends_at'], name='post_hist_status_phase_end_idx'),
+        ),
+        migrations.RunPython(backfill_phase_deadlines, migrations.RunPython.noop),
+    ]
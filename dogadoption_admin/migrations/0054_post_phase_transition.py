@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0053_post_phase_deadline_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostPhaseTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_phase', models.CharField(choices=[('claim', 'Claim'), ('adopt', 'Adopt'), ('closed', 'Closed')], max_length=10)),
+                ('to_phase', models.CharField(choices=[('claim', 'Claim'), ('adopt', 'Adopt'), ('closed', 'Closed')], max_length=10)),
+                ('boundary_at', models.DateTimeField(help_text='Deadline the post crossed.')),
+                ('recorded_at', models.DateTimeField(auto_now_add=True)),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='phase_transitions', to='dogadoption_admin.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['boundary_at'], name='postphase_boundary_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'to_phase', 'boundary_at'), name='postphase_post_phase_boundary_uniq')],
+            },
+        ),
+    ]
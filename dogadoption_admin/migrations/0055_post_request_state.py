@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+
+def backfill_post_request_state(apps, schema_editor):
+    PostRequest = apps.get_model("dogadoption_admin", "PostRequest")
+    PostRequestState = apps.get_model("dogadoption_admin", "PostRequestState")
+
+    states = {}
+    pending_rows = (
+        PostRequest.objects.filter(status="pending", request_type__in=["claim", "adopt"])
+        .values("post_id", "request_type")
+        .annotate(count=Count("id"), started_at=Min("created_at"), latest_at=Max("created_at"))
+        .order_by()
+    )
+    for row in pending_rows:
+        state = states.setdefault(row["post_id"], PostRequestState(post_id=row["post_id"]))
+        setattr(state, f"pending_{row['request_type']}_count", row["count"])
+        setattr(state, f"pending_{row['request_type']}_started_at", row["started_at"])
+        setattr(state, f"pending_{row['request_type']}_latest_at", row["latest_at"])
+    PostRequestState.objects.bulk_create(states.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0054_post_phase_transition'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostRequestState',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='request_state', serialize=False, to='dogadoption_admin.post')),
+                ('pending_claim_count', models.PositiveIntegerField(default=0)),
+                ('pending_adopt_count', models.PositiveIntegerField(default=0)),
+                ('pending_claim_started_at', models.DateTimeField(blank=True, null=True)),
+                ('pending_claim_latest_at', models.DateTimeField(blank=True, null=True)),
+                ('pending_adopt_started_at', models.DateTimeField(blank=True, null=True)),
+                ('pending_adopt_latest_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_post_request_state, migrations.RunPython.noop),
+    ]
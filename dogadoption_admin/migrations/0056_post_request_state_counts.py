@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:53
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+
+def rebuild_post_request_state(apps, schema_editor):
+    PostRequest = apps.get_model("dogadoption_admin", "PostRequest")
+    PostRequestState = apps.get_model("dogadoption_admin", "PostRequestState")
+
+    states = {}
+    request_rows = (
+        PostRequest.objects.filter(
+            request_type__in=["claim", "adopt"],
+            status__in=["pending", "accepted", "rejected"],
+        )
+        .values("post_id", "request_type", "status")
+        .annotate(count=Count("id"), started_at=Min("created_at"), latest_at=Max("created_at"))
+        .order_by()
+    )
+    for row in request_rows:
+        request_type = row["request_type"]
+        state = states.setdefault(row["post_id"], PostRequestState(post_id=row["post_id"]))
+        if row["status"] == "pending":
+            setattr(state, f"pending_{request_type}_count", row["count"])
+            setattr(state, f"pending_{request_type}_started_at", row["started_at"])
+            setattr(state, f"pending_{request_type}_latest_at", row["latest_at"])
+        else:
+            setattr(state, f"{request_type}_{row['status']}_count", row["count"])
+    PostRequestState.objects.all().delete()
+    PostRequestState.objects.bulk_create(states.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0055_post_request_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postrequeststate',
+            name='adopt_accepted_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='postrequeststate',
+            name='adopt_rejected_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='postrequeststate',
+            name='claim_accepted_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='postrequeststate',
+            name='claim_rejected_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(rebuild_post_request_state, migrations.RunPython.noop),
+    ]
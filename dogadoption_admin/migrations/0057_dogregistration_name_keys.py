@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:27
+
+from django.db import migrations, models
+
+
+def _normalize_person_name(value):
+    return " ".join((value or "").split()).strip().casefold()
+
+
+def _backfill_name_keys(apps, schema_editor):
+    DogRegistration = apps.get_model("dogadoption_admin", "DogRegistration")
+    updates = []
+    for registration in DogRegistration.objects.only("id", "owner_name", "name_of_pet").iterator(chunk_size=500):
+        registration.owner_name_key = _normalize_person_name(registration.owner_name)
+        registration.pet_name_key = _normalize_person_name(registration.name_of_pet)
+        updates.append(registration)
+        if len(updates) >= 500:
+            DogRegistration.objects.bulk_update(updates, ["owner_name_key", "pet_name_key"])
+            updates = []
+
+    if updates:
+        DogRegistration.objects.bulk_update(updates, ["owner_name_key", "pet_name_key"])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0056_post_request_state_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dogregistration',
+            name='owner_name_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=120),
+        ),
+        migrations.AddField(
+            model_name='dogregistration',
+            name='pet_name_key',
+            field=models.CharField(blank=True, default='', editable=False, max_length=120),
+        ),
+        migrations.AddIndex(
+            model_name='dogregistration',
+            index=models.Index(fields=['owner_name_key', 'pet_name_key'], name='dogreg_owner_pet_key_idx'),
+        ),
+        migrations.RunPython(_backfill_name_keys, migrations.RunPython.noop),
+    ]
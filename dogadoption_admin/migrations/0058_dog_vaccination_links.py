@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _normalize_person_name(value):
+    return " ".join((value or "").split()).strip().casefold()
+
+
+def _link_dogs_to_registrations(apps, schema_editor):
+    Dog = apps.get_model("dogadoption_admin", "Dog")
+    DogRegistration = apps.get_model("dogadoption_admin", "DogRegistration")
+    VaccinationRecord = apps.get_model("dogadoption_admin", "VaccinationRecord")
+    Link = Dog.registrations.through
+
+    registration_ids_by_signature = {}
+    for registration_id, owner_key, pet_key in DogRegistration.objects.exclude(owner_name_key="").exclude(
+        pet_name_key=""
+    ).values_list("id", "owner_name_key", "pet_name_key").iterator(chunk_size=500):
+        registration_ids_by_signature.setdefault((owner_key, pet_key), []).append(registration_id)
+    latest_vaccination_by_registration = {}
+    for vaccination_id, registration_id, vaccination_date in (
+        VaccinationRecord.objects.exclude(registration_id__isnull=True)
+        .order_by("-date", "-id")
+        .values_list("id", "registration_id", "date")
+        .iterator(chunk_size=500)
+    ):
+        latest_vaccination_by_registration.setdefault(registration_id, (vaccination_date, vaccination_id))
+
+    links = []
+    updates = []
+    for dog in Dog.objects.only("id", "name", "owner_name", "owner_name_key").iterator(chunk_size=500):
+        signature = (
+            dog.owner_name_key or _normalize_person_name(dog.owner_name),
+            _normalize_person_name(dog.name),
+        )
+        registration_ids = registration_ids_by_signature.get(signature, []) if all(signature) else []
+        links.extend(Link(dog_id=dog.id, dogregistration_id=registration_id) for registration_id in registration_ids)
+        vaccinations = [
+            latest_vaccination_by_registration[registration_id]
+            for registration_id in registration_ids
+            if registration_id in latest_vaccination_by_registration
+        ]
+        if vaccinations:
+            dog.latest_vaccination_id = max(vaccinations)[1]
+            updates.append(dog)
+        if len(links) >= 500:
+            Link.objects.bulk_create(links, ignore_conflicts=True)
+            links = []
+        if len(updates) >= 500:
+            Dog.objects.bulk_update(updates, ["latest_vaccination"])
+            updates = []
+
+    if links:
+        Link.objects.bulk_create(links, ignore_conflicts=True)
+    if updates:
+        Dog.objects.bulk_update(updates, ["latest_vaccination"])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0057_dogregistration_name_keys'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dog',
+            name='latest_vaccination',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='dogadoption_admin.vaccinationrecord'),
+        ),
+        migrations.AddField(
+            model_name='dog',
+            name='registrations',
+            field=models.ManyToManyField(blank=True, related_name='registered_dogs', to='dogadoption_admin.dogregistration'),
+        ),
+        migrations.RunPython(_link_dogs_to_registrations, migrations.RunPython.noop),
+    ]
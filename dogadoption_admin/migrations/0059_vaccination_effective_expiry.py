@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:33
+
+from django.db import migrations, models
+from django.db.models.functions import Least
+
+
+def _fill_effective_expiry_dates(apps, schema_editor):
+    VaccinationRecord = apps.get_model("dogadoption_admin", "VaccinationRecord")
+    VaccinationRecord.objects.update(
+        effective_expiry_date=Least("vaccine_expiry_date", "vaccination_expiry_date")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0058_dog_vaccination_links'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vaccinationrecord',
+            name='effective_expiry_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationrecord',
+            index=models.Index(fields=['effective_expiry_date'], name='vacrec_effective_expiry_idx'),
+        ),
+        migrations.RunPython(_fill_effective_expiry_dates, migrations.RunPython.noop),
+    ]
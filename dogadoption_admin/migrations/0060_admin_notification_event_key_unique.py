@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:36
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def _dedupe_event_keys(apps, schema_editor):
+    AdminNotification = apps.get_model("dogadoption_admin", "AdminNotification")
+    AdminNotification.objects.filter(event_key="").update(event_key=None)
+    duplicated = (
+        AdminNotification.objects.exclude(event_key__isnull=True)
+        .values("event_key")
+        .annotate(rows=Count("id"), first_id=Min("id"))
+        .filter(rows__gt=1)
+    )
+    for row in duplicated:
+        AdminNotification.objects.filter(event_key=row["event_key"]).exclude(id=row["first_id"]).delete()
+
+
+def _restore_blank_event_keys(apps, schema_editor):
+    AdminNotification = apps.get_model("dogadoption_admin", "AdminNotification")
+    AdminNotification.objects.filter(event_key__isnull=True).update(event_key="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0059_vaccination_effective_expiry'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='adminnotification',
+            name='event_key',
+            field=models.CharField(blank=True, default=None, max_length=255, null=True, db_index=True),
+        ),
+        migrations.RunPython(_dedupe_event_keys, _restore_blank_event_keys),
+        migrations.AlterField(
+            model_name='adminnotification',
+            name='event_key',
+            field=models.CharField(blank=True, default=None, max_length=255, null=True, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='dewormingtreatmentrecord',
+            index=models.Index(fields=['medicine_expiry_date'], name='deworm_medicine_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationrecord',
+            index=models.Index(fields=['vaccination_expiry_date'], name='vacrec_card_expiry_idx'),
+        ),
+    ]
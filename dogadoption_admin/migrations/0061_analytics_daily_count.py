@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0060_admin_notification_event_key_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metric', models.CharField(max_length=30)),
+                ('day', models.DateField()),
+                ('place', models.CharField(blank=True, default='', max_length=255)),
+                ('kind', models.CharField(blank=True, default='', max_length=100)),
+                ('status', models.CharField(blank=True, default='', max_length=20)),
+                ('total', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('metric', 'day', 'place', 'kind', 'status'), name='analytics_daily_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dogadoption_admin', '0062_post_created_at_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminNotificationSyncCursor',
+            fields=[
+                ('name', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('last_synced_day', models.DateField()),
+            ],
+        ),
+    ]
@@ -1,10 +1,12 @@
 import os
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 from uuid import uuid4
 
+import numpy as np
 from django.contrib.auth.models import User
-from django.db import models
-from django.db.models import DateTimeField, Exists, OuterRef, Subquery
+from django.db import connection, models, transaction
+from django.db.models import BooleanField, Case, Count, F, Max, Min, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 class Post(models.Model):
@@ -120,6 +122,15 @@ class Post(models.Model):
         ("adopt", "Adoption"),
     ]
     MANUAL_PHASE_RESET_DAYS = 3
+    PHASE_DEADLINE_FIELDS = ("claim_ends_at", "adopt_ends_at", "phase_ends_at")
+    # Only saves touching these fields can move the stored phase deadlines.
+    PHASE_DEADLINE_SOURCE_FIELDS = frozenset({
+        "status",
+        "created_at",
+        "claim_days",
+        "phase_override",
+        "phase_override_started_at",
+    })
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     caption = models.TextField()
@@ -147,6 +158,11 @@ class Post(models.Model):
         default="",
     )
     phase_override_started_at = models.DateTimeField(blank=True, null=True)
+    # Denormalized from claim_deadline()/adoption_deadline()/phase_closes_at() on save,
+    # so live-post filters can run in SQL.
+    claim_ends_at = models.DateTimeField(blank=True, null=True, editable=False)
+    adopt_ends_at = models.DateTimeField(blank=True, null=True, editable=False)
+    phase_ends_at = models.DateTimeField(blank=True, null=True, editable=False)
     is_history = models.BooleanField(default=False)
     is_pinned = models.BooleanField(default=False)
     pinned_at = models.DateTimeField(blank=True, null=True)
@@ -163,39 +179,39 @@ class Post(models.Model):
         help_text="List of dog violations"
     )
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set before the insert (not auto_now_add) so the deadline columns go out in the same INSERT.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     @classmethod
     def with_pending_request_state(cls, queryset):
-        pending_claim_qs = PostRequest.objects.filter(
-            post_id=OuterRef("pk"),
-            request_type="claim",
-            status="pending",
-        )
-        pending_adopt_qs = PostRequest.objects.filter(
-            post_id=OuterRef("pk"),
-            request_type="adopt",
-            status="pending",
-        )
+        """Annotate pending claim/adopt state from the ``PostRequestState`` summary row."""
+        annotations = {}
+        for request_type in ("claim", "adopt"):
+            annotations[f"has_pending_{request_type}_request"] = Case(
+                When(**{f"request_state__pending_{request_type}_count__gt": 0}, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+            for bound in ("started_at", "latest_at"):
+                annotations[f"pending_{request_type}_{bound}"] = F(
+                    f"request_state__pending_{request_type}_{bound}"
+                )
+        return queryset.annotate(**annotations)
+
+    @classmethod
+    def with_request_counts(cls, queryset):
+        """Annotate ``claim_count``, ``adopt_count`` and ``total_request_count`` from the summary row."""
+        type_counts = {}
+        for request_type in PostRequestState.REQUEST_TYPES:
+            total = None
+            for status in PostRequestState.COUNTED_STATUSES:
+                field = F(f"request_state__{PostRequestState.count_field(request_type, status)}")
+                total = field if total is None else total + field
+            type_counts[request_type] = Coalesce(total, Value(0))
         return queryset.annotate(
-            has_pending_claim_request=Exists(pending_claim_qs),
-            has_pending_adopt_request=Exists(pending_adopt_qs),
-            pending_claim_started_at=Subquery(
-                pending_claim_qs.order_by("created_at").values("created_at")[:1],
-                output_field=DateTimeField(),
-            ),
-            pending_claim_latest_at=Subquery(
-                pending_claim_qs.order_by("-created_at").values("created_at")[:1],
-                output_field=DateTimeField(),
-            ),
-            pending_adopt_started_at=Subquery(
-                pending_adopt_qs.order_by("created_at").values("created_at")[:1],
-                output_field=DateTimeField(),
-            ),
-            pending_adopt_latest_at=Subquery(
-                pending_adopt_qs.order_by("-created_at").values("created_at")[:1],
-                output_field=DateTimeField(),
-            ),
+            claim_count=type_counts["claim"],
+            adopt_count=type_counts["adopt"],
+            total_request_count=type_counts["claim"] + type_counts["adopt"],
         )
 
     @staticmethod
@@ -635,6 +651,103 @@ class Post(models.Model):
             return "closed"
         return self.timeline_phase(now)
 
+    def phase_closes_at(self):
+        """
+        Moment the active claim/adopt window ends, or None when the post is closed for good.
+
+        ``current_phase(now)`` is claim/adopt exactly while ``now <= phase_closes_at()``.
+        """
+        if self.status in ["reunited", "adopted"]:
+            return None
+        if self.phase_override in {"claim", "adopt"}:
+            if not self.phase_override_started_at:
+                return None
+            return self._manual_phase_schedule()["adoption_deadline"]
+        return self._timeline_schedule()["adoption_deadline"]
+
+    @classmethod
+    def compute_phases(cls, posts, now=None):
+        """
+        Evaluate phase, deadlines and remaining time for many posts in one pass.
+
+        Returns one dict per post, in order, with ``phase``, ``claim_deadline``,
+        ``adoption_deadline`` and ``time_left``; each value matches what
+        ``current_phase(now)``, ``claim_deadline()``, ``adoption_deadline()`` and
+        ``time_left(now)`` return for that post.
+        """
+        posts = list(posts)
+        if not posts:
+            return []
+        now = now or timezone.now()
+
+        epoch = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+        def _micros(dt):
+            # NaT is stored as the minimum int64, so missing datetimes never compare as open.
+            return (dt - epoch) // timedelta(microseconds=1) if dt else np.iinfo(np.int64).min
+
+        day = np.timedelta64(1, "D")
+        now_us = np.datetime64(_micros(now), "us")
+        created = np.array([_micros(post.created_at) for post in posts], dtype="int64").view("M8[us]")
+        started = np.array(
+            [_micros(post.phase_override_started_at) for post in posts], dtype="int64"
+        ).view("M8[us]")
+        claim_days = np.array(
+            [-1 if post.claim_days is None else max(int(post.claim_days), 0) for post in posts],
+            dtype="int64",
+        )
+        override = np.array([(post.phase_override or "").strip() for post in posts])
+        is_closed_status = np.array([post.status in ["reunited", "adopted"] for post in posts])
+
+        timeline_claim_end = np.where(
+            claim_days >= 0, created + claim_days * day, np.datetime64("NaT", "us")
+        )
+        timeline_adopt_end = timeline_claim_end + cls.ADOPTION_DAYS * day
+        manual_days = cls.MANUAL_PHASE_RESET_DAYS * day
+        has_override = np.isin(override, ["claim", "adopt"])
+        manual_active = has_override & ~np.isnat(started) & ~is_closed_status
+        manual_claim = manual_active & (override == "claim")
+
+        claim_end = np.where(manual_claim, started + manual_days, timeline_claim_end)
+        adopt_end = np.where(
+            manual_active,
+            started + np.where(manual_claim, 2, 1) * manual_days,
+            timeline_adopt_end,
+        )
+
+        # A manual adopt override skips the claim window entirely.
+        in_claim = (now_us <= claim_end) & ~(manual_active & ~manual_claim)
+        in_adopt = ~in_claim & (now_us <= adopt_end)
+        open_mask = ~is_closed_status & ~(has_override & ~manual_active)
+        phase_codes = np.where(open_mask & in_claim, 1, np.where(open_mask & in_adopt, 2, 0))
+        remaining_us = np.where(
+            phase_codes == 1,
+            claim_end - now_us,
+            np.where(phase_codes == 2, adopt_end - now_us, np.timedelta64(0, "us")),
+        ).astype("int64")
+
+        def _aware(values):
+            return [
+                None if micros == np.iinfo(np.int64).min else epoch + timedelta(microseconds=micros)
+                for micros in values.astype("int64").tolist()
+            ]
+
+        phase_names = ("closed", "claim", "adopt")
+        return [
+            {
+                "phase": phase_names[code],
+                "claim_deadline": claim_deadline,
+                "adoption_deadline": adoption_deadline,
+                "time_left": timedelta(microseconds=max(int(micros), 0)),
+            }
+            for code, claim_deadline, adoption_deadline, micros in zip(
+                phase_codes.tolist(),
+                _aware(claim_end),
+                _aware(adopt_end),
+                remaining_us.tolist(),
+            )
+        ]
+
     def time_left(self, now=None):
         """Return remaining time in the active phase."""
         now = now or timezone.now()
@@ -694,14 +807,30 @@ class Post(models.Model):
             self.caption = breed_label
         elif self.caption is None:
             self.caption = ""
+
+        if self.created_at is None:
+            self.created_at = timezone.now()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.refresh_phase_deadlines()
+        elif self.PHASE_DEADLINE_SOURCE_FIELDS & set(update_fields):
+            self.refresh_phase_deadlines()
+            kwargs["update_fields"] = {*update_fields, *self.PHASE_DEADLINE_FIELDS}
         super().save(*args, **kwargs)
 
+    def refresh_phase_deadlines(self):
+        self.claim_ends_at = self.claim_deadline()
+        self.adopt_ends_at = self.adoption_deadline()
+        self.phase_ends_at = self.phase_closes_at()
+
     class Meta:
         indexes = [
             models.Index(fields=["created_at"], name="post_created_idx"),
             models.Index(fields=["status", "created_at"], name="post_status_created_idx"),
             models.Index(fields=["is_history", "status", "created_at"], name="post_hist_status_created_idx"),
             models.Index(fields=["is_pinned", "is_history", "created_at"], name="post_pin_hist_created_idx"),
+            models.Index(fields=["is_history", "status", "phase_ends_at"], name="post_hist_status_phase_end_idx"),
         ]
         db_table = 'dogadoption_admin_dogpost'
 
@@ -870,6 +999,168 @@ class PostRequest(models.Model):
         return f"{self.user.username} - {self.request_type} ({self.status})"
 
 
+class PostRequestState(models.Model):
+    """
+    Request summary of one post, kept in step with its ``PostRequest`` rows.
+
+    Holds per-type counts by status plus the pending window bounds. Only posts
+    with at least one request have a row, so listing queries read it through a
+    single primary-key LEFT JOIN. ``manage.py reconcile_post_request_state``
+    repairs rows that drifted through bulk ``update()`` calls.
+    """
+
+    REQUEST_TYPES = ("claim", "adopt")
+    COUNTED_STATUSES = ("pending", "accepted", "rejected")
+    SUMMARY_FIELDS = (
+        "pending_claim_count",
+        "pending_adopt_count",
+        "claim_accepted_count",
+        "claim_rejected_count",
+        "adopt_accepted_count",
+        "adopt_rejected_count",
+        "pending_claim_started_at",
+        "pending_claim_latest_at",
+        "pending_adopt_started_at",
+        "pending_adopt_latest_at",
+    )
+
+    post = models.OneToOneField(
+        'Post',
+        primary_key=True,
+        related_name='request_state',
+        on_delete=models.CASCADE
+    )
+    pending_claim_count = models.PositiveIntegerField(default=0)
+    pending_adopt_count = models.PositiveIntegerField(default=0)
+    claim_accepted_count = models.PositiveIntegerField(default=0)
+    claim_rejected_count = models.PositiveIntegerField(default=0)
+    adopt_accepted_count = models.PositiveIntegerField(default=0)
+    adopt_rejected_count = models.PositiveIntegerField(default=0)
+    pending_claim_started_at = models.DateTimeField(null=True, blank=True)
+    pending_claim_latest_at = models.DateTimeField(null=True, blank=True)
+    pending_adopt_started_at = models.DateTimeField(null=True, blank=True)
+    pending_adopt_latest_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def count_field(request_type, status):
+        if status == "pending":
+            return f"pending_{request_type}_count"
+        return f"{request_type}_{status}_count"
+
+    @classmethod
+    def summaries_for_posts(cls, post_ids):
+        """Build unsaved summary rows from the ``PostRequest`` rows of ``post_ids``."""
+        states = {}
+        request_rows = (
+            PostRequest.objects.filter(
+                post_id__in=post_ids,
+                request_type__in=cls.REQUEST_TYPES,
+                status__in=cls.COUNTED_STATUSES,
+            )
+            .values("post_id", "request_type", "status")
+            .annotate(count=Count("id"), started_at=Min("created_at"), latest_at=Max("created_at"))
+            .order_by()
+        )
+        for row in request_rows:
+            request_type = row["request_type"]
+            state = states.setdefault(row["post_id"], cls(post_id=row["post_id"]))
+            setattr(state, cls.count_field(request_type, row["status"]), row["count"])
+            if row["status"] == "pending":
+                setattr(state, f"pending_{request_type}_started_at", row["started_at"])
+                setattr(state, f"pending_{request_type}_latest_at", row["latest_at"])
+        return list(states.values())
+
+    @classmethod
+    def refresh_for_posts(cls, post_ids):
+        post_ids = {post_id for post_id in post_ids if post_id}
+        if not post_ids:
+            return
+        with transaction.atomic():
+            # Writers on the same posts queue behind these locks, so each recount
+            # starts after the previous one committed and never writes older counts.
+            list(
+                Post.objects.select_for_update()
+                .filter(id__in=post_ids)
+                .order_by("id")
+                .values_list("id", flat=True)
+            )
+            states = cls.summaries_for_posts(post_ids)
+            if states:
+                # MySQL upserts on any unique key and rejects an explicit conflict target.
+                cls.objects.bulk_create(
+                    states,
+                    update_conflicts=True,
+                    unique_fields=["post"] if connection.features.supports_update_conflicts_with_target else None,
+                    update_fields=[*cls.SUMMARY_FIELDS, "updated_at"],
+                )
+            cls.objects.filter(post_id__in=post_ids - {state.post_id for state in states}).delete()
+
+    @classmethod
+    def reconcile(cls, batch_size=500):
+        """Rebuild every summary row that disagrees with ``PostRequest``; returns the post ids fixed."""
+        post_ids = sorted(
+            set(cls.objects.values_list("post_id", flat=True))
+            | set(PostRequest.objects.values_list("post_id", flat=True).distinct())
+        )
+        drifted_ids = []
+        for offset in range(0, len(post_ids), batch_size):
+            batch = post_ids[offset:offset + batch_size]
+            expected = {
+                state.post_id: tuple(getattr(state, field) for field in cls.SUMMARY_FIELDS)
+                for state in cls.summaries_for_posts(batch)
+            }
+            stored = {
+                row[0]: tuple(row[1:])
+                for row in cls.objects.filter(post_id__in=batch).values_list(
+                    "post_id", *cls.SUMMARY_FIELDS
+                )
+            }
+            batch_drift = [
+                post_id for post_id in batch if expected.get(post_id) != stored.get(post_id)
+            ]
+            cls.refresh_for_posts(batch_drift)
+            drifted_ids.extend(batch_drift)
+        return drifted_ids
+
+    def __str__(self):
+        return f"Post {self.post_id} request summary"
+
+
+class PostPhaseTransition(models.Model):
+    """Log of a rescue post crossing a claim/adopt deadline, written by the phase scheduler."""
+
+    PHASE_CHOICES = [
+        ('claim', 'Claim'),
+        ('adopt', 'Adopt'),
+        ('closed', 'Closed'),
+    ]
+
+    post = models.ForeignKey(
+        'Post',
+        related_name='phase_transitions',
+        on_delete=models.CASCADE
+    )
+    from_phase = models.CharField(max_length=10, choices=PHASE_CHOICES)
+    to_phase = models.CharField(max_length=10, choices=PHASE_CHOICES)
+    boundary_at = models.DateTimeField(help_text="Deadline the post crossed.")
+    recorded_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "to_phase", "boundary_at"],
+                name="postphase_post_phase_boundary_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["boundary_at"], name="postphase_boundary_idx"),
+        ]
+
+    def __str__(self):
+        return f"Post {self.post_id}: {self.from_phase} -> {self.to_phase}"
+
+
 class GlobalAppointmentDate(models.Model):
     appointment_date = models.DateField(unique=True)
     is_active = models.BooleanField(default=True)
@@ -1081,7 +1372,8 @@ class AdminNotification(models.Model):
     title = models.CharField(max_length=160)
     message = models.TextField(blank=True)
     url = models.CharField(max_length=255, blank=True)
-    event_key = models.CharField(max_length=255, blank=True, default="", db_index=True)
+    # Set for notices raised by a recurring check so each event is stored once; NULL keeps ad-hoc notices apart.
+    event_key = models.CharField(max_length=255, null=True, blank=True, default=None, unique=True)
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -1096,6 +1388,15 @@ class AdminNotification(models.Model):
         return self.title
 
 
+class AdminNotificationSyncCursor(models.Model):
+    """Last day a recurring notice check covered, one row per check; outlives cache flushes."""
+    name = models.CharField(max_length=64, primary_key=True)
+    last_synced_day = models.DateField()
+
+    def __str__(self):
+        return f"{self.name} synced through {self.last_synced_day:%Y-%m-%d}"
+
+
 class Barangay(models.Model):
     name = models.CharField(max_length=100, unique=True)
     is_active = models.BooleanField(default=True)
@@ -1108,6 +1409,10 @@ class Barangay(models.Model):
         return self.name
 
 
+def _normalize_person_name(value):
+    return " ".join((value or "").split()).strip().casefold()
+
+
 # models.py
 class Dog(models.Model):
     date_registered = models.DateField()
@@ -1128,6 +1433,19 @@ class Dog(models.Model):
     )
     owner_address = models.TextField(blank=True)
     barangay = models.CharField(max_length=255, blank=True, null=True)
+    # Maintained by ``dogadoption_admin.vaccination_links``; see that module.
+    registrations = models.ManyToManyField(
+        "DogRegistration",
+        blank=True,
+        related_name="registered_dogs",
+    )
+    latest_vaccination = models.ForeignKey(
+        "VaccinationRecord",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
 
     class Meta:
         indexes = [
@@ -1215,16 +1533,61 @@ class DogRegistration(models.Model):
 
     date_registered = models.DateTimeField(auto_now_add=True)
 
+    # Normalized copies of owner_name / name_of_pet that registered dogs are matched on.
+    owner_name_key = models.CharField(max_length=120, blank=True, default="", editable=False)
+    pet_name_key = models.CharField(max_length=120, blank=True, default="", editable=False)
+
+    NAME_KEY_SOURCE_FIELDS = {"owner_name": "owner_name_key", "name_of_pet": "pet_name_key"}
+
     class Meta:
         indexes = [
             models.Index(fields=["date_registered"], name="dogreg_date_registered_idx"),
             models.Index(fields=["reg_no"], name="dogreg_reg_no_idx"),
             models.Index(fields=["status"], name="dogreg_status_idx"),
+            models.Index(fields=["owner_name_key", "pet_name_key"], name="dogreg_owner_pet_key_idx"),
         ]
         db_table= 'dogadoption_admin_vaccinationcertificate'
     def __str__(self):
         return f"{self.name_of_pet} - {self.reg_no}"
 
+    def refresh_name_keys(self):
+        for source_field, key_field in self.NAME_KEY_SOURCE_FIELDS.items():
+            setattr(self, key_field, _normalize_person_name(getattr(self, source_field)))
+
+    def save(self, *args, **kwargs):
+        self.refresh_name_keys()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields,
+                *(
+                    key_field
+                    for source_field, key_field in self.NAME_KEY_SOURCE_FIELDS.items()
+                    if source_field in update_fields
+                ),
+            }
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def backfill_name_keys(cls, batch_size=500):
+        """Rewrite keys left stale by ``update()``/``bulk_create`` writes; returns how many rows changed."""
+        stale = []
+        updated = 0
+        rows = cls.objects.only("id", *cls.NAME_KEY_SOURCE_FIELDS, *cls.NAME_KEY_SOURCE_FIELDS.values())
+        for registration in rows.order_by("pk").iterator(chunk_size=batch_size):
+            stored = [getattr(registration, key_field) for key_field in cls.NAME_KEY_SOURCE_FIELDS.values()]
+            registration.refresh_name_keys()
+            if stored != [getattr(registration, key_field) for key_field in cls.NAME_KEY_SOURCE_FIELDS.values()]:
+                stale.append(registration)
+            if len(stale) >= batch_size:
+                cls.objects.bulk_update(stale, list(cls.NAME_KEY_SOURCE_FIELDS.values()))
+                updated += len(stale)
+                stale = []
+        if stale:
+            cls.objects.bulk_update(stale, list(cls.NAME_KEY_SOURCE_FIELDS.values()))
+            updated += len(stale)
+        return updated
+
 
 #for deworming and vaccination records
 class Pet(models.Model):
@@ -1256,18 +1619,39 @@ class VaccinationRecord(models.Model):
     manufacturer_lot_no = models.CharField(max_length=255, blank=True, default="")
     vaccine_expiry_date = models.DateField()
     vaccination_expiry_date = models.DateField()
+    # The earlier of the two expiry dates: the day the dog stops being covered.
+    effective_expiry_date = models.DateField(null=True, blank=True, editable=False)
     veterinarian = models.CharField(max_length=255)
 
+    EXPIRY_SOURCE_FIELDS = ("vaccine_expiry_date", "vaccination_expiry_date")
+
     class Meta:
         db_table = 'dogadoption_admin_vaccinationrecord'
         indexes = [
             models.Index(fields=["date"], name="vacrec_vaccination_date_idx"),
             models.Index(fields=["registration_id"], name="vacrec_patient_id_idx"),
+            models.Index(fields=["effective_expiry_date"], name="vacrec_effective_expiry_idx"),
+            models.Index(fields=["vaccination_expiry_date"], name="vacrec_card_expiry_idx"),
         ]
 
     def __str__(self):
         return f"{self.registration.name_of_pet} - {self.vaccine_name}"
 
+    def refresh_effective_expiry_date(self):
+        # Views assign the raw POST strings, so parse them the way the fields will on save.
+        expiry_dates = [
+            self._meta.get_field(field).to_python(getattr(self, field))
+            for field in self.EXPIRY_SOURCE_FIELDS
+        ]
+        self.effective_expiry_date = min(filter(None, expiry_dates), default=None)
+
+    def save(self, *args, **kwargs):
+        self.refresh_effective_expiry_date()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and set(update_fields) & set(self.EXPIRY_SOURCE_FIELDS):
+            kwargs["update_fields"] = {*update_fields, "effective_expiry_date"}
+        super().save(*args, **kwargs)
+
 class DewormingTreatmentRecord(models.Model):
     registration = models.ForeignKey(
         DogRegistration,
@@ -1285,6 +1669,9 @@ class DewormingTreatmentRecord(models.Model):
 
     class Meta:
         db_table = 'dogadoption_admin_dewormingtreatmentrecord'
+        indexes = [
+            models.Index(fields=["medicine_expiry_date"], name="deworm_medicine_expiry_idx"),
+        ]
     def __str__(self):
         return f"{self.registration.name_of_pet} - {self.medicine_given}"
     
@@ -1508,3 +1895,32 @@ class DeceasedDog(models.Model):
             "caption_excerpt": excerpt,
             "post_created_at": post.created_at,
         }
+
+
+class AnalyticsDailyCount(models.Model):
+    """
+    Daily rollup of one analytics metric by place, kind and status.
+
+    Kept in step with the source tables by ``dogadoption_admin.analytics_rollups``
+    so the analytics dashboard sums a few rows per day instead of scanning
+    every record. Place and kind hold the raw location, barangay or breed text;
+    the dashboard normalizes them when it reads the rows.
+    """
+
+    metric = models.CharField(max_length=30)
+    day = models.DateField()
+    place = models.CharField(max_length=255, blank=True, default="")
+    kind = models.CharField(max_length=100, blank=True, default="")
+    status = models.CharField(max_length=20, blank=True, default="")
+    total = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["metric", "day", "place", "kind", "status"],
+                name="analytics_daily_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.metric} on {self.day}: {self.total}"
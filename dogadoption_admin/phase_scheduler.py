@@ -0,0 +1,293 @@
+"""Fire an event at the moment rescue posts move between claim, adopt and closed.
+
+Phases change with the clock, not with a save, so no model signal notices
+them. The scheduler reads the stored deadline columns on ``Post``, records
+every boundary crossed since its last run as a ``PostPhaseTransition`` and
+sends ``post_phase_changed`` for the new ones. Receivers (see
+``user.signals``) drop only the caches whose contents depend on the phase.
+
+Run it with ``manage.py run_phase_scheduler`` (``--loop`` keeps it sleeping
+until the next deadline), or set ``POST_PHASE_SCHEDULER_IN_PROCESS`` to run
+the same loop on a timer thread inside the web processes. Looping schedulers
+share a cache lease, so only one of them runs per deployment; a saved post
+that ends before the holder's next wake-up leaves a wake request in the cache,
+which the sleeping holder checks every ``PHASE_SCHEDULER_POLL_SECONDS``.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.db.models import F, Max, Min, Q
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .models import Post, PostPhaseTransition
+
+
+logger = logging.getLogger(__name__)
+
+# Sent with ``transitions``: the newly recorded ``PostPhaseTransition`` rows.
+post_phase_changed = Signal()
+
+PHASE_SCHEDULER_CURSOR_KEY = "post_phase_scheduler_cursor_v1"
+PHASE_SCHEDULER_LEASE_KEY = "post_phase_scheduler_lease_v1"
+PHASE_SCHEDULER_WAKE_KEY = "post_phase_scheduler_wake_v1"
+# How far back a run looks when neither the cursor nor a recorded transition is known.
+PHASE_SCHEDULER_LOOKBACK = timedelta(days=1)
+# Posts created while the scheduler sleeps are picked up at the next wake-up at the latest.
+PHASE_SCHEDULER_MAX_SLEEP_SECONDS = 60 * 15
+# Phases flip just after the deadline instant, so wake a little past it.
+PHASE_SCHEDULER_WAKE_MARGIN_SECONDS = 1
+# How often a sleeping scheduler looks for a wake request left by another process.
+PHASE_SCHEDULER_POLL_SECONDS = 60
+# The holder renews the lease on every run; a standby takes over once it lapses.
+PHASE_SCHEDULER_LEASE_SECONDS = PHASE_SCHEDULER_MAX_SLEEP_SECONDS + 60 * 5
+
+
+def _open_posts():
+    return Post.objects.filter(is_history=False).exclude(status__in=["reunited", "adopted"])
+
+
+def due_phase_transitions(since, until):
+    """Unsaved transitions for deadlines in ``[since, until)``, oldest first."""
+    transitions = [
+        PostPhaseTransition(
+            post_id=post_id,
+            from_phase="claim",
+            to_phase="adopt",
+            boundary_at=claim_ends_at,
+        )
+        for post_id, claim_ends_at in _open_posts()
+        .filter(
+            claim_ends_at__gte=since,
+            claim_ends_at__lt=until,
+            phase_ends_at__gt=F("claim_ends_at"),
+        )
+        .exclude(phase_override="adopt")
+        .values_list("id", "claim_ends_at")
+    ]
+    transitions.extend(
+        PostPhaseTransition(
+            post_id=post_id,
+            from_phase="adopt",
+            to_phase="closed",
+            boundary_at=phase_ends_at,
+        )
+        for post_id, phase_ends_at in _open_posts()
+        .filter(phase_ends_at__gte=since, phase_ends_at__lt=until)
+        .values_list("id", "phase_ends_at")
+    )
+    transitions.sort(key=lambda transition: (transition.boundary_at, transition.post_id))
+    return transitions
+
+
+def next_phase_deadline(now=None):
+    """Earliest claim or adopt deadline still ahead of ``now`` among open posts."""
+    now = now or timezone.now()
+    bounds = _open_posts().aggregate(
+        next_claim_end=Min("claim_ends_at", filter=Q(claim_ends_at__gte=now)),
+        next_phase_end=Min("phase_ends_at", filter=Q(phase_ends_at__gte=now)),
+    )
+    deadlines = [deadline for deadline in bounds.values() if deadline is not None]
+    return min(deadlines) if deadlines else None
+
+
+def _scheduler_cursor(now):
+    cursor = cache.get(PHASE_SCHEDULER_CURSOR_KEY)
+    if cursor is not None:
+        return cursor
+    # Without a cached cursor, resume from the last boundary this log has seen.
+    last_boundary = PostPhaseTransition.objects.aggregate(last=Max("boundary_at"))["last"]
+    return max(filter(None, (last_boundary, now - PHASE_SCHEDULER_LOOKBACK)))
+
+
+def run_phase_scheduler(now=None):
+    """
+    Record and announce every transition since the previous run.
+
+    Returns ``(new_transitions, next_deadline)``; re-running over the same
+    window records and announces nothing twice.
+    """
+    now = now or timezone.now()
+    cache.delete(PHASE_SCHEDULER_WAKE_KEY)
+    since = _scheduler_cursor(now)
+    transitions = due_phase_transitions(since, now)
+    if transitions:
+        recorded = set(
+            PostPhaseTransition.objects.filter(
+                boundary_at__gte=since,
+                boundary_at__lt=now,
+            ).values_list("post_id", "to_phase", "boundary_at")
+        )
+        transitions = [
+            transition
+            for transition in transitions
+            if (transition.post_id, transition.to_phase, transition.boundary_at) not in recorded
+        ]
+    if transitions:
+        PostPhaseTransition.objects.bulk_create(transitions, ignore_conflicts=True)
+        post_phase_changed.send(sender=Post, transitions=transitions)
+    cache.set(PHASE_SCHEDULER_CURSOR_KEY, now, None)
+    return transitions, next_phase_deadline(now)
+
+
+def seconds_until_next_run(next_deadline, now=None):
+    if next_deadline is None:
+        return PHASE_SCHEDULER_MAX_SLEEP_SECONDS
+    now = now or timezone.now()
+    delay = (next_deadline - now).total_seconds() + PHASE_SCHEDULER_WAKE_MARGIN_SECONDS
+    return min(max(delay, PHASE_SCHEDULER_WAKE_MARGIN_SECONDS), PHASE_SCHEDULER_MAX_SLEEP_SECONDS)
+
+
+def phase_scheduler_is_live(now=None):
+    """True while some scheduler has run within the last two maximum sleeps."""
+    cursor = cache.get(PHASE_SCHEDULER_CURSOR_KEY)
+    if cursor is None:
+        return False
+    now = now or timezone.now()
+    return cursor >= now - timedelta(seconds=PHASE_SCHEDULER_MAX_SLEEP_SECONDS * 2)
+
+
+def phase_scheduler_owner():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def hold_phase_scheduler_lease(owner):
+    """Take or renew the deployment-wide scheduler lease; False while another owner holds it."""
+    if cache.add(PHASE_SCHEDULER_LEASE_KEY, owner, PHASE_SCHEDULER_LEASE_SECONDS):
+        return True
+    if cache.get(PHASE_SCHEDULER_LEASE_KEY) != owner:
+        return False
+    cache.touch(PHASE_SCHEDULER_LEASE_KEY, PHASE_SCHEDULER_LEASE_SECONDS)
+    return True
+
+
+def request_phase_scheduler_wake(deadline, now=None):
+    """Ask whichever process holds the lease to run by ``deadline``.
+
+    Deadlines past the holder's longest sleep are found by its next run anyway.
+    """
+    now = now or timezone.now()
+    if deadline is None or deadline < now:
+        return
+    if deadline > now + timedelta(seconds=PHASE_SCHEDULER_MAX_SLEEP_SECONDS):
+        return
+    pending = cache.get(PHASE_SCHEDULER_WAKE_KEY)
+    if pending is None or deadline < pending:
+        cache.set(PHASE_SCHEDULER_WAKE_KEY, deadline, PHASE_SCHEDULER_MAX_SLEEP_SECONDS)
+    phase_scheduler_timer.wake_before(deadline)
+
+
+def _wake_at_with_requests(wake_at):
+    pending = cache.get(PHASE_SCHEDULER_WAKE_KEY)
+    if pending is None:
+        return wake_at
+    return min(wake_at, pending + timedelta(seconds=PHASE_SCHEDULER_WAKE_MARGIN_SECONDS))
+
+
+def sleep_until_next_run(next_deadline):
+    """Sleep until ``next_deadline``, waking early for a request left by another process."""
+    wake_at = timezone.now() + timedelta(seconds=seconds_until_next_run(next_deadline))
+    while True:
+        remaining = (wake_at - timezone.now()).total_seconds()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, PHASE_SCHEDULER_POLL_SECONDS))
+        wake_at = _wake_at_with_requests(wake_at)
+
+
+def start_in_process_phase_scheduler():
+    """Start the timer thread when ``POST_PHASE_SCHEDULER_IN_PROCESS`` is set.
+
+    Only the WSGI and ASGI entry points call this, so ``migrate`` and other
+    management commands never start a scheduler.
+    """
+    if getattr(settings, "POST_PHASE_SCHEDULER_IN_PROCESS", False):
+        phase_scheduler_timer.start()
+
+
+class PhaseSchedulerTimer:
+    """Daemon timer that sleeps until the next deadline, then runs the scheduler."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timer = None
+        self._wake_at = None
+        self._stopped = True
+        self._owner = None
+
+    @property
+    def running(self):
+        return not self._stopped
+
+    def start(self):
+        with self._lock:
+            if not self._stopped:
+                return
+            self._stopped = False
+            # Read after any fork, so every worker process gets its own owner.
+            self._owner = phase_scheduler_owner()
+        self._schedule(0)
+
+    def stop(self):
+        with self._lock:
+            self._stopped = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = None
+            self._wake_at = None
+
+    def wake_before(self, deadline):
+        """Pull the next run forward when a saved post ends sooner than planned."""
+        if deadline is None or self._stopped or deadline < timezone.now():
+            return
+        if self._wake_at is not None and deadline >= self._wake_at:
+            return
+        self._schedule(seconds_until_next_run(deadline))
+
+    def _schedule(self, delay):
+        with self._lock:
+            if self._stopped:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(min(delay, PHASE_SCHEDULER_POLL_SECONDS), self._tick)
+            self._timer.daemon = True
+            self._wake_at = timezone.now() + timedelta(seconds=delay)
+            self._timer.start()
+
+    def _tick(self):
+        wake_at = self._wake_at
+        try:
+            if wake_at is not None:
+                wake_at = _wake_at_with_requests(wake_at)
+        except Exception:
+            logger.exception("Post phase scheduler wake check failed")
+        remaining = (wake_at - timezone.now()).total_seconds() if wake_at is not None else 0
+        if remaining > 0:
+            self._schedule(remaining)
+            return
+        self._run()
+
+    def _run(self):
+        next_deadline = None
+        try:
+            if not hold_phase_scheduler_lease(self._owner):
+                # Stand by; the holder's runs keep the caches fresh.
+                self._schedule(PHASE_SCHEDULER_MAX_SLEEP_SECONDS)
+                return
+            _transitions, next_deadline = run_phase_scheduler()
+        except Exception:
+            logger.exception("Post phase scheduler run failed")
+        finally:
+            close_old_connections()
+        self._schedule(seconds_until_next_run(next_deadline))
+
+
+phase_scheduler_timer = PhaseSchedulerTimer()
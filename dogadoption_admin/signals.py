@@ -1,50 +1,89 @@
-from django.apps import apps as django_apps
 from django.conf import settings
-from django.db.models.signals import post_delete, post_migrate, post_save
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 
-from .cache_utils import invalidate_analytics_dashboard_cache
-from .models import DogRegistration, DogSurrenderRecord, VaccinationRecord
+from .analytics_rollups import (
+    ROLLUP_SOURCES,
+    refresh_rollup_days_on_commit,
+    rollup_days_for,
+    saved_rollup_days,
+)
+from .models import (
+    Dog,
+    DogRegistration,
+    DogSurrenderRecord,
+    Post,
+    PostRequest,
+    PostRequestState,
+    VaccinationRecord,
+)
+from .phase_scheduler import request_phase_scheduler_wake
+from .vaccination_links import (
+    DOG_LINK_SOURCE_FIELDS,
+    REGISTRATION_LINK_SOURCE_FIELDS,
+    dog_ids_for_registration,
+    dog_ids_for_vaccination,
+    refresh_dog_vaccination_links,
+)
 from .vaccination_list_print_service import invalidate_vaccination_certificate_export_cache
 from user.models import DogCaptureRequest
 
 User = get_user_model()
 
 
-def _invalidate_analytics_cache_on_model_change(**kwargs):
-    invalidate_analytics_dashboard_cache()
+def _touches_rollup_sources(instance, update_fields):
+    source_fields, _lookups = ROLLUP_SOURCES[type(instance)]
+    return not update_fields or bool(set(update_fields) & source_fields)
 
 
-def _connect_analytics_invalidation_signals():
-    sender_labels = (
-        "auth.User",
-        "dogadoption_admin.Post",
-        "dogadoption_admin.PostRequest",
-        "user.DogCaptureRequest",
-        "dogadoption_admin.DogRegistration",
-        "dogadoption_admin.VaccinationRecord",
-        "dogadoption_admin.Dog",
+# The days a record was counted on are read before it changes, so a record that
+# moves to another day, place or status is recounted on both sides.
+def remember_rollup_days_before_save(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or not _touches_rollup_sources(instance, update_fields):
+        return
+    instance._rollup_days = rollup_days_for(instance)
+
+
+def refresh_rollups_on_save(sender, instance, created=False, update_fields=None, **kwargs):
+    if not _touches_rollup_sources(instance, update_fields):
+        return
+    days_by_metric = instance.__dict__.pop("_rollup_days", {})
+    for metric, days in saved_rollup_days(instance, created).items():
+        days_by_metric.setdefault(metric, set()).update(days)
+    refresh_rollup_days_on_commit(days_by_metric)
+
+
+def remember_rollup_days_before_delete(sender, instance, **kwargs):
+    instance._rollup_days = rollup_days_for(instance)
+
+
+def refresh_rollups_on_delete(sender, instance, **kwargs):
+    refresh_rollup_days_on_commit(instance.__dict__.pop("_rollup_days", {}))
+
+
+for _sender in ROLLUP_SOURCES:
+    _label = _sender._meta.label_lower
+    pre_save.connect(
+        remember_rollup_days_before_save,
+        sender=_sender,
+        dispatch_uid=f"analytics_rollup_presave_{_label}",
+    )
+    post_save.connect(
+        refresh_rollups_on_save,
+        sender=_sender,
+        dispatch_uid=f"analytics_rollup_save_{_label}",
+    )
+    pre_delete.connect(
+        remember_rollup_days_before_delete,
+        sender=_sender,
+        dispatch_uid=f"analytics_rollup_predelete_{_label}",
+    )
+    post_delete.connect(
+        refresh_rollups_on_delete,
+        sender=_sender,
+        dispatch_uid=f"analytics_rollup_delete_{_label}",
     )
-    for sender_label in sender_labels:
-        sender = django_apps.get_model(sender_label)
-        if sender is None:
-            continue
-        post_save.connect(
-            _invalidate_analytics_cache_on_model_change,
-            sender=sender,
-            weak=False,
-            dispatch_uid=f"analytics_invalidate_save_{sender_label}",
-        )
-        post_delete.connect(
-            _invalidate_analytics_cache_on_model_change,
-            sender=sender,
-            weak=False,
-            dispatch_uid=f"analytics_invalidate_delete_{sender_label}",
-        )
-
-
-_connect_analytics_invalidation_signals()
 
 
 def _invalidate_vaccination_export_cache(**kwargs):
@@ -69,6 +108,73 @@ for _sender, _uid in (
     )
 
 
+# Saves limited to these fields cannot change a post's request summary.
+POST_REQUEST_STATE_SOURCE_FIELDS = frozenset({"post", "post_id", "request_type", "status", "created_at"})
+
+
+@receiver(post_save, sender=PostRequest, dispatch_uid="post_request_state_saved")
+def refresh_post_request_state_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not (set(update_fields) & POST_REQUEST_STATE_SOURCE_FIELDS):
+        return
+    PostRequestState.refresh_for_posts([instance.post_id])
+
+
+@receiver(post_delete, sender=PostRequest, dispatch_uid="post_request_state_deleted")
+def refresh_post_request_state_on_delete(sender, instance, origin=None, **kwargs):
+    # Deleting the post cascades to its summary row as well.
+    if isinstance(origin, Post):
+        return
+    PostRequestState.refresh_for_posts([instance.post_id])
+
+
+@receiver(post_save, sender=Dog, dispatch_uid="dog_vaccination_links_dog_saved")
+def refresh_vaccination_links_on_dog_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not (set(update_fields) & DOG_LINK_SOURCE_FIELDS):
+        return
+    refresh_dog_vaccination_links([instance.pk])
+
+
+@receiver(post_save, sender=DogRegistration, dispatch_uid="dog_vaccination_links_registration_saved")
+def refresh_vaccination_links_on_registration_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not (set(update_fields) & REGISTRATION_LINK_SOURCE_FIELDS):
+        return
+    refresh_dog_vaccination_links(dog_ids_for_registration(instance))
+
+
+@receiver(post_save, sender=VaccinationRecord, dispatch_uid="dog_vaccination_links_vaccination_saved")
+def refresh_vaccination_links_on_vaccination_save(sender, instance, **kwargs):
+    refresh_dog_vaccination_links(dog_ids_for_vaccination(instance))
+
+
+# Linked dogs are looked up before the rows go, then refreshed once they are gone.
+@receiver(pre_delete, sender=DogRegistration, dispatch_uid="dog_vaccination_links_registration_deleting")
+@receiver(pre_delete, sender=VaccinationRecord, dispatch_uid="dog_vaccination_links_vaccination_deleting")
+def remember_vaccination_linked_dogs(sender, instance, origin=None, **kwargs):
+    if sender is VaccinationRecord and isinstance(origin, DogRegistration):
+        return
+    if sender is DogRegistration:
+        instance._linked_dog_ids = dog_ids_for_registration(instance)
+    else:
+        instance._linked_dog_ids = dog_ids_for_vaccination(instance)
+
+
+@receiver(post_delete, sender=DogRegistration, dispatch_uid="dog_vaccination_links_registration_deleted")
+@receiver(post_delete, sender=VaccinationRecord, dispatch_uid="dog_vaccination_links_vaccination_deleted")
+def refresh_vaccination_links_on_delete(sender, instance, **kwargs):
+    dog_ids = getattr(instance, "_linked_dog_ids", None)
+    if dog_ids:
+        refresh_dog_vaccination_links(dog_ids)
+
+
+@receiver(post_save, sender=Post, dispatch_uid="phase_scheduler_wake_on_post_save")
+def wake_phase_scheduler_for_post(sender, instance, **kwargs):
+    if instance.is_history:
+        return
+    request_phase_scheduler_wake(
+        min(filter(None, (instance.claim_ends_at, instance.phase_ends_at)), default=None)
+    )
+
+
 @receiver(post_save, sender=DogCaptureRequest)
 def ensure_dog_surrender_admin_record(sender, instance, **kwargs):
     """Ensure a standalone surrender record row exists when a surrender is marked completed."""
@@ -0,0 +1,131 @@
+"""Maintained link from registered dogs to their vaccination certificates.
+
+A ``Dog`` belongs to every ``DogRegistration`` with the same normalized owner
+and pet name (``owner_name_key`` / ``pet_name_key``). That match is resolved
+when a dog, certificate or vaccination changes (receivers in
+``dogadoption_admin.signals``) and stored in ``Dog.registrations``, while
+``Dog.latest_vaccination`` points at the newest vaccination across them, so a
+status lookup is a single join.
+
+Writes that skip signals (``update()``, ``bulk_create``) can leave links stale;
+``manage.py reconcile_dog_vaccination_links`` repairs them.
+"""
+from django.db.models import Q
+
+from .models import Dog, DogRegistration, VaccinationRecord, _normalize_person_name
+
+
+# Saves limited to other fields cannot change which certificates a dog matches.
+DOG_LINK_SOURCE_FIELDS = frozenset({"name", "owner_name", "owner_name_key"})
+REGISTRATION_LINK_SOURCE_FIELDS = frozenset({"owner_name", "name_of_pet", "owner_name_key", "pet_name_key"})
+
+
+def _dog_signature(dog):
+    owner_key = dog.owner_name_key or _normalize_person_name(dog.owner_name)
+    pet_key = _normalize_person_name(dog.name)
+    return (owner_key, pet_key) if owner_key and pet_key else None
+
+
+def _expected_links(dogs):
+    """``{dog_id: (registration ids, latest vaccination id)}`` resolved from names and vaccination dates."""
+    signature_by_dog_id = {dog.id: _dog_signature(dog) for dog in dogs}
+    signatures = {signature for signature in signature_by_dog_id.values() if signature}
+    registration_ids_by_signature = {}
+    if signatures:
+        registrations = DogRegistration.objects.filter(
+            owner_name_key__in={owner_key for owner_key, _pet_key in signatures},
+            pet_name_key__in={pet_key for _owner_key, pet_key in signatures},
+        ).values_list("id", "owner_name_key", "pet_name_key")
+        for registration_id, owner_key, pet_key in registrations:
+            if (owner_key, pet_key) in signatures:
+                registration_ids_by_signature.setdefault((owner_key, pet_key), set()).add(registration_id)
+
+    signature_by_registration_id = {
+        registration_id: signature
+        for signature, registration_ids in registration_ids_by_signature.items()
+        for registration_id in registration_ids
+    }
+    latest_vaccination_by_signature = {}
+    if signature_by_registration_id:
+        vaccinations = (
+            VaccinationRecord.objects.filter(registration_id__in=list(signature_by_registration_id))
+            .order_by("-date", "-id")
+            .values_list("id", "registration_id")
+        )
+        for vaccination_id, registration_id in vaccinations:
+            latest_vaccination_by_signature.setdefault(signature_by_registration_id[registration_id], vaccination_id)
+
+    return {
+        dog_id: (
+            frozenset(registration_ids_by_signature.get(signature, ())),
+            latest_vaccination_by_signature.get(signature),
+        )
+        for dog_id, signature in signature_by_dog_id.items()
+    }
+
+
+def refresh_dog_vaccination_links(dog_ids):
+    """Rewrite the links of ``dog_ids`` that disagree with the certificates on file; returns the ids fixed."""
+    dogs = list(
+        Dog.objects.filter(pk__in=set(dog_ids)).only(
+            "id", "name", "owner_name", "owner_name_key", "latest_vaccination_id",
+        )
+    )
+    if not dogs:
+        return []
+
+    Link = Dog.registrations.through
+    stored_registration_ids = {dog.id: set() for dog in dogs}
+    for dog_id, registration_id in Link.objects.filter(dog_id__in=stored_registration_ids).values_list(
+        "dog_id", "dogregistration_id"
+    ):
+        stored_registration_ids[dog_id].add(registration_id)
+
+    expected = _expected_links(dogs)
+    stale_links = Q()
+    new_links = []
+    drifted_dogs = []
+    for dog in dogs:
+        registration_ids, latest_vaccination_id = expected[dog.id]
+        stored = stored_registration_ids[dog.id]
+        if stored - registration_ids:
+            stale_links |= Q(dog_id=dog.id, dogregistration_id__in=stored - registration_ids)
+        new_links.extend(
+            Link(dog_id=dog.id, dogregistration_id=registration_id)
+            for registration_id in registration_ids - stored
+        )
+        if stored != registration_ids or dog.latest_vaccination_id != latest_vaccination_id:
+            dog.latest_vaccination_id = latest_vaccination_id
+            drifted_dogs.append(dog)
+
+    if stale_links:
+        Link.objects.filter(stale_links).delete()
+    if new_links:
+        Link.objects.bulk_create(new_links, ignore_conflicts=True)
+    if drifted_dogs:
+        Dog.objects.bulk_update(drifted_dogs, ["latest_vaccination"])
+    return [dog.id for dog in drifted_dogs]
+
+
+def dog_ids_for_registration(registration):
+    """Dogs linked to ``registration`` now, plus dogs whose owner it names (they may link after a rename)."""
+    linked = Q(registrations=registration.pk)
+    if registration.owner_name_key:
+        linked |= Q(owner_name_key=registration.owner_name_key)
+    return list(Dog.objects.filter(linked).values_list("id", flat=True).distinct())
+
+
+def dog_ids_for_vaccination(vaccination):
+    linked = Q(latest_vaccination_id=vaccination.pk)
+    if vaccination.registration_id:
+        linked |= Q(registrations=vaccination.registration_id)
+    return list(Dog.objects.filter(linked).values_list("id", flat=True).distinct())
+
+
+def reconcile_dog_vaccination_links(batch_size=500):
+    """Check every dog's links in batches; returns the ids that had drifted."""
+    dog_ids = list(Dog.objects.order_by("pk").values_list("pk", flat=True))
+    drifted_ids = []
+    for offset in range(0, len(dog_ids), batch_size):
+        drifted_ids.extend(refresh_dog_vaccination_links(dog_ids[offset:offset + batch_size]))
+    return drifted_ids
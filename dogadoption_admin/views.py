@@ -46,8 +46,8 @@ from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.db import DatabaseError, transaction
-from django.db.models import Case, CharField, Count, DateField, F, IntegerField, Max, Min, OuterRef, Prefetch, Q, Subquery, Value, When
-from django.db.models.functions import Cast, Coalesce, Concat, Lower, Substr, Trim, TruncDate
+from django.db.models import Case, CharField, Count, DateField, F, IntegerField, Max, Min, OuterRef, Prefetch, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce, Concat, Lower, Substr, Trim
 from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
@@ -81,6 +81,7 @@ from .forms import (
     SectionForm,
 )
 from .admin_notification_utils import sync_expiry_notifications
+from .analytics_rollups import refresh_rollups_for
 from .barangays import BAYAWAN_BARANGAYS
 from .cache_utils import ANALYTICS_DASHBOARD_CACHE_KEY
 from .vaccination_list_print_service import (
@@ -95,6 +96,7 @@ from .context_processors import (
 )
 from .models import (
     AdminNotification,
+    AnalyticsDailyCount,
     Barangay,
     CertificateSettings,
     Citation,
@@ -111,6 +113,7 @@ from .models import (
     Post,
     PostImage,
     PostRequest,
+    PostRequestState,
     VetAdminProfile,
     UserViolationNotification,
     UserViolationSummary,
@@ -1640,26 +1643,6 @@ def _touch_post_board_cache():
     invalidate_user_notification_content()
 
 
-def _annotate_post_request_count(qs, annotation_name, request_type=None):
-    request_qs = PostRequest.objects.filter(post_id=OuterRef("pk"))
-    if request_type:
-        request_qs = request_qs.filter(request_type=request_type)
-    request_count_subquery = (
-        request_qs.order_by()
-        .values("post_id")
-        .annotate(total=Count("id"))
-        .values("total")[:1]
-    )
-    return qs.annotate(
-        **{
-            annotation_name: Coalesce(
-                Subquery(request_count_subquery, output_field=IntegerField()),
-                Value(0),
-            )
-        }
-    )
-
-
 def _build_post_form_page_context(post_form, *, post=None, form_action="", form_mode="create", back_url=""):
     _set_post_form_barangay_source(post_form)
     existing_images = []
@@ -2237,12 +2220,14 @@ def finalize_post(request, post_id):
             ]
         )
 
-        pending_requests = list(post.requests.filter(status="pending").only("id", "user_id"))
+        pending_requests = list(post.requests.filter(status="pending").only("id", "user_id", "created_at"))
         if pending_requests:
             post.requests.filter(id__in=[req.id for req in pending_requests]).update(
                 status="rejected",
                 scheduled_appointment_date=None,
             )
+            PostRequestState.refresh_for_posts([post.id])
+            refresh_rollups_for("post_request", pending_requests)
             for pending_req in pending_requests:
                 invalidate_user_notification_payload(pending_req.user_id)
 
@@ -2388,9 +2373,7 @@ def post_list(request):
             'view_count',
         )
     )
-    base_qs = _annotate_post_request_count(base_qs, "claim_count", "claim")
-    base_qs = _annotate_post_request_count(base_qs, "adopt_count", "adopt")
-    base_qs = _annotate_post_request_count(base_qs, "total_request_count")
+    base_qs = Post.with_request_counts(base_qs)
 
     def _build_page_qs(page_param, page_num):
         params = request.GET.copy()
@@ -2795,12 +2778,14 @@ def record_history_status(request, post_id):
             ]
         )
 
-        pending_requests = list(post.requests.filter(status="pending").only("id", "user_id"))
+        pending_requests = list(post.requests.filter(status="pending").only("id", "user_id", "created_at"))
         if pending_requests:
             post.requests.filter(id__in=[req.id for req in pending_requests]).update(
                 status="rejected",
                 scheduled_appointment_date=None,
             )
+            PostRequestState.refresh_for_posts([post.id])
+            refresh_rollups_for("post_request", pending_requests)
             for pending_req in pending_requests:
                 invalidate_user_notification_payload(pending_req.user_id)
 
@@ -2915,10 +2900,15 @@ def update_request(request, req_id, action):
             post.phase_override_started_at = None
             post.save(update_fields=['status', 'phase_override', 'phase_override_started_at'])
 
-            post.requests.filter(status='pending').exclude(id=req.id).update(
-                status='rejected',
-                scheduled_appointment_date=None,
+            competing_requests = list(
+                post.requests.filter(status='pending').exclude(id=req.id).only("id", "created_at")
             )
+            if competing_requests:
+                post.requests.filter(id__in=[other.id for other in competing_requests]).update(
+                    status='rejected',
+                    scheduled_appointment_date=None,
+                )
+                refresh_rollups_for("post_request", competing_requests)
         else:
             req.status = 'rejected'
             req.scheduled_appointment_date = None
@@ -2960,17 +2950,20 @@ def admin_dog_capture_requests(request):
                 for value in request.POST.getlist('selected_request_ids')
                 if str(value).isdigit()
             ]
-            scheduled_qs = DogCaptureRequest.objects.filter(
-                id__in=selected_ids,
-                status='accepted',
+            scheduled_requests = list(
+                DogCaptureRequest.objects.filter(
+                    id__in=selected_ids,
+                    status='accepted',
+                ).only('id', 'created_at')
             )
-            updated_count = scheduled_qs.count()
+            updated_count = len(scheduled_requests)
             if updated_count:
-                scheduled_qs.update(
+                DogCaptureRequest.objects.filter(id__in=[req.id for req in scheduled_requests]).update(
                     status='captured',
                     assigned_admin=request.user,
                     captured_at=timezone.now(),
                 )
+                refresh_rollups_for("capture_request", scheduled_requests)
                 messages.success(request, f"{updated_count} scheduled request(s) marked as done.")
             else:
                 messages.warning(request, "Select at least one scheduled request to mark as done.")
@@ -3970,7 +3963,7 @@ def admin_edit_profile(request):
                 user.username = username
                 if password:
                     user.set_password(password)
-                user.save()
+                user.save(update_fields=["username", "password"] if password else ["username"])
                 if password:
                     update_session_auth_hash(request, user)
                 messages.success(request, "Admin profile updated successfully.")
@@ -4153,6 +4146,22 @@ def citation_print_lookup(request):
 # =============================================================================
 
 
+def _rollup_rows(metric, *fields):
+    """Totals of one ``AnalyticsDailyCount`` metric summed over ``fields``."""
+    return (
+        AnalyticsDailyCount.objects.filter(metric=metric)
+        .values(*fields)
+        .annotate(total=Sum("total"))
+        .order_by(*fields)
+    )
+
+
+def _rollup_total(metric, **filters):
+    return AnalyticsDailyCount.objects.filter(metric=metric, **filters).aggregate(
+        total=Coalesce(Sum("total"), 0)
+    )["total"]
+
+
 def _build_choice_count_chart(rows, choices):
     totals = {row["status"]: row["total"] for row in rows}
     return {
@@ -4163,8 +4172,8 @@ def _build_choice_count_chart(rows, choices):
 
 def _build_request_status_chart():
     request_matrix = {}
-    for row in PostRequest.objects.values("request_type", "status").annotate(total=Count("id")):
-        request_matrix.setdefault(row["request_type"], {})[row["status"]] = row["total"]
+    for row in _rollup_rows("post_request", "kind", "status"):
+        request_matrix.setdefault(row["kind"], {})[row["status"]] = row["total"]
 
     request_status_display = {
         "pending": "Pending",
@@ -4187,22 +4196,10 @@ def _build_request_status_chart():
 def _build_adoption_claim_trend_chart():
     rows = []
     years = set()
-    trend_rows = (
-        PostRequest.objects.filter(
-            status="accepted",
-            request_type__in=["claim", "adopt"],
-            post__status__in=["reunited", "adopted"],
-        )
-        .annotate(activity_date=Coalesce("scheduled_appointment_date", TruncDate("created_at")))
-        .exclude(activity_date__isnull=True)
-        .values("request_type", "activity_date")
-        .annotate(total=Count("id"))
-        .order_by("activity_date", "request_type")
-    )
-    for row in trend_rows:
-        activity_date = row["activity_date"]
+    for row in _rollup_rows("adoption_outcome", "day", "kind"):
+        activity_date = row["day"]
         rows.append({
-            "status": "claimed" if row["request_type"] == "claim" else "adopted",
+            "status": "claimed" if row["kind"] == "claim" else "adopted",
             "date": activity_date.isoformat(),
             "total": row["total"],
         })
@@ -4218,19 +4215,11 @@ def _build_vaccination_breed_chart():
     vaccination_breed_counts = defaultdict(int)
     vaccination_breed_labels = {}
     vaccination_breed_years = set()
-    vaccination_breed_trends = (
-        VaccinationRecord.objects.exclude(registration__isnull=True)
-        .exclude(registration__breed__isnull=True)
-        .exclude(registration__breed__exact="")
-        .values("date", "registration__breed")
-        .annotate(total=Count("registration_id", distinct=True))
-        .order_by("date", "registration__breed")
-    )
-    for row in vaccination_breed_trends:
-        vaccination_date = row["date"]
-        breed_raw = row["registration__breed"]
+    for row in _rollup_rows("vaccination", "day", "kind").exclude(kind=""):
+        vaccination_date = row["day"]
+        breed_raw = row["kind"]
         breed_key = _normalize_breed_key(breed_raw)
-        if not vaccination_date or not breed_key or _exclude_breed_from_chart(breed_raw):
+        if not breed_key or _exclude_breed_from_chart(breed_raw):
             continue
 
         breed_type = _classify_breed_type(breed_raw)
@@ -4260,31 +4249,25 @@ def _build_vaccination_breed_chart():
 def _build_rescue_barangay_trend_chart():
     events = []
     years = set()
-    rescue_rows = (
-        Post.objects.exclude(location__isnull=True)
-        .exclude(location__exact="")
-        .annotate(activity_date=Coalesce("rescued_date", TruncDate("created_at")))
-        .exclude(activity_date__isnull=True)
-        .values("location", "activity_date")
-        .order_by("activity_date", "location")
-    )
-    for row in rescue_rows:
-        location = _clean_barangay(row["location"])
-        if not location:
-            continue
-
-        activity_date = row["activity_date"]
-        if not activity_date:
+    barangay_names = {}
+    for row in _rollup_rows("post", "day", "place").exclude(place=""):
+        location = row["place"]
+        if location not in barangay_names:
+            cleaned = _clean_barangay(location)
+            barangay_names[location] = cleaned and (
+                _extract_barangay_from_address(cleaned)
+                or _resolve_barangay_name(cleaned)
+                or cleaned
+            )
+        barangay_name = barangay_names[location]
+        if not barangay_name:
             continue
 
-        barangay_name = (
-            _extract_barangay_from_address(location)
-            or _resolve_barangay_name(location)
-            or location
-        )
+        activity_date = row["day"]
         events.append({
             "barangay": barangay_name,
             "date": activity_date.isoformat(),
+            "total": row["total"],
         })
         years.add(activity_date.year)
 
@@ -4335,20 +4318,15 @@ def _build_vaccination_barangay_chart(today):
 def _build_registered_barangay_chart():
     events = []
     years = set()
-    for row in (
-        Dog.objects.exclude(barangay__isnull=True)
-        .exclude(barangay__exact="")
-        .exclude(date_registered__isnull=True)
-        .values("barangay", "date_registered")
-        .order_by("date_registered", "barangay")
-    ):
-        registration_date = row["date_registered"]
-        barangay_name = (row["barangay"] or "").strip()
-        if not registration_date or not barangay_name:
+    for row in _rollup_rows("dog", "day", "place").exclude(place=""):
+        registration_date = row["day"]
+        barangay_name = row["place"].strip()
+        if not barangay_name:
             continue
         events.append({
             "barangay": barangay_name,
             "date": registration_date.isoformat(),
+            "total": row["total"],
         })
         years.add(registration_date.year)
 
@@ -4363,35 +4341,31 @@ def _build_analytics_dashboard_context():
     vaccinated_registration_ids = VaccinationRecord.objects.exclude(registration__isnull=True)
     return {
         "registered_owners": (
-            DogRegistration.objects.exclude(owner_name__isnull=True)
-            .exclude(owner_name__exact="")
-            .annotate(owner_name_normalized=Lower(Trim("owner_name")))
-            .values("owner_name_normalized")
+            DogRegistration.objects.exclude(owner_name_key="")
+            .values("owner_name_key")
             .distinct()
             .count()
         ),
-        "adopted_dogs": Post.objects.filter(status="adopted").count(),
-        "claimed_dogs": Post.objects.filter(status="reunited").count(),
+        "adopted_dogs": _rollup_total("post", status="adopted"),
+        "claimed_dogs": _rollup_total("post", status="reunited"),
         "vaccinated_dogs": vaccinated_registration_ids.values("registration_id").distinct().count(),
         "expired_vaccinations": (
-            vaccinated_registration_ids.filter(
-                Q(vaccine_expiry_date__lt=today) | Q(vaccination_expiry_date__lt=today)
-            )
+            vaccinated_registration_ids.filter(effective_expiry_date__lt=today)
             .values("registration_id")
             .distinct()
             .count()
         ),
         "total_users": User.objects.filter(is_staff=False).count(),
-        "total_posts": Post.objects.count(),
-        "total_capture_requests": DogCaptureRequest.objects.count(),
-        "total_registrations": DogRegistration.objects.count(),
+        "total_posts": _rollup_total("post"),
+        "total_capture_requests": _rollup_total("capture_request"),
+        "total_registrations": _rollup_total("registration"),
         "post_status_chart": _build_choice_count_chart(
-            Post.objects.values("status").annotate(total=Count("id")),
+            _rollup_rows("post", "status"),
             Post.STATUS_CHOICES,
         ),
         "request_status_chart": _build_request_status_chart(),
         "capture_status_chart": _build_choice_count_chart(
-            DogCaptureRequest.objects.values("status").annotate(total=Count("id")),
+            _rollup_rows("capture_request", "status"),
             DogCaptureRequest.STATUS_CHOICES,
         ),
         "vaccination_breed_chart": _build_vaccination_breed_chart(),
@@ -4399,6 +4373,9 @@ def _build_analytics_dashboard_context():
         "rescue_barangay_trend_chart": _build_rescue_barangay_trend_chart(),
         "vaccination_barangay_chart": _build_vaccination_barangay_chart(today),
         "barangay_chart": _build_registered_barangay_chart(),
+        # An empty table means ``manage.py reconcile_analytics_rollups`` has not backfilled yet;
+        # the page shows zeros and a notice rather than recounting everything on a GET.
+        "analytics_rollups_pending": not AnalyticsDailyCount.objects.exists(),
     }
 
 
@@ -4655,7 +4632,7 @@ def _build_registration_record_queryset(selected_barangay, date_filter_type, fil
     )
     dogs = (
         dogs.annotate(owner_first_seen_id=Subquery(owner_first_seen_id_subquery))
-        .select_related("owner_user", "owner_user__profile")
+        .select_related("owner_user", "owner_user__profile", "latest_vaccination")
         .only(
             "id",
             "date_registered",
@@ -4671,6 +4648,10 @@ def _build_registration_record_queryset(selected_barangay, date_filter_type, fil
             "barangay",
             "owner_user_id",
             "owner_user__profile__profile_image",
+            "latest_vaccination__date",
+            "latest_vaccination__vaccine_expiry_date",
+            "latest_vaccination__vaccination_expiry_date",
+            "latest_vaccination__effective_expiry_date",
         )
         .order_by("owner_first_seen_date", "owner_first_seen_id", "date_registered", "id")
     )
@@ -4749,77 +4730,13 @@ def _attach_registration_owner_metadata(dogs):
 
 def _attach_registration_vaccination_metadata(dogs):
     today = timezone.localdate()
-    candidate_owner_keys = set()
-    candidate_pet_keys = set()
-    dog_signature_by_id = {}
-
     for dog in dogs:
-        owner_key = _normalize_person_name(
-            getattr(dog, "owner_name_key", "") or getattr(dog, "owner_name", "")
-        )
-        pet_key = _normalize_person_name(getattr(dog, "name", ""))
-        signature = (owner_key, pet_key)
-        dog_signature_by_id[dog.id] = signature
         dog.has_vaccination_record = False
         dog.vaccination_expired = False
         dog.latest_vaccination_date = None
         dog.latest_vaccination_expiry_date = None
 
-        if owner_key and pet_key:
-            candidate_owner_keys.add(owner_key)
-            candidate_pet_keys.add(pet_key)
-
-    if not candidate_owner_keys or not candidate_pet_keys:
-        return dogs
-
-    matching_registrations = (
-        DogRegistration.objects.annotate(
-            owner_name_normalized=Lower(Trim("owner_name")),
-            pet_name_normalized=Lower(Trim("name_of_pet")),
-        )
-        .filter(
-            owner_name_normalized__in=candidate_owner_keys,
-            pet_name_normalized__in=candidate_pet_keys,
-        )
-        .only("id", "date_registered")
-    )
-
-    registration_signature_by_id = {}
-    registration_ids = []
-    for registration in matching_registrations:
-        signature = (
-            getattr(registration, "owner_name_normalized", ""),
-            getattr(registration, "pet_name_normalized", ""),
-        )
-        if not signature[0] or not signature[1]:
-            continue
-        registration_signature_by_id[registration.id] = signature
-        registration_ids.append(registration.id)
-
-    if not registration_ids:
-        return dogs
-
-    latest_vaccination_by_signature = {}
-    vaccinations = (
-        VaccinationRecord.objects.filter(registration_id__in=registration_ids)
-        .only(
-            "id",
-            "registration_id",
-            "date",
-            "vaccine_expiry_date",
-            "vaccination_expiry_date",
-        )
-        .order_by("-date", "-id")
-    )
-
-    for vaccination in vaccinations:
-        signature = registration_signature_by_id.get(vaccination.registration_id)
-        if signature and signature not in latest_vaccination_by_signature:
-            latest_vaccination_by_signature[signature] = vaccination
-
-    for dog in dogs:
-        signature = dog_signature_by_id.get(dog.id)
-        vaccination = latest_vaccination_by_signature.get(signature)
+        vaccination = dog.latest_vaccination
         if not vaccination:
             continue
 
@@ -4829,11 +4746,7 @@ def _attach_registration_vaccination_metadata(dogs):
             vaccination.vaccination_expiry_date or vaccination.vaccine_expiry_date
         )
         dog.vaccination_expired = bool(
-            (vaccination.vaccine_expiry_date and vaccination.vaccine_expiry_date < today)
-            or (
-                vaccination.vaccination_expiry_date
-                and vaccination.vaccination_expiry_date < today
-            )
+            vaccination.effective_expiry_date and vaccination.effective_expiry_date < today
         )
 
     return dogs
@@ -5703,10 +5616,7 @@ def certificate_list(request):
             'vaccine_name': record.vaccine_name,
             'vaccine_expiry_date': record.vaccine_expiry_date,
             'dog_vaccination_expiry_date': record.vaccination_expiry_date,
-            'is_expired': (
-                record.vaccine_expiry_date < today or
-                record.vaccination_expiry_date < today
-            ),
+            'is_expired': record.effective_expiry_date < today,
         })
 
     _attach_certificate_owner_metadata(combined_rows)
@@ -5725,10 +5635,7 @@ def certificate_list(request):
 
     expired_vaccinations = (
         VaccinationRecord.objects.select_related('registration')
-        .filter(
-            Q(vaccine_expiry_date__lt=today) |
-            Q(vaccination_expiry_date__lt=today)
-        )
+        .filter(effective_expiry_date__lt=today)
         .order_by('vaccine_expiry_date', 'vaccination_expiry_date')
     )
 
@@ -2,6 +2,8 @@
 ASGI config for pet_adoption project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serving the project through it lets ``user:notification_stream`` hold its
+Server-Sent Events connections on the event loop instead of a worker thread.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -14,3 +16,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pet_adoption.settings')
 
 application = get_asgi_application()
+
+# Imported after setup so the app registry is ready.
+from dogadoption_admin.phase_scheduler import start_in_process_phase_scheduler  # noqa: E402
+
+start_in_process_phase_scheduler()
@@ -354,6 +354,15 @@ HEALTH_METRICS_CACHE_SECONDS = int(
     os.getenv("HEALTH_METRICS_CACHE_SECONDS", "0" if DEBUG else "1")
 )
 
+# Run the rescue post phase scheduler on a timer thread inside the web processes
+# (one holds a cache lease and runs it). Leave off when
+# `manage.py run_phase_scheduler --loop` runs as its own worker.
+POST_PHASE_SCHEDULER_IN_PROCESS = env_bool("POST_PHASE_SCHEDULER_IN_PROCESS", False)
+
+# Copy queued announcement/listing broadcasts into member inboxes right after the save
+# commits. Leave off in production and run `manage.py fan_out_user_notifications --loop`.
+USER_NOTIFICATION_FANOUT_INLINE = env_bool("USER_NOTIFICATION_FANOUT_INLINE", DEBUG)
+
 # Optional automatic admin bootstrapping for non-production setup only.
 CREATE_DEFAULT_ADMIN = env_bool("CREATE_DEFAULT_ADMIN", False)
 DEFAULT_ADMIN_USERNAME = os.getenv("DEFAULT_ADMIN_USERNAME", "")
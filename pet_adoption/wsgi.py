@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pet_adoption.settings')
 
 application = get_wsgi_application()
+
+# Imported after setup so the app registry is ready.
+from dogadoption_admin.phase_scheduler import start_in_process_phase_scheduler  # noqa: E402
+
+start_in_process_phase_scheduler()
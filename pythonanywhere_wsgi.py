@@ -15,6 +15,6 @@ if str(PROJECT_ROOT) not in sys.path:
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pet_adoption.settings")
 
-from django.core.wsgi import get_wsgi_application
-
-application = get_wsgi_application()
+# Shares the project WSGI module, which also starts the in-process phase
+# scheduler when POST_PHASE_SCHEDULER_IN_PROCESS is set.
+from pet_adoption.wsgi import application  # noqa: E402,F401
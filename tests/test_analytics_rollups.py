@@ -0,0 +1,136 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from dogadoption_admin.analytics_rollups import reconcile_analytics_rollups, refresh_rollup_days, refresh_rollups_for
+from dogadoption_admin.models import AnalyticsDailyCount, Dog, DogRegistration, Post, PostRequest, VaccinationRecord
+from dogadoption_admin.views import _build_analytics_dashboard_context
+
+
+class AnalyticsRollupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff_user = User.objects.create_user(username="rollupstaff", password="secret123", is_staff=True)
+        self.member = User.objects.create_user(username="rollupmember", password="secret123")
+        self.today = timezone.localdate()
+
+    def _rows(self, metric):
+        return set(
+            AnalyticsDailyCount.objects.filter(metric=metric).values_list("day", "place", "kind", "status", "total")
+        )
+
+    def test_rollups_follow_saves_moves_and_deletes(self):
+        last_week = self.today - timedelta(days=7)
+        with self.captureOnCommitCallbacks(execute=True):
+            first = Post.objects.create(user=self.staff_user, caption="Bantay", location="Poblacion")
+            Post.objects.create(user=self.staff_user, caption="Brownie", location="Poblacion")
+        self.assertEqual(self._rows("post"), {(self.today, "Poblacion", "", "rescued", 2)})
+
+        first.rescued_date = last_week
+        with self.captureOnCommitCallbacks(execute=True):
+            first.save(update_fields=["rescued_date"])
+        self.assertEqual(
+            self._rows("post"),
+            {(self.today, "Poblacion", "", "rescued", 1), (last_week, "Poblacion", "", "rescued", 1)},
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            claim = PostRequest.objects.create(post=first, user=self.member, request_type="claim", status="accepted")
+        self.assertEqual(self._rows("adoption_outcome"), set())
+        first.status = "reunited"
+        with self.captureOnCommitCallbacks(execute=True):
+            first.save(update_fields=["status"])
+        self.assertEqual(self._rows("adoption_outcome"), {(self.today, "", "claim", "", 1)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            claim.delete()
+        self.assertEqual(self._rows("adoption_outcome"), set())
+        self.assertEqual(self._rows("post_request"), set())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            registration = DogRegistration.objects.create(
+                reg_no="REG-1",
+                name_of_pet="Bantay",
+                breed="Aspin",
+                color_markings="Brown",
+                sex="M",
+                status="Intact",
+                owner_name="Juan Dela Cruz",
+                address="Poblacion",
+                contact_no="09170000000",
+            )
+            VaccinationRecord.objects.create(
+                registration=registration,
+                date=self.today,
+                vaccine_name="Anti-rabies",
+                vaccine_expiry_date=self.today + timedelta(days=365),
+                vaccination_expiry_date=self.today + timedelta(days=365),
+                veterinarian="Dr. Reyes",
+            )
+            registration.breed = "Shih Tzu"
+            registration.save()
+        self.assertEqual(self._rows("vaccination"), {(self.today, "", "Shih Tzu", "", 1)})
+
+    def test_bulk_rejections_recount_their_days_and_recounts_upsert(self):
+        post = Post.objects.create(user=self.staff_user, caption="Bantay", location="Poblacion")
+        with self.captureOnCommitCallbacks(execute=True):
+            pending = [
+                PostRequest.objects.create(post=post, user=self.member, request_type="adopt"),
+                PostRequest.objects.create(post=post, user=self.staff_user, request_type="adopt"),
+            ]
+        self.assertEqual(self._rows("post_request"), {(self.today, "", "adopt", "pending", 2)})
+
+        PostRequest.objects.filter(id=pending[1].id).update(status="rejected")
+        with self.assertNumQueries(3):
+            refresh_rollups_for("post_request", pending)
+        self.assertEqual(
+            self._rows("post_request"),
+            {(self.today, "", "adopt", "pending", 1), (self.today, "", "adopt", "rejected", 1)},
+        )
+
+        with self.assertNumQueries(2):
+            refresh_rollup_days({"post_request": {self.today}})
+
+    def test_dashboard_with_an_empty_rollup_table_shows_a_notice_instead_of_recounting(self):
+        Post.objects.create(user=self.staff_user, caption="Bantay", location="Poblacion", status="adopted")
+        AnalyticsDailyCount.objects.all().delete()
+
+        with patch("dogadoption_admin.analytics_rollups.reconcile_analytics_rollups") as mocked_reconcile:
+            context = _build_analytics_dashboard_context()
+        mocked_reconcile.assert_not_called()
+        self.assertTrue(context["analytics_rollups_pending"])
+        self.assertEqual(context["total_posts"], 0)
+
+        reconcile_analytics_rollups()
+        context = _build_analytics_dashboard_context()
+        self.assertFalse(context["analytics_rollups_pending"])
+        self.assertEqual(context["total_posts"], 1)
+
+    def test_dashboard_reads_rollups_and_reconcile_repairs_bulk_writes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(user=self.staff_user, caption="Bantay", location="Poblacion", status="adopted")
+            Dog.objects.create(date_registered=self.today, name="Bantay", sex="M", owner_name="Juan", barangay="Malabugas")
+            Dog.objects.create(date_registered=self.today, name="Brownie", sex="F", owner_name="Ana", barangay="Malabugas")
+
+        context = _build_analytics_dashboard_context()
+        self.assertEqual((context["total_posts"], context["adopted_dogs"]), (1, 1))
+        self.assertEqual(
+            context["barangay_chart"]["events"],
+            [{"barangay": "Malabugas", "date": self.today.isoformat(), "total": 2}],
+        )
+
+        Dog.objects.update(barangay="Villareal")
+        Post.objects.update(status="rescued")
+        self.assertEqual(reconcile_analytics_rollups(), 2)
+        self.assertEqual(self._rows("dog"), {(self.today, "Villareal", "", "", 2)})
+        self.assertEqual(_build_analytics_dashboard_context()["adopted_dogs"], 0)
+
+        output = StringIO()
+        call_command("reconcile_analytics_rollups", stdout=output)
+        self.assertIn("up to date", output.getvalue())
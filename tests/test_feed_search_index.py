@@ -0,0 +1,119 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from user.models import FeedSearchToken, UserAdoptionPost
+from user.notification_utils import bump_user_home_feed_namespace
+from user.search_index import rebuild_search_index, search_ranked_ids
+from user.suggestion_index import search_suggestions
+from user.views import _build_search_home_rows
+
+
+class FeedSearchIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="searchowner",
+            password="secret123",
+            first_name="Maria",
+        )
+        self.post = UserAdoptionPost.objects.create(
+            owner=self.owner,
+            dog_name="Bantay",
+            description="Friendly with kids",
+            location="Mabigo",
+            status="available",
+        )
+
+    def _ids(self, query):
+        return [entity_id for entity_id, _score in search_ranked_ids("user", query, 10)]
+
+    def test_every_query_word_must_match_a_token_prefix(self):
+        self.assertEqual(self._ids("banta MABI"), [self.post.id])
+        self.assertEqual(self._ids("maria"), [self.post.id])
+        self.assertEqual(self._ids("bantay poblacion"), [])
+
+    def test_words_only_match_word_starts(self):
+        self.assertEqual(self._ids("bant"), [self.post.id])
+        self.assertEqual(self._ids("tay"), [])
+
+    def test_saves_without_name_fields_skip_the_name_lookup(self):
+        owner = User.objects.get(pk=self.owner.pk)
+        owner.email = "maria@example.com"
+        with self.assertNumQueries(1):
+            owner.save()
+        with self.assertNumQueries(1):
+            owner.save(update_fields=["email"])
+
+    def test_index_follows_status_and_owner_changes(self):
+        self.owner.first_name = "Josefa"
+        self.owner.save(update_fields=["first_name"])
+        self.assertEqual(self._ids("josefa"), [self.post.id])
+        self.assertEqual(self._ids("maria"), [])
+
+        self.post.status = "adopted"
+        self.post.save()
+        self.assertFalse(FeedSearchToken.objects.filter(feed_type="user").exists())
+
+    def test_rebuild_and_search_rows_rank_title_hits_first(self):
+        described = UserAdoptionPost.objects.create(
+            owner=self.owner,
+            dog_name="Whitey",
+            description="Looks like Bantay",
+            location="Mabigo",
+            status="available",
+        )
+        FeedSearchToken.objects.all().delete()
+        self.assertEqual(rebuild_search_index()["user"], 2)
+
+        rows = _build_search_home_rows("bantay", dogs_only=True)
+        self.assertEqual([row["id"] for row in rows], [self.post.id, described.id])
+
+
+class SearchSuggestionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(username="suggestowner", password="secret123")
+        UserAdoptionPost.objects.create(
+            owner=owner,
+            dog_name="Goldie",
+            location="Purok 2, Villareal",
+            status="available",
+        )
+        bump_user_home_feed_namespace()
+
+    def _labels(self, prefix):
+        response = self.client.get(reverse("user:home_search_suggestions"), {"q": prefix})
+        return [item["label"] for item in response.json()["suggestions"]]
+
+    def test_suggestions_cover_breeds_barangays_names_and_locations(self):
+        labels = self._labels("gold")
+        self.assertEqual(labels[0], "Golden Retriever")
+        self.assertIn("Goldie", labels)
+        self.assertIn("Villareal", self._labels("villa"))
+        self.assertIn("Purok 2, Villareal", self._labels("villa"))
+        self.assertIn("Labrador Retriever", self._labels("retr"))
+
+    def test_search_page_input_is_wired_to_suggestions(self):
+        response = self.client.get(reverse("user:home_search"))
+        self.assertContains(
+            response,
+            'data-search-suggest-url="%s"' % reverse("user:home_search_suggestions"),
+            html=False,
+        )
+        self.assertContains(response, '<datalist id="homeSearchSuggestions">', html=False)
+
+    def test_warm_lookups_skip_the_database_until_the_namespace_moves(self):
+        search_suggestions("gold")
+        with self.assertNumQueries(0):
+            self.assertNotIn("Bantay", [item["label"] for item in search_suggestions("bant")])
+
+        UserAdoptionPost.objects.create(
+            owner=User.objects.get(username="suggestowner"),
+            dog_name="Bantay",
+            location="Mabigo",
+            status="available",
+        )
+        bump_user_home_feed_namespace()
+        self.assertIn("Bantay", [item["label"] for item in search_suggestions("bant")])
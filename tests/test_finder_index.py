@@ -0,0 +1,166 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from dogadoption_admin.models import Post
+from user.finder_index import FinderFacetIndex, get_finder_index
+from user.models import UserAdoptionPost
+from user.similar_dogs import SimilarDogMatrix, similar_dogs
+
+
+class FinderFacetIndexTests(TestCase):
+    def test_scores_count_matched_facets(self):
+        index = FinderFacetIndex()
+        index.upsert("staff", 1, [("breed", "aspin"), ("gender", "male"), ("color", "black")])
+        index.upsert("staff", 2, [("breed", "aspin"), ("gender", "female"), ("color", "black")])
+        index.upsert("staff", 3, [("breed", "pug"), ("location", "mabigo")])
+        index.upsert("user", 1, [("breed", "aspin"), ("gender", "male")])
+
+        selected = {"breed": "aspin", "gender": "male", "color": "black", "location": ""}
+        self.assertEqual(index.match_scores("staff", selected), {1: 3, 2: 2})
+        self.assertEqual(index.matching_ids("staff", selected), {1})
+        self.assertEqual(index.matching_ids("user", {"breed": "aspin", "gender": "male"}), {1})
+        self.assertEqual(index.match_scores("staff", {"location": "  Mabigo "}), {3: 1})
+
+        index.remove("staff", 1)
+        index.upsert("staff", 4, [("gender", "male")])
+        self.assertEqual(index.match_scores("staff", selected), {2: 2, 4: 1})
+        self.assertEqual(len(index), 4)
+
+
+class SimilarDogMatrixTests(TestCase):
+    def test_ranks_closest_open_listings(self):
+        matrix = SimilarDogMatrix(capacity=2)
+        # id, breed, age_group, size_group, gender, coat_length, colors, location
+        matrix.upsert("staff", (1, "aspin", "adult", "medium", "male", "short", ["black"], "Mabigo"), 100.0)
+        matrix.upsert("staff", (2, "aspin", "adult", "medium", "male", "short", ["black"], "Mabigo"), 100.0)
+        matrix.upsert("staff", (3, "aspin", "senior", "large", "", "", ["white"], ""), 100.0)
+        matrix.upsert("user", (4, "pug", "adult", "medium", "male", "short", ["black"], "Mabigo"), float("inf"))
+        matrix.upsert("staff", (5, "aspin", "adult", "medium", "male", "short", ["black"], "Mabigo"), 10.0)
+        matrix.upsert("staff", (6, "other", "", "", "", "", ["other"], ""), 100.0)
+        matrix.upsert("staff", (7, "other", "", "", "", "", ["other"], ""), 100.0)
+
+        self.assertEqual(
+            matrix.similar("staff", 1, 3, now_ts=50.0),
+            [("staff", 2), ("user", 4), ("staff", 3)],
+        )
+        self.assertEqual(matrix.similar("staff", 6, 3, now_ts=50.0), [])
+
+        matrix.remove("staff", 2)
+        self.assertEqual(matrix.similar("staff", 1, 1, now_ts=50.0), [("user", 4)])
+        self.assertEqual(len(matrix), 6)
+
+
+class FinderIndexSyncTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff_user = User.objects.create_user(username="finderstaff", password="secret123", is_staff=True)
+        self.owner = User.objects.create_user(username="finderowner", password="secret123")
+
+    def test_index_replays_listing_changes(self):
+        post = Post.objects.create(
+            user=self.staff_user,
+            caption="Finder Dog",
+            breed="aspin",
+            location="Mabigo",
+        )
+        listing = UserAdoptionPost.objects.create(
+            owner=self.owner,
+            dog_name="Bantay",
+            breed="aspin",
+            location="Mabigo",
+            status="available",
+        )
+        self.assertEqual(get_finder_index().matching_ids("staff", {"breed": "aspin"}), {post.id})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.breed = "pug"
+            post.save()
+            listing.status = "adopted"
+            listing.save()
+        index = get_finder_index()
+        self.assertEqual(index.matching_ids("staff", {"breed": "pug"}), {post.id})
+        self.assertEqual(index.matching_ids("user", {"breed": "aspin"}), set())
+
+    def test_rolled_back_saves_leave_no_change_log_entry(self):
+        post = Post.objects.create(user=self.staff_user, caption="Finder Dog", breed="aspin", location="Mabigo")
+        self.assertEqual(get_finder_index().matching_ids("staff", {"breed": "aspin"}), {post.id})
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                post.breed = "pug"
+                post.save()
+                raise RuntimeError
+        self.assertEqual(callbacks, [])
+        self.assertEqual(get_finder_index().matching_ids("staff", {"breed": "aspin"}), {post.id})
+
+    def test_finder_page_filters_community_listings_through_index(self):
+        matching = UserAdoptionPost.objects.create(
+            owner=self.owner,
+            dog_name="Bantay",
+            breed="aspin",
+            status="available",
+        )
+        UserAdoptionPost.objects.create(
+            owner=self.owner,
+            dog_name="Brownie",
+            breed="pug",
+            status="available",
+        )
+
+        response = self.client.get(reverse("user:adopt_list"), {"purpose": "adopt", "breed": "aspin"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [post["post_id"] for post in response.context["user_adoption_posts"]],
+            [matching.id],
+        )
+
+    def test_finder_pages_sort_rows_before_hydrating_cards(self):
+        posts = [
+            Post.objects.create(
+                user=self.staff_user,
+                caption=f"Paged Dog {index}",
+                location="Bayawan",
+                claim_days=index + 1,
+            )
+            for index in range(14)
+        ]
+
+        response = self.client.get(reverse("user:redeem_list"), {"purpose": "claim"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["unified_page_obj"].paginator.count, 14)
+        self.assertEqual(
+            [row["item"]["post"].id for row in response.context["finder_unified_rows"]],
+            [post.id for post in posts[:12]],
+        )
+
+        response = self.client.get(reverse("user:redeem_list"), {"purpose": "claim", "page": 2})
+        self.assertEqual(
+            [row["item"]["post"].id for row in response.context["finder_unified_rows"]],
+            [post.id for post in posts[12:]],
+        )
+
+    def test_post_detail_lists_similar_dogs(self):
+        post = Post.objects.create(user=self.staff_user, caption="Detail Dog", breed="aspin", location="Mabigo")
+        similar = Post.objects.create(user=self.staff_user, caption="Twin Dog", breed="aspin", location="Mabigo")
+        listing = UserAdoptionPost.objects.create(
+            owner=self.owner,
+            dog_name="Bantay",
+            breed="aspin",
+            location="Poblacion",
+            status="available",
+        )
+        Post.objects.create(user=self.staff_user, caption="Other Dog", breed="pug", location="Villareal")
+        self.assertEqual(similar_dogs("staff", post.id, 4), [("staff", similar.id), ("user", listing.id)])
+
+        response = self.client.get(reverse("user:post_detail", args=[post.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [dog["title"] for dog in response.context["similar_dogs"]],
+            [similar.display_title, "Bantay"],
+        )
+        self.assertContains(response, "Dogs like this")
@@ -0,0 +1,479 @@
+import pickle
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from dogadoption_admin.models import Post, PostPhaseTransition, PostRequest, PostRequestState
+from dogadoption_admin.phase_scheduler import (
+    PHASE_SCHEDULER_WAKE_KEY,
+    hold_phase_scheduler_lease,
+    next_phase_deadline,
+    phase_scheduler_is_live,
+    run_phase_scheduler,
+)
+from user import feed_store
+from user.feed_store import PackedFeedRows, get_feed_candidate_pools, pool_candidate_ids
+from user.views import _build_random_home_rows, _hydrate_home_feed_items
+from user.models import MissingDogPost, UserAdoptionPost
+from user.notification_utils import get_user_home_feed_namespace
+
+
+class HomeFeedCandidatePoolTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = User.objects.create_user(
+            username="poolstaff",
+            password="secret123",
+            is_staff=True,
+        )
+        cls.member = User.objects.create_user(
+            username="poolmember",
+            password="secret123",
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def _create_post(self, caption="Pool Dog"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Post.objects.create(
+                user=self.staff_user,
+                caption=caption,
+                location="Bayawan",
+                claim_days=3,
+            )
+
+    def _pool_ids(self, feed_type, **kwargs):
+        return pool_candidate_ids(get_feed_candidate_pools([feed_type])[feed_type], **kwargs)
+
+    def test_new_posts_are_patched_into_existing_pools_without_rebuild(self):
+        first = self._create_post("First Pool Dog")
+        self.assertEqual(self._pool_ids("admin"), [first.id])
+
+        second = self._create_post("Second Pool Dog")
+        with self.assertNumQueries(0):
+            self.assertEqual(self._pool_ids("admin"), [second.id, first.id])
+
+    def test_finalized_and_accepted_posts_leave_the_admin_pool(self):
+        finalized = self._create_post("Finalized Pool Dog")
+        accepted = self._create_post("Accepted Pool Dog")
+        self.assertCountEqual(self._pool_ids("admin"), [finalized.id, accepted.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            finalized.status = "reunited"
+            finalized.save(update_fields=["status"])
+            PostRequest.objects.create(
+                post=accepted,
+                user=self.member,
+                request_type="adopt",
+                status="accepted",
+            )
+
+        self.assertEqual(self._pool_ids("admin"), [])
+
+    def test_rolled_back_writes_never_reach_the_pool(self):
+        kept = self._create_post("Kept Pool Dog")
+        self.assertEqual(self._pool_ids("admin"), [kept.id])
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                Post.objects.create(user=self.staff_user, caption="Rolled Back", location="Bayawan", claim_days=3)
+                raise RuntimeError
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self._pool_ids("admin"), [kept.id])
+
+    def test_patch_during_a_cold_build_keeps_the_stale_rows_out_of_cache(self):
+        first = self._create_post("First Cold Dog")
+        cache.clear()
+        build_pool = feed_store._build_pool
+
+        def build_racing_a_patch(feed_type):
+            rows = build_pool(feed_type)
+            self._create_post("Patched Mid Build")
+            return rows
+
+        with patch("user.feed_store._build_pool", side_effect=build_racing_a_patch):
+            self.assertEqual(self._pool_ids("admin"), [first.id])
+        self.assertIsNone(cache.get("user_home_feed_pool_v1:admin"))
+        self.assertEqual(len(self._pool_ids("admin")), 2)
+
+    def test_removal_from_a_full_pool_forces_a_refill(self):
+        posts = [self._create_post(f"Full Pool Dog {index}") for index in range(3)]
+        with patch.dict(feed_store.FEED_POOL_CANDIDATE_LIMITS, {"admin": 2}):
+            self.assertEqual(self._pool_ids("admin"), [posts[2].id, posts[1].id])
+            with self.captureOnCommitCallbacks(execute=True):
+                posts[2].delete()
+            self.assertIsNone(cache.get("user_home_feed_pool_v1:admin"))
+            self.assertEqual(self._pool_ids("admin"), [posts[1].id, posts[0].id])
+
+    def test_closed_windows_are_filtered_at_read_time(self):
+        post = self._create_post()
+        self.assertEqual(self._pool_ids("admin"), [post.id])
+
+        later = timezone.now() + timedelta(days=Post.ADOPTION_DAYS + post.claim_days + 1)
+        self.assertEqual(self._pool_ids("admin", now=later), [])
+
+    def test_community_pools_track_status_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            adoption = UserAdoptionPost.objects.create(
+                owner=self.member,
+                dog_name="Pool Pup",
+                location="Mabigo",
+                status="available",
+            )
+        self.assertEqual(self._pool_ids("user"), [adoption.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            adoption.status = "adopted"
+            adoption.save()
+        self.assertEqual(self._pool_ids("user"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            missing = MissingDogPost.objects.create(
+                owner=self.member,
+                dog_name="Lost Pup",
+                location="Mabigo",
+                image="missing_dogs/lost.jpg",
+                date_lost=timezone.localdate(),
+                time_lost="08:00",
+                status="missing",
+            )
+        self.assertEqual(self._pool_ids("missing"), [missing.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            missing.delete()
+        self.assertEqual(self._pool_ids("missing"), [])
+
+
+class SharedHomeFeedRowsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_packed_rows_round_trip_and_paginate(self):
+        pairs = [("admin", 7), ("announcement", 3), ("user", 12), ("missing", 5)] * 10
+        rows = pickle.loads(pickle.dumps(PackedFeedRows.from_pairs(pairs)))
+
+        self.assertEqual(len(rows), 40)
+        page = Paginator(rows, 12).get_page(4)
+        self.assertEqual(
+            list(page.object_list),
+            [{"id": 7, "feed_type": "admin"}, {"id": 3, "feed_type": "announcement"},
+             {"id": 12, "feed_type": "user"}, {"id": 5, "feed_type": "missing"}],
+        )
+        trimmed = rows.without({"user": {12}})
+        self.assertEqual(len(trimmed), 30)
+        self.assertNotIn("user", {row["feed_type"] for row in trimmed})
+
+    def test_feed_rows_are_shared_across_viewers_and_hide_own_posts(self):
+        owner = User.objects.create_user(username="sharedowner", password="secret123")
+        other = User.objects.create_user(username="sharedother", password="secret123")
+        own_post = UserAdoptionPost.objects.create(
+            owner=owner,
+            dog_name="Owner Pup",
+            location="Mabigo",
+            status="available",
+        )
+        other_post = UserAdoptionPost.objects.create(
+            owner=other,
+            dog_name="Other Pup",
+            location="Mabigo",
+            status="available",
+        )
+
+        owner_rows = _build_random_home_rows("", feed_token="shared", viewer_id=owner.id)
+        self.assertEqual([row["id"] for row in owner_rows], [other_post.id])
+
+        # The second viewer reuses the cached rows, and the pools already know each row's owner.
+        with self.assertNumQueries(0):
+            other_rows = _build_random_home_rows("", feed_token="shared", viewer_id=other.id)
+        self.assertEqual([row["id"] for row in other_rows], [own_post.id])
+
+
+class HomeFeedCardCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff_user = User.objects.create_user(
+            username="cardstaff",
+            password="secret123",
+            is_staff=True,
+        )
+        self.member = User.objects.create_user(username="cardmember", password="secret123")
+        self.post = Post.objects.create(
+            user=self.staff_user,
+            caption="Card Dog",
+            location="Bayawan",
+            claim_days=3,
+        )
+        self.rows = [{"id": self.post.id, "feed_type": "admin"}]
+
+    def _hydrate(self, user):
+        request = RequestFactory().get("/user/home/")
+        request.user = user
+        return _hydrate_home_feed_items(request, self.rows, appointment_dates=[])
+
+    def test_warm_cards_skip_the_orm_and_layer_viewer_flags(self):
+        self._hydrate(AnonymousUser())
+
+        with self.assertNumQueries(0):
+            guest_items = self._hydrate(AnonymousUser())
+        self.assertEqual(guest_items[0]["post"].caption, "Card Dog")
+        self.assertTrue(guest_items[0]["show_claim_cta"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PostRequest.objects.create(
+                post=self.post,
+                user=self.member,
+                request_type="claim",
+                status="pending",
+            )
+        # Only the viewer's own request lookup runs; the card itself was rebuilt once above.
+        self._hydrate(AnonymousUser())
+        with self.assertNumQueries(1):
+            member_items = self._hydrate(self.member)
+        self.assertTrue(member_items[0]["viewer_has_claim_request"])
+        self.assertTrue(member_items[0]["post"].has_pending_claim_request)
+
+
+class PostComputePhasesTests(TestCase):
+    def test_batch_phases_match_per_post_evaluation(self):
+        now = timezone.now()
+        posts = []
+        for index, (status, override, started_hours_ago, created_hours_ago) in enumerate([
+            ("rescued", "", None, 1),
+            ("rescued", "", None, 80),
+            ("under_care", "", None, 200),
+            ("rescued", "claim", 10, 300),
+            ("rescued", "claim", 100, 300),
+            ("rescued", "adopt", 10, 300),
+            ("rescued", "adopt", None, 1),
+            ("adopted", "claim", 1, 1),
+        ]):
+            post = Post(
+                id=index + 1,
+                status=status,
+                claim_days=3,
+                phase_override=override,
+                phase_override_started_at=(
+                    now - timedelta(hours=started_hours_ago) if started_hours_ago else None
+                ),
+            )
+            post.created_at = now - timedelta(hours=created_hours_ago)
+            posts.append(post)
+
+        for post, state in zip(posts, Post.compute_phases(posts, now)):
+            self.assertEqual(state["phase"], post.current_phase(now))
+            self.assertEqual(state["claim_deadline"], post.claim_deadline())
+            self.assertEqual(state["adoption_deadline"], post.adoption_deadline())
+            self.assertEqual(state["time_left"], post.time_left(now))
+
+    def test_saved_posts_store_phase_deadline_columns(self):
+        staff_user = User.objects.create_user(username="deadlinestaff", password="secret123", is_staff=True)
+        seen_on_insert = []
+
+        def record_deadline(sender, instance, created, **kwargs):
+            if created:
+                seen_on_insert.append(instance.phase_ends_at)
+
+        post_save.connect(record_deadline, sender=Post, dispatch_uid="test_record_deadline")
+        try:
+            post = Post.objects.create(user=staff_user, caption="Deadline Dog", location="Bayawan", claim_days=2)
+        finally:
+            post_save.disconnect(sender=Post, dispatch_uid="test_record_deadline")
+        post.refresh_from_db()
+        self.assertEqual(seen_on_insert, [post.phase_ends_at])
+        self.assertEqual(post.claim_ends_at, post.claim_deadline())
+        self.assertEqual(post.phase_ends_at, post.adoption_deadline())
+
+        post.phase_override = "adopt"
+        post.phase_override_started_at = timezone.now() - timedelta(days=Post.MANUAL_PHASE_RESET_DAYS + 1)
+        post.save(update_fields=["phase_override", "phase_override_started_at"])
+        self.assertFalse(Post.objects.filter(pk=post.pk, phase_ends_at__gte=timezone.now()).exists())
+
+        post.status = "reunited"
+        post.save(update_fields=["status"])
+        post.refresh_from_db()
+        self.assertIsNone(post.phase_ends_at)
+
+
+class PostPhaseSchedulerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        staff_user = User.objects.create_user(username="schedulerstaff", password="secret123", is_staff=True)
+        self.post = Post.objects.create(user=staff_user, caption="Scheduler Dog", location="Bayawan", claim_days=2)
+        self.post.refresh_from_db()
+
+    def test_transitions_are_recorded_once_at_each_deadline(self):
+        claim_ends_at = self.post.claim_ends_at
+        self.assertEqual(next_phase_deadline(claim_ends_at - timedelta(hours=1)), claim_ends_at)
+
+        transitions, next_deadline = run_phase_scheduler(claim_ends_at + timedelta(seconds=1))
+        self.assertEqual(
+            [(t.post_id, t.from_phase, t.to_phase) for t in transitions],
+            [(self.post.pk, "claim", "adopt")],
+        )
+        self.assertEqual(next_deadline, self.post.phase_ends_at)
+
+        cache.clear()
+        transitions, _next_deadline = run_phase_scheduler(claim_ends_at + timedelta(seconds=2))
+        self.assertEqual(transitions, [])
+        self.assertEqual(PostPhaseTransition.objects.filter(post=self.post).count(), 1)
+
+    def test_closing_drops_post_from_feed_pool_and_bumps_namespace(self):
+        self.assertIn(self.post.pk, [row[1] for row in get_feed_candidate_pools(("admin",))["admin"]])
+        namespace = get_user_home_feed_namespace()
+
+        run_phase_scheduler(self.post.claim_ends_at + timedelta(seconds=1))
+        self.assertEqual(get_user_home_feed_namespace(), namespace)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            transitions, next_deadline = run_phase_scheduler(self.post.phase_ends_at + timedelta(seconds=1))
+        self.assertEqual([t.to_phase for t in transitions], ["closed"])
+        self.assertIsNone(next_deadline)
+        self.assertNotEqual(get_user_home_feed_namespace(), namespace)
+        self.assertNotIn(
+            self.post.pk,
+            [row[1] for row in cache.get("user_home_feed_pool_v1:admin")],
+        )
+
+
+    def test_new_post_ending_soon_leaves_a_wake_request_for_the_running_scheduler(self):
+        soon = Post.objects.create(
+            user=self.post.user,
+            caption="Soon Dog",
+            location="Bayawan",
+            claim_days=1,
+            created_at=timezone.now() - timedelta(days=1) + timedelta(minutes=5),
+        )
+        self.assertEqual(cache.get(PHASE_SCHEDULER_WAKE_KEY), soon.claim_ends_at)
+
+        run_phase_scheduler()
+        self.assertIsNone(cache.get(PHASE_SCHEDULER_WAKE_KEY))
+
+    def test_one_lease_holder_and_long_ttls_only_while_a_scheduler_runs(self):
+        self.assertTrue(hold_phase_scheduler_lease("web-1"))
+        self.assertFalse(hold_phase_scheduler_lease("web-2"))
+        self.assertTrue(hold_phase_scheduler_lease("web-1"))
+
+        self.assertFalse(phase_scheduler_is_live())
+        run_phase_scheduler()
+        self.assertTrue(phase_scheduler_is_live())
+        self.assertFalse(phase_scheduler_is_live(timezone.now() + timedelta(hours=1)))
+
+class PostRequestStateTests(TestCase):
+    def setUp(self):
+        staff_user = User.objects.create_user(username="statestaff", password="secret123", is_staff=True)
+        self.member = User.objects.create_user(username="statemember", password="secret123")
+        self.other_member = User.objects.create_user(username="stateother", password="secret123")
+        self.post = Post.objects.create(user=staff_user, caption="State Dog", location="Bayawan")
+
+    def _annotated_post(self):
+        return Post.with_pending_request_state(Post.objects.filter(pk=self.post.pk)).get()
+
+    def test_summary_follows_request_writes(self):
+        self.assertFalse(PostRequestState.objects.filter(post=self.post).exists())
+        self.assertFalse(self._annotated_post().has_pending_claim_request)
+
+        first = PostRequest.objects.create(post=self.post, user=self.member, request_type="claim")
+        second = PostRequest.objects.create(post=self.post, user=self.other_member, request_type="claim")
+        state = PostRequestState.objects.get(post=self.post)
+        self.assertEqual(state.pending_claim_count, 2)
+        self.assertEqual(state.pending_claim_started_at, first.created_at)
+        self.assertEqual(state.pending_claim_latest_at, second.created_at)
+
+        annotated = self._annotated_post()
+        self.assertTrue(annotated.has_pending_claim_request)
+        self.assertFalse(annotated.has_pending_adopt_request)
+        self.assertEqual(annotated.pending_claim_started_at, first.created_at)
+
+        first.status = "rejected"
+        first.save(update_fields=["status"])
+        self.assertEqual(PostRequestState.objects.get(post=self.post).pending_claim_count, 1)
+
+        second.delete()
+        self.assertFalse(self._annotated_post().has_pending_claim_request)
+
+        first.delete()
+        self.assertFalse(PostRequestState.objects.filter(post=self.post).exists())
+
+    def test_refresh_updates_the_summary_row_in_place(self):
+        request = PostRequest.objects.create(post=self.post, user=self.member, request_type="claim")
+        request.status = "accepted"
+        with CaptureQueriesContext(connection) as queries:
+            request.save(update_fields=["status"])
+        self.assertFalse([query for query in queries if query["sql"].startswith("DELETE")])
+        state = PostRequestState.objects.get(post=self.post)
+        self.assertEqual((state.pending_claim_count, state.claim_accepted_count), (0, 1))
+        self.assertIsNone(state.pending_claim_started_at)
+
+    def test_deleting_post_removes_summary(self):
+        PostRequest.objects.create(post=self.post, user=self.member, request_type="adopt")
+        self.post.delete()
+        self.assertFalse(PostRequestState.objects.exists())
+
+    def test_request_counts_and_reconcile(self):
+        PostRequest.objects.create(post=self.post, user=self.member, request_type="claim", status="rejected")
+        PostRequest.objects.create(post=self.post, user=self.other_member, request_type="claim")
+        PostRequest.objects.create(post=self.post, user=self.member, request_type="adopt")
+
+        counted = Post.with_request_counts(Post.objects.filter(pk=self.post.pk)).get()
+        self.assertEqual((counted.claim_count, counted.adopt_count, counted.total_request_count), (2, 1, 3))
+
+        PostRequest.objects.filter(post=self.post, request_type="adopt").update(status="accepted")
+        self.assertEqual(PostRequestState.objects.get(post=self.post).adopt_accepted_count, 0)
+        self.assertEqual(PostRequestState.reconcile(), [self.post.pk])
+        state = PostRequestState.objects.get(post=self.post)
+        self.assertEqual((state.pending_adopt_count, state.adopt_accepted_count), (0, 1))
+        self.assertEqual(PostRequestState.reconcile(), [])
+
+
+class HomeFeedCursorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff_user = User.objects.create_user(
+            username="cursorstaff",
+            password="secret123",
+            is_staff=True,
+        )
+        cls.member = User.objects.create_user(
+            username="cursormember",
+            password="secret123",
+        )
+        for index in range(26):
+            Post.objects.create(
+                user=cls.staff_user,
+                caption=f"Cursor Dog {index}",
+                location="Bayawan",
+                claim_days=3,
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.member)
+
+    def test_load_more_continues_search_results_from_the_cursor(self):
+        response = self.client.get(reverse("user:home_search"), {"q": "Cursor"})
+        self.assertEqual(len(response.context["posts"]), 24)
+        cursor = response.context["feed_next_cursor"]
+        self.assertTrue(cursor)
+        self.assertContains(response, 'data-feed-next-url="%s"' % reverse("user:home_feed_next"), html=False)
+
+        response = self.client.get(reverse("user:home_feed_next"), {"cursor": cursor})
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload["ok"])
+        self.assertEqual(payload["count"], 2)
+        self.assertEqual(payload["next_cursor"], "")
+        self.assertEqual(payload["html"].count("Cursor Dog"), 2)
+
+    def test_tampered_cursor_is_rejected(self):
+        response = self.client.get(reverse("user:home_feed_next"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()["ok"])
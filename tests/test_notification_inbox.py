@@ -0,0 +1,288 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from dogadoption_admin.models import DogAnnouncement, Post, PostRequest
+from user.models import (
+    NotificationReadMarker,
+    NotificationReadWatermark,
+    PendingNotificationBroadcast,
+    UserAdoptionPost,
+    UserAdoptionRequest,
+    UserNotification,
+)
+from user.context_processors import user_notifications
+from user.notification_inbox import USER_NOTIFICATION_BROADCAST_RETENTION, backfill_user_notifications
+from user.notification_utils import (
+    _build_inbox_items,
+    build_user_notification_summary,
+    invalidate_user_notification_payload,
+)
+
+
+class UserNotificationInboxTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff_user = User.objects.create_user(username="inboxstaff", password="secret123", is_staff=True)
+        self.member = User.objects.create_user(username="inboxmember", password="secret123")
+        self.owner = User.objects.create_user(username="inboxowner", password="secret123")
+        self.client.force_login(self.member)
+
+    def _summary(self):
+        return self.client.get(reverse("user:notification_summary")).json()
+
+    def test_broadcasts_fan_out_to_members_and_read_state_lives_on_the_row(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            announcement = DogAnnouncement.objects.create(
+                title="Free anti-rabies shots",
+                content="Bring your dogs to the plaza.",
+                created_by=self.staff_user,
+            )
+            listing = UserAdoptionPost.objects.create(
+                owner=self.owner,
+                dog_name="Bantay",
+                location="Mabigo",
+                status="available",
+            )
+
+        self.assertEqual(
+            set(UserNotification.objects.values_list("user__username", "key")),
+            {
+                ("inboxmember", f"announcement-{announcement.id}"),
+                ("inboxowner", f"announcement-{announcement.id}"),
+                ("inboxmember", f"community-post-{listing.id}"),
+            },
+        )
+        summary = self._summary()
+        self.assertEqual(summary["unread_count"], 2)
+        self.assertEqual(summary["notifications"][1]["message"], "Free anti-rabies shots")
+
+        response = self.client.get(
+            reverse("user:open_notification"),
+            {"key": f"announcement-{announcement.id}"},
+        )
+        self.assertRedirects(
+            response,
+            reverse("user:announcement_detail", args=[announcement.id]),
+            fetch_redirect_response=False,
+        )
+        self.assertIsNotNone(
+            UserNotification.objects.get(user=self.member, key=f"announcement-{announcement.id}").read_at
+        )
+        self.assertEqual(self._summary()["unread_count"], 1)
+
+        announcement.title = "Free shots moved to Saturday"
+        announcement.save()
+        listing.status = "adopted"
+        listing.save()
+        self.assertEqual(
+            [item["message"] for item in self._summary()["notifications"]],
+            ["Free shots moved to Saturday"],
+        )
+
+        self.client.post(reverse("user:mark_notifications_seen"))
+        self.assertFalse(UserNotification.objects.filter(user=self.member, read_at__isnull=True).exists())
+        announcement.delete()
+        self.assertFalse(UserNotification.objects.exists())
+
+    @override_settings(USER_NOTIFICATION_FANOUT_INLINE=False)
+    def test_broadcasts_wait_for_commit_and_fan_out_from_the_queue(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            listing = UserAdoptionPost.objects.create(
+                owner=self.owner,
+                dog_name="Bantay",
+                location="Mabigo",
+                status="available",
+            )
+        self.assertFalse(PendingNotificationBroadcast.objects.exists())
+        for callback in callbacks:
+            callback()
+        self.assertFalse(UserNotification.objects.exists())
+
+        # Saves that cannot change the notification skip the inbox entirely.
+        with patch("user.signals.notify_members") as mocked_notify:
+            listing.description = "Friendly with kids."
+            listing.save(update_fields=["description"])
+        mocked_notify.assert_not_called()
+
+        out = StringIO()
+        call_command("fan_out_user_notifications", stdout=out)
+        self.assertIn("Fanned out 1 broadcast notification(s).", out.getvalue())
+        self.assertEqual(
+            list(UserNotification.objects.values_list("user__username", "key")),
+            [("inboxmember", f"community-post-{listing.id}")],
+        )
+        self.assertFalse(PendingNotificationBroadcast.objects.exists())
+
+    def test_request_events_notify_only_the_member_concerned(self):
+        listing = UserAdoptionPost.objects.create(owner=self.owner, dog_name="Bantay", status="available")
+        adoption_request = UserAdoptionRequest.objects.create(post=listing, requester=self.member)
+        self.assertTrue(
+            UserNotification.objects.filter(
+                user=self.owner,
+                key=f"incoming-user-request-{adoption_request.id}",
+            ).exists()
+        )
+
+        adoption_request.status = "rejected"
+        adoption_request.save(update_fields=["status"])
+        self.assertFalse(UserNotification.objects.filter(kind="incoming_user_request").exists())
+
+        post = Post.objects.create(user=self.staff_user, caption="Claimable Dog", location="Bayawan")
+        post_request = PostRequest.objects.create(post=post, user=self.member, request_type="claim")
+        self.assertFalse(UserNotification.objects.filter(kind="accepted_request").exists())
+        post_request.status = "accepted"
+        post_request.save(update_fields=["status"])
+
+        notification = UserNotification.objects.get(kind="accepted_request")
+        self.assertEqual(notification.user, self.member)
+        self.assertEqual(notification.title, "Claim request accepted")
+
+    def test_broadcasts_prune_rows_past_the_retention_window(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            old = DogAnnouncement.objects.create(title="Old drive", content="Plaza.", created_by=self.staff_user)
+        UserNotification.objects.filter(key=f"announcement-{old.id}").update(
+            created_at=timezone.now() - USER_NOTIFICATION_BROADCAST_RETENTION - timedelta(days=1)
+        )
+        request_row = UserNotification.objects.create(
+            user=self.member,
+            kind="accepted_request",
+            key="accepted-request-999",
+            title="Claim request accepted",
+            url="/",
+            created_at=timezone.now() - timedelta(days=365),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            new = DogAnnouncement.objects.create(title="New drive", content="Plaza.", created_by=self.staff_user)
+        self.assertEqual(
+            set(UserNotification.objects.filter(user=self.member).values_list("key", flat=True)),
+            {f"announcement-{new.id}", request_row.key},
+        )
+
+    def test_backfill_copies_existing_events_and_read_keys(self):
+        post = Post.objects.create(user=self.staff_user, caption="Older Dog", location="Bayawan")
+        UserNotification.objects.all().delete()
+        NotificationReadMarker.objects.create(user=self.member, key=f"admin-post-{post.id}")
+
+        counts = backfill_user_notifications()
+
+        self.assertEqual(counts, {"admin_post": 2})
+        self.assertEqual(
+            {
+                notification.user.username: notification.read_at is not None
+                for notification in UserNotification.objects.select_related("user")
+            },
+            {"inboxmember": True, "inboxowner": False},
+        )
+        self.assertFalse(NotificationReadMarker.objects.exists())
+
+    def test_read_markers_and_watermark_acknowledge_without_rewriting_rows(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            DogAnnouncement.objects.create(title="Drive", content="Bring dogs.", created_by=self.staff_user)
+            Post.objects.create(user=self.staff_user, caption="New Dog", location="Bayawan")
+        self.assertEqual(self._summary()["unread_count"], 2)
+
+        self.client.post(reverse("user:mark_notifications_seen"))
+        self.assertEqual(self._summary()["unread_count"], 0)
+        self.assertEqual(UserNotification.objects.filter(user=self.member, read_at__isnull=True).count(), 2)
+        self.assertTrue(NotificationReadWatermark.objects.filter(user=self.member).exists())
+
+        reminder_key = "vaccination_due-7-2026-11-01"
+        for _ in range(2):
+            self.client.post(reverse("user:mark_notification_read"), {"key": reminder_key})
+        self.assertEqual(
+            list(NotificationReadMarker.objects.filter(user=self.member).values_list("key", flat=True)),
+            [reminder_key],
+        )
+
+    def test_rows_inserted_after_mark_all_seen_stay_unread_even_with_older_event_times(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            DogAnnouncement.objects.create(title="Drive", content="Bring dogs.", created_by=self.staff_user)
+        self.client.post(reverse("user:mark_notifications_seen"))
+        self.assertEqual(self._summary()["unread_count"], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            listing = UserAdoptionPost.objects.create(
+                owner=self.owner,
+                dog_name="Bantay",
+                location="Mabigo",
+                status="available",
+            )
+        UserNotification.objects.filter(key=f"community-post-{listing.id}").update(
+            created_at=timezone.now() - timedelta(days=3)
+        )
+        invalidate_user_notification_payload(self.member.id)
+        self.assertEqual(self._summary()["unread_count"], 1)
+
+    def test_broadcast_text_is_cached_once_and_edits_keep_member_payloads(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            announcement = DogAnnouncement.objects.create(
+                title="Free anti-rabies shots",
+                content="Bring your dogs to the plaza.",
+                created_by=self.staff_user,
+            )
+        self.assertEqual(self._summary()["notifications"][0]["message"], "Free anti-rabies shots")
+
+        self.client.force_login(self.owner)
+        with patch(
+            "user.notification_utils.UserNotification.objects.filter",
+            wraps=UserNotification.objects.filter,
+        ) as mocked_filter:
+            self.assertEqual(self._summary()["notifications"][0]["message"], "Free anti-rabies shots")
+        self.assertEqual(mocked_filter.call_count, 1)
+
+        announcement.title = "Free shots moved to Saturday"
+        with patch("user.notification_utils._build_inbox_items", wraps=_build_inbox_items) as mocked_inbox:
+            announcement.save()
+            self.assertEqual(self._summary()["notifications"][0]["message"], "Free shots moved to Saturday")
+        mocked_inbox.assert_not_called()
+
+    def test_context_values_build_on_first_use_and_once_per_request(self):
+        request = RequestFactory().get("/")
+        request.user = self.member
+        request.session = self.client.session
+
+        with patch(
+            "user.context_processors.build_user_notification_summary",
+            wraps=build_user_notification_summary,
+        ) as mocked_summary:
+            context = user_notifications(request)
+            self.assertFalse(mocked_summary.called)
+            self.assertEqual(str(context["user_unread_notifications"]), "0")
+            self.assertEqual(list(user_notifications(request)["user_latest_notifications"]), [])
+        mocked_summary.assert_called_once()
+
+    def test_topbar_badge_is_rendered_with_the_unread_count(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            DogAnnouncement.objects.create(
+                title="Free anti-rabies shots",
+                content="Bring your dogs to the plaza.",
+                created_by=self.staff_user,
+            )
+
+        response = self.client.get(reverse("user:user_home"))
+
+        self.assertContains(response, 'data-unread-count="1"', html=False)
+        self.assertContains(
+            response,
+            '<span class="notification-badge" data-notification-badge>1</span>',
+            html=False,
+        )
+
+    def test_home_feed_and_notification_payload_share_one_reminder_query(self):
+        with patch(
+            "user.notification_utils._load_user_vaccination_reminders",
+            return_value=[],
+        ) as mocked_reminders:
+            response = self.client.get(reverse("user:user_home"))
+
+        self.assertEqual(response.status_code, 200)
+        mocked_reminders.assert_called_once()
@@ -0,0 +1,85 @@
+import json
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from user.notification_stream import notification_event_id, notification_stream_events
+from user.notification_utils import invalidate_user_notification_payload
+
+
+def _event_payload(chunk):
+    fields = dict(
+        line.split(": ", 1)
+        for line in chunk.decode().splitlines()
+        if line and not line.startswith(":")
+    )
+    return fields.get("id"), json.loads(fields["data"]) if "data" in fields else None
+
+
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.member = User.objects.create_user(username="streammember", password="secret123")
+        self.client.force_login(self.member)
+
+    def test_wsgi_pages_fetch_the_summary_instead_of_opening_the_stream(self):
+        response = self.client.get(reverse("user:notifications_list"))
+
+        self.assertEqual(response.context["user_notifications_stream_url"], "")
+        self.assertContains(response, 'data-stream-url=""')
+
+    def test_poll_response_skips_unchanged_summary(self):
+        response = self.client.get(reverse("user:notification_stream"))
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        event_id, payload = _event_payload(b"".join(response.streaming_content))
+        self.assertEqual(event_id, notification_event_id(self.member.id))
+        self.assertEqual(payload["unread_count"], 0)
+
+        response = self.client.get(reverse("user:notification_stream"), HTTP_LAST_EVENT_ID=event_id)
+        self.assertEqual(_event_payload(b"".join(response.streaming_content)), (None, None))
+
+        invalidate_user_notification_payload(self.member.id)
+        response = self.client.get(reverse("user:notification_stream"), HTTP_LAST_EVENT_ID=event_id)
+        next_event_id, payload = _event_payload(b"".join(response.streaming_content))
+        self.assertNotEqual(next_event_id, event_id)
+        self.assertEqual(payload["notifications"], [])
+
+    def test_stream_pushes_summary_when_user_version_changes(self):
+        request = self.client.get(reverse("user:notification_summary")).wsgi_request
+        events = notification_stream_events(request, notification_event_id(self.member.id))
+
+        async def read_events():
+            connected = await events.__anext__()
+            invalidate_user_notification_payload(self.member.id)
+            pushed = await events.__anext__()
+            await events.aclose()
+            return connected, pushed
+
+        connected, pushed = async_to_sync(read_events)()
+        self.assertEqual(_event_payload(connected), (None, None))
+        event_id, payload = _event_payload(pushed)
+        self.assertEqual(event_id, notification_event_id(self.member.id))
+        self.assertEqual(payload["unread_count"], 0)
+
+    def test_pushed_summary_reloads_reminders_memoized_on_the_stream_request(self):
+        request = self.client.get(reverse("user:notification_summary")).wsgi_request
+        events = notification_stream_events(request, notification_event_id(self.member.id))
+
+        async def read_pushed_event():
+            await events.__anext__()
+            invalidate_user_notification_payload(self.member.id)
+            pushed = await events.__anext__()
+            await events.aclose()
+            return pushed
+
+        with patch(
+            "user.notification_utils._load_user_vaccination_reminders",
+            return_value=[],
+        ) as mocked_reminders:
+            _event_payload(async_to_sync(read_pushed_event)())
+        mocked_reminders.assert_called_once()
@@ -7,7 +7,7 @@ from django.test import Client, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
-from dogadoption_admin.models import GlobalAppointmentDate, Post, PostRequest
+from dogadoption_admin.models import GlobalAppointmentDate, Post, PostRequest, PostRequestState
 
 
 class PostRequestVerificationWindowTests(TestCase):
@@ -111,6 +111,10 @@ class PostRequestVerificationWindowTests(TestCase):
 
     def _set_created_at(self, model, obj_id, created_at):
         model.objects.filter(pk=obj_id).update(created_at=created_at)
+        if model is PostRequest:
+            PostRequestState.refresh_for_posts(
+                model.objects.filter(pk=obj_id).values_list("post_id", flat=True)
+            )
 
     def _find_item(self, items, post_id):
         return next(item for item in items if item["post"].id == post_id)
@@ -0,0 +1,191 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from dogadoption_admin.admin_notification_utils import ADMIN_EXPIRY_SYNC_CURSOR_KEY, sync_expiry_notifications
+from dogadoption_admin.models import (
+    AdminNotification,
+    AdminNotificationSyncCursor,
+    DewormingTreatmentRecord,
+    Dog,
+    DogRegistration,
+    VaccinationRecord,
+)
+from dogadoption_admin.vaccination_links import reconcile_dog_vaccination_links
+from user.notification_utils import (
+    build_user_registered_dog_vaccination_status_map,
+    build_user_vaccination_reminders,
+)
+
+
+class VaccinationMatchingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.member = User.objects.create_user(
+            username="vaxmember",
+            password="secret123",
+            first_name="Juan",
+            last_name="Dela Cruz",
+        )
+
+    def _registration(self, **overrides):
+        fields = {
+            "reg_no": "REG-1",
+            "name_of_pet": "Bantay",
+            "breed": "Aspin",
+            "color_markings": "Brown",
+            "sex": "M",
+            "status": "Intact",
+            "owner_name": "Juan Dela Cruz",
+            "address": "Poblacion",
+            "contact_no": "09170000000",
+        }
+        fields.update(overrides)
+        return DogRegistration.objects.create(**fields)
+
+    def _vaccination(self, registration, days_ago=0, expires_in=365):
+        expiry_date = timezone.localdate() + timedelta(days=expires_in)
+        return VaccinationRecord.objects.create(
+            registration=registration,
+            date=timezone.localdate() - timedelta(days=days_ago),
+            vaccine_name="Anti-rabies",
+            vaccine_expiry_date=expiry_date,
+            vaccination_expiry_date=expiry_date,
+            veterinarian="Dr. Reyes",
+        )
+
+    def _dog(self, name="Bantay"):
+        return Dog.objects.create(
+            date_registered=timezone.localdate(),
+            name=name,
+            sex="M",
+            owner_name="Juan Dela Cruz",
+            owner_name_key="juan dela cruz",
+            owner_user=self.member,
+        )
+
+    def test_name_keys_follow_saves_and_backfill_repairs_bulk_writes(self):
+        registration = self._registration(owner_name="  Juan   DELA Cruz ", name_of_pet="Bantay ")
+        self.assertEqual(
+            (registration.owner_name_key, registration.pet_name_key),
+            ("juan dela cruz", "bantay"),
+        )
+
+        registration.name_of_pet = "Brownie"
+        registration.save(update_fields=["name_of_pet"])
+        registration.refresh_from_db()
+        self.assertEqual(registration.pet_name_key, "brownie")
+
+        DogRegistration.objects.filter(pk=registration.pk).update(owner_name="Maria Santos", owner_name_key="")
+        call_command("backfill_registration_name_keys", stdout=StringIO())
+        registration.refresh_from_db()
+        self.assertEqual(registration.owner_name_key, "maria santos")
+        self.assertEqual(DogRegistration.backfill_name_keys(), 0)
+
+    def test_status_map_reads_the_linked_latest_vaccination(self):
+        dog = self._dog(name="bantay")
+        registration = self._registration(owner_name="JUAN  Dela Cruz", name_of_pet=" Bantay")
+        vaccination = self._vaccination(registration, expires_in=10)
+
+        dog.refresh_from_db()
+        self.assertEqual(list(dog.registrations.all()), [registration])
+        self.assertEqual(dog.latest_vaccination, vaccination)
+        with self.assertNumQueries(1):
+            status = build_user_registered_dog_vaccination_status_map(self.member)[dog.id]
+        self.assertEqual(status["status_key"], "due_soon")
+        self.assertEqual(status["expiry_date"], vaccination.vaccination_expiry_date)
+
+    def test_links_follow_vaccinations_renames_and_deletes(self):
+        dog = self._dog()
+        first = self._registration()
+        second = self._registration(reg_no="REG-2")
+        older = self._vaccination(first, days_ago=400)
+        newer = self._vaccination(second, days_ago=5)
+        dog.refresh_from_db()
+        self.assertEqual(dog.latest_vaccination_id, newer.id)
+
+        newer.delete()
+        dog.refresh_from_db()
+        self.assertEqual(dog.latest_vaccination_id, older.id)
+
+        first.name_of_pet = "Brownie"
+        first.save()
+        dog.refresh_from_db()
+        self.assertEqual(list(dog.registrations.all()), [second])
+        self.assertIsNone(dog.latest_vaccination_id)
+
+        DogRegistration.objects.filter(pk=first.pk).update(name_of_pet="Bantay", pet_name_key="bantay")
+        self.assertEqual(reconcile_dog_vaccination_links(), [dog.id])
+        dog.refresh_from_db()
+        self.assertEqual(dog.latest_vaccination_id, older.id)
+
+        first.delete()
+        dog.refresh_from_db()
+        self.assertIsNone(dog.latest_vaccination_id)
+        self.assertEqual(reconcile_dog_vaccination_links(), [])
+
+    def test_effective_expiry_is_the_earlier_date_and_bounds_reminders(self):
+        covered_dog = self._dog()
+        due_dog = self._dog(name="Brownie")
+        self._vaccination(self._registration())
+        registration = self._registration(reg_no="REG-2", name_of_pet="Brownie")
+        vaccination = VaccinationRecord.objects.create(
+            registration=registration,
+            date=timezone.localdate().isoformat(),
+            vaccine_name="Anti-rabies",
+            vaccine_expiry_date=(timezone.localdate() + timedelta(days=5)).isoformat(),
+            vaccination_expiry_date=(timezone.localdate() + timedelta(days=365)).isoformat(),
+            veterinarian="Dr. Reyes",
+        )
+        self.assertEqual(vaccination.effective_expiry_date, timezone.localdate() + timedelta(days=5))
+
+        vaccination.vaccine_expiry_date = timezone.localdate() - timedelta(days=1)
+        vaccination.save(update_fields=["vaccine_expiry_date"])
+        vaccination.refresh_from_db()
+        self.assertEqual(vaccination.effective_expiry_date, timezone.localdate() - timedelta(days=1))
+
+        reminders = build_user_vaccination_reminders(self.member, limit=None)
+        self.assertEqual([(row["dog_id"], row["status_key"]) for row in reminders], [(due_dog.id, "expired")])
+        self.assertNotIn(covered_dog.id, [row["dog_id"] for row in reminders])
+
+    def test_expiry_sync_catches_up_missed_days_once(self):
+        today = timezone.localdate()
+        registration = self._registration()
+        missed = self._vaccination(registration, expires_in=-10)
+        DewormingTreatmentRecord.objects.create(
+            registration=registration,
+            date=today,
+            medicine_given="Drontal",
+            medicine_expiry_date=today,
+            route="Oral",
+            frequency="Once",
+            veterinarian="Dr. Reyes",
+        )
+        self._vaccination(registration, expires_in=-40)
+        # The cursor outlives a cache flush, so days past the short lookback are still caught up.
+        AdminNotificationSyncCursor.objects.create(name="expiry", last_synced_day=today - timedelta(days=12))
+        cache.delete(ADMIN_EXPIRY_SYNC_CURSOR_KEY)
+
+        with self.assertNumQueries(6):
+            self.assertEqual(sync_expiry_notifications(today), 2)
+        self.assertEqual(
+            dict(AdminNotification.objects.values_list("event_key", "title")),
+            {
+                f"vaccination-card-expiry:{missed.id}:{missed.vaccination_expiry_date.isoformat()}": (
+                    "Vaccination card expired"
+                ),
+                f"medicine-expiry:{DewormingTreatmentRecord.objects.get().id}:{today.isoformat()}": (
+                    "Medicine expires today"
+                ),
+            },
+        )
+
+        cache.delete(ADMIN_EXPIRY_SYNC_CURSOR_KEY)
+        self.assertEqual(sync_expiry_notifications(today), 0)
+        self.assertEqual(AdminNotificationSyncCursor.objects.get(name="expiry").last_synced_day, today)
+        self.assertEqual(cache.get(ADMIN_EXPIRY_SYNC_CURSOR_KEY), today)
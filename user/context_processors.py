@@ -1,5 +1,7 @@
 from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
 from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
 
 from .auth_modal_session import (
     AUTH_MODAL_LOGIN_ERROR_SESSION_KEY,
@@ -9,7 +11,7 @@ from .auth_modal_session import (
     safe_next_url,
 )
 from .avatar_cache import DEFAULT_AVATAR_URL, get_cached_profile_avatar_url
-from .notification_utils import build_user_notification_summary
+from .notification_utils import _request_memo, build_user_notification_summary
 
 
 def _empty_user_notifications_context():
@@ -18,6 +20,7 @@ def _empty_user_notifications_context():
         "user_latest_notifications": [],
         "user_notifications_seen_url": "",
         "user_notifications_summary_url": "",
+        "user_notifications_stream_url": "",
         "user_notification_mark_read_url": "",
         "user_topbar_avatar_url": DEFAULT_AVATAR_URL,
     }
@@ -28,14 +31,25 @@ def user_notifications(request):
     if not user or not user.is_authenticated or user.is_staff:
         return _empty_user_notifications_context()
 
-    summary = build_user_notification_summary(request)
+    # Lazy values: pages that never use them skip building them, and the summary is built at
+    # most once per request. base.html renders the badge count; the fetch or stream only updates it.
+    summary = SimpleLazyObject(
+        lambda: _request_memo(request, "notification_summary", lambda: build_user_notification_summary(request))
+    )
     return {
-        "user_unread_notifications": summary["unread_count"],
-        "user_latest_notifications": summary["notifications"],
+        "user_unread_notifications": SimpleLazyObject(lambda: summary["unread_count"]),
+        "user_latest_notifications": SimpleLazyObject(lambda: summary["notifications"]),
         "user_notifications_seen_url": reverse("user:mark_notifications_seen"),
         "user_notifications_summary_url": reverse("user:notification_summary"),
+        # Only an ASGI server can hold the stream open; under WSGI the topbar fetches
+        # the summary on page load and when the dropdown opens instead.
+        "user_notifications_stream_url": (
+            reverse("user:notification_stream") if isinstance(request, ASGIRequest) else ""
+        ),
         "user_notification_mark_read_url": reverse("user:mark_notification_read"),
-        "user_topbar_avatar_url": get_cached_profile_avatar_url(user),
+        "user_topbar_avatar_url": SimpleLazyObject(
+            lambda: _request_memo(request, "topbar_avatar_url", lambda: get_cached_profile_avatar_url(user))
+        ),
     }
 
 
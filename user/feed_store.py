@@ -0,0 +1,303 @@
+"""Incrementally maintained candidate pools for the public home feed.
+
+Each feed type keeps one cached pool of candidate rows ordered newest first.
+Model signals (see ``user.signals``) patch a pool in place once the write
+commits, so a write edits a single entry instead of forcing every feed token
+and viewer to re-scan the listing tables. Every patch also moves the pool's
+stamp; a cold rebuild that started before the patch sees the stamp change and
+does not cache its (now stale) rows.
+
+Pool rows are plain tuples ``(created_ts, id, owner_id, closes_ts)``.
+``closes_ts`` is only set for admin rescue posts and marks the end of the
+claim/adopt window, which lets readers drop closed posts without loading them.
+
+Hydrated feed cards are cached per entity as well. A card only holds the
+viewer- and time-independent fields, and the same signals delete it whenever
+the listing, its images or its request rows change.
+
+Sampled feed orderings are cached as ``PackedFeedRows``: one ``array('I')`` of
+ids plus one type-code byte per row, instead of a list of row dicts.
+"""
+import bisect
+import uuid
+from array import array
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from dogadoption_admin.models import DogAnnouncement, Post, PostRequest
+
+from .models import MissingDogPost, UserAdoptionPost
+
+
+FEED_POOL_TYPES = ("admin", "announcement", "user", "missing")
+FEED_TYPE_CODES = {feed_type: code for code, feed_type in enumerate(FEED_POOL_TYPES)}
+FEED_POOL_CANDIDATE_LIMITS = {
+    "admin": 700,
+    "announcement": 300,
+    "user": 400,
+    "missing": 300,
+}
+FEED_POOL_CACHE_KEY = "user_home_feed_pool_v1:{feed_type}"
+FEED_POOL_LOCK_KEY = "user_home_feed_pool_lock_v1:{feed_type}"
+FEED_POOL_STAMP_KEY = "user_home_feed_pool_stamp_v1:{feed_type}"
+# Pools are patched by signals; the TTL only bounds drift from bulk ``update()`` calls.
+FEED_POOL_TTL_SECONDS = 60 * 60 * 6
+FEED_POOL_LOCK_TIMEOUT_SECONDS = 5
+CLOSED_POST_STATUSES = ("reunited", "adopted")
+# Author names and avatars are not tracked by signals; the TTL bounds how stale they get.
+FEED_CARD_CACHE_KEY = "user_home_feed_card_v1:{feed_type}:{entity_id}"
+FEED_CARD_TTL_SECONDS = 60 * 10
+# Saves limited to these fields cannot change admin pool membership.
+ADMIN_POOL_IRRELEVANT_FIELDS = frozenset({"view_count", "is_pinned", "pinned_at"})
+
+
+class PackedFeedRows:
+    """
+    Read-only sequence of ``{"id", "feed_type"}`` rows backed by packed arrays.
+
+    Indexing and slicing build row dicts on demand, so a ``Paginator`` only
+    materializes the rows of the page it serves.
+    """
+
+    __slots__ = ("ids", "type_codes")
+
+    def __init__(self, ids=(), type_codes=b""):
+        self.ids = ids if isinstance(ids, array) else array("I", ids)
+        self.type_codes = bytes(type_codes)
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Pack ``(feed_type, id)`` pairs, keeping their order."""
+        ids = array("I")
+        type_codes = bytearray()
+        for feed_type, entity_id in pairs:
+            ids.append(entity_id)
+            type_codes.append(FEED_TYPE_CODES[feed_type])
+        return cls(ids, type_codes)
+
+    def __reduce__(self):
+        return (self.__class__, (self.ids, self.type_codes))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _row(self, index):
+        return {"id": self.ids[index], "feed_type": FEED_POOL_TYPES[self.type_codes[index]]}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(position) for position in range(*index.indices(len(self.ids)))]
+        return self._row(index)
+
+    def __iter__(self):
+        for entity_id, code in zip(self.ids, self.type_codes):
+            yield {"id": entity_id, "feed_type": FEED_POOL_TYPES[code]}
+
+    def without(self, excluded_ids):
+        """Copy without the rows whose id is in ``excluded_ids[feed_type]``."""
+        excluded_by_code = {
+            FEED_TYPE_CODES[feed_type]: ids for feed_type, ids in excluded_ids.items()
+        }
+        ids = array("I")
+        type_codes = bytearray()
+        for entity_id, code in zip(self.ids, self.type_codes):
+            if entity_id in excluded_by_code.get(code, ()):
+                continue
+            ids.append(entity_id)
+            type_codes.append(code)
+        return PackedFeedRows(ids, type_codes)
+
+
+def _pool_cache_key(feed_type):
+    return FEED_POOL_CACHE_KEY.format(feed_type=feed_type)
+
+
+def _pool_sort_key(row):
+    return (-row[0], -row[1])
+
+
+def _timestamp(dt):
+    return dt.timestamp() if dt else 0.0
+
+
+def _admin_pool_row(post):
+    closes_at = post.phase_closes_at()
+    return (
+        _timestamp(post.created_at),
+        post.id,
+        post.user_id,
+        closes_at.timestamp() if closes_at else None,
+    )
+
+
+def _accepted_post_requests():
+    return PostRequest.objects.filter(
+        post_id=OuterRef("pk"),
+        status="accepted",
+        request_type__in=["claim", "adopt"],
+    )
+
+
+def _build_admin_pool():
+    return [
+        (_timestamp(created_at), post_id, owner_id, phase_ends_at.timestamp())
+        for post_id, owner_id, created_at, phase_ends_at in Post.objects.filter(
+            is_history=False,
+            phase_ends_at__gte=timezone.now(),
+        )
+        .exclude(status__in=CLOSED_POST_STATUSES)
+        .filter(~Exists(_accepted_post_requests()))
+        .order_by("-created_at", "-id")
+        .values_list("id", "user_id", "created_at", "phase_ends_at")[:FEED_POOL_CANDIDATE_LIMITS["admin"]]
+    ]
+
+
+def _build_recent_pool(base_qs, owner_field, limit):
+    return [
+        (_timestamp(created_at), entity_id, owner_id, None)
+        for entity_id, owner_id, created_at in base_qs.order_by("-created_at", "-id")
+        .values_list("id", owner_field, "created_at")[:limit]
+    ]
+
+
+def _build_pool(feed_type):
+    limit = FEED_POOL_CANDIDATE_LIMITS[feed_type]
+    if feed_type == "admin":
+        return _build_admin_pool()
+    if feed_type == "announcement":
+        return _build_recent_pool(DogAnnouncement.objects.all(), "created_by_id", limit)
+    if feed_type == "user":
+        return _build_recent_pool(
+            UserAdoptionPost.objects.filter(status="available"), "owner_id", limit
+        )
+    return _build_recent_pool(
+        MissingDogPost.objects.filter(status="missing"), "owner_id", limit
+    )
+
+
+def _pool_stamp_key(feed_type):
+    return FEED_POOL_STAMP_KEY.format(feed_type=feed_type)
+
+
+def get_feed_candidate_pools(feed_types=FEED_POOL_TYPES):
+    """Return ``{feed_type: rows}``, cold-building only the pools missing from cache."""
+    cache_keys = {feed_type: _pool_cache_key(feed_type) for feed_type in feed_types}
+    cached = cache.get_many(list(cache_keys.values()))
+
+    pools = {}
+    for feed_type, cache_key in cache_keys.items():
+        rows = cached.get(cache_key)
+        if rows is None:
+            stamp_key = _pool_stamp_key(feed_type)
+            stamp = cache.get(stamp_key)
+            rows = _build_pool(feed_type)
+            # A patch that landed mid-build moved the stamp; serve these rows but do not cache them.
+            # ``add`` also keeps a pool another process stored (and maybe patched) meanwhile.
+            if cache.get(stamp_key) == stamp:
+                cache.add(cache_key, rows, FEED_POOL_TTL_SECONDS)
+        pools[feed_type] = rows
+    return pools
+
+
+def pool_candidate_ids(rows, *, now=None):
+    """Ids from one pool that are still live, newest first."""
+    now_ts = (now or timezone.now()).timestamp()
+    return [
+        entity_id
+        for _created_ts, entity_id, _owner_id, closes_ts in rows
+        if closes_ts is None or closes_ts >= now_ts
+    ]
+
+
+def _patch_pool(feed_type, entity_id, row=None):
+    """Replace (or drop, when ``row`` is None) one entry in a cached pool after commit."""
+    # A rolled-back write never reaches the pool.
+    transaction.on_commit(partial(_apply_pool_patch, feed_type, entity_id, row))
+
+
+def _apply_pool_patch(feed_type, entity_id, row):
+    cache_key = _pool_cache_key(feed_type)
+    lock_key = FEED_POOL_LOCK_KEY.format(feed_type=feed_type)
+    cache.set(_pool_stamp_key(feed_type), uuid.uuid4().hex, None)
+    if not cache.add(lock_key, 1, FEED_POOL_LOCK_TIMEOUT_SECONDS):
+        # Another writer is mid-patch; dropping the pool is always safe.
+        cache.delete(cache_key)
+        return
+    try:
+        rows = cache.get(cache_key)
+        if rows is None:
+            return
+        limit = FEED_POOL_CANDIDATE_LIMITS[feed_type]
+        was_full = len(rows) >= limit
+        rows = [existing for existing in rows if existing[1] != entity_id]
+        if row is not None:
+            bisect.insort(rows, row, key=_pool_sort_key)
+            del rows[limit:]
+        if was_full and len(rows) < limit:
+            # The next-oldest listing is not in the pool; let the next read rebuild a full one.
+            cache.delete(cache_key)
+            return
+        cache.set(cache_key, rows, FEED_POOL_TTL_SECONDS)
+    finally:
+        cache.delete(lock_key)
+
+
+def sync_admin_post_pool_entry(post):
+    if not post or not post.pk:
+        return
+    row = None
+    if not post.is_history and post.status not in CLOSED_POST_STATUSES:
+        candidate = _admin_pool_row(post)
+        if candidate[3] is not None and candidate[3] >= timezone.now().timestamp():
+            has_accepted_request = PostRequest.objects.filter(
+                post_id=post.pk,
+                status="accepted",
+                request_type__in=["claim", "adopt"],
+            ).exists()
+            if not has_accepted_request:
+                row = candidate
+    _patch_pool("admin", post.pk, row)
+
+
+def resync_admin_post_pool_entry(post_id):
+    post = Post.objects.filter(pk=post_id).only(
+        "id",
+        "user_id",
+        "created_at",
+        "status",
+        "is_history",
+        "claim_days",
+        "phase_override",
+        "phase_override_started_at",
+    ).first()
+    if post is None:
+        discard_feed_pool_entry("admin", post_id)
+        return
+    sync_admin_post_pool_entry(post)
+
+
+def sync_recent_pool_entry(feed_type, instance, *, owner_id, is_live):
+    row = None
+    if is_live:
+        row = (_timestamp(instance.created_at), instance.pk, owner_id, None)
+    _patch_pool(feed_type, instance.pk, row)
+
+
+def discard_feed_pool_entry(feed_type, entity_id):
+    _patch_pool(feed_type, entity_id, None)
+
+
+def feed_card_cache_key(feed_type, entity_id):
+    return FEED_CARD_CACHE_KEY.format(feed_type=feed_type, entity_id=entity_id)
+
+
+def invalidate_feed_card(feed_type, entity_id):
+    transaction.on_commit(partial(cache.delete, feed_card_cache_key(feed_type, entity_id)))
+
+
+def invalidate_feed_candidate_pools():
+    cache.delete_many([_pool_cache_key(feed_type) for feed_type in FEED_POOL_TYPES])
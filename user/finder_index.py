@@ -0,0 +1,255 @@
+"""Per-process facet index behind the rescue finder filters.
+
+Every open rescue post and available community listing gets a bit slot. Each
+facet value (breed, age, size, gender, coat, color, location) keeps one
+integer bitset of the slots carrying it, so a filter is an AND of bitsets and
+a match score is a popcount-style sum across the selected facets.
+
+Writes do not rebuild the index. Signals in ``user.signals`` append the
+changed listing to a short change log in the cache; each process replays the
+entries it has not seen and reloads only those listings. It falls back to a
+full rebuild when the log has gaps or the cache was cleared.
+"""
+import threading
+import time
+
+from django.core.cache import cache
+
+from dogadoption_admin.models import Post
+
+from .models import UserAdoptionPost
+
+
+FINDER_KINDS = ("staff", "user")
+FINDER_FACET_KEYS = (
+    "breed",
+    "age_group",
+    "size_group",
+    "gender",
+    "coat_length",
+    "color",
+    "location",
+)
+FINDER_SCALAR_FACETS = ("breed", "age_group", "size_group", "gender", "coat_length")
+FINDER_INDEX_SEQUENCE_KEY = "user_finder_index_seq_v1"
+FINDER_INDEX_CHANGE_KEY = "user_finder_index_change_v1:{sequence}"
+FINDER_INDEX_CHANGE_TTL_SECONDS = 60 * 60 * 6
+# Replaying more entries than this costs about as much as a rebuild.
+FINDER_INDEX_MAX_REPLAY = 200
+# Saves limited to these fields cannot change a listing's facets or membership.
+FINDER_INDEX_IRRELEVANT_FIELDS = frozenset({"view_count", "is_pinned", "pinned_at"})
+FINDER_FACET_FIELDS = ("id", *FINDER_SCALAR_FACETS, "colors", "location")
+
+_finder_state = {"sequence": None, "index": None}
+_finder_lock = threading.Lock()
+
+
+def normalize_finder_location(value):
+    return " ".join((value or "").split()).casefold()
+
+
+def _facet_values(row):
+    """``(facet, value)`` pairs for one ``FINDER_FACET_FIELDS`` row."""
+    values = []
+    for key, value in zip(FINDER_SCALAR_FACETS, row[1:6]):
+        if value:
+            values.append((key, value))
+    raw_colors = row[6] or []
+    if isinstance(raw_colors, str):
+        raw_colors = [raw_colors]
+    values.extend(("color", color) for color in raw_colors if color)
+    location = normalize_finder_location(row[7])
+    if location:
+        values.append(("location", location))
+    return values
+
+
+class FinderFacetIndex:
+    """Slot-per-listing bitsets for each facet value, plus one population bitset per kind."""
+
+    __slots__ = ("_slots", "_docs", "_free_slots", "_facets", "_populations")
+
+    def __init__(self):
+        self._slots = {}
+        # slot -> (kind, id, facet pairs), or None once the slot is freed.
+        self._docs = []
+        self._free_slots = []
+        self._facets = {key: {} for key in FINDER_FACET_KEYS}
+        self._populations = {kind: 0 for kind in FINDER_KINDS}
+
+    def __len__(self):
+        return len(self._slots)
+
+    def upsert(self, kind, entity_id, facet_values):
+        self.remove(kind, entity_id)
+        slot = self._free_slots.pop() if self._free_slots else len(self._docs)
+        if slot == len(self._docs):
+            self._docs.append(None)
+        bit = 1 << slot
+        facet_values = tuple(facet_values)
+        for key, value in facet_values:
+            facet = self._facets[key]
+            facet[value] = facet.get(value, 0) | bit
+        self._populations[kind] |= bit
+        self._docs[slot] = (kind, entity_id, facet_values)
+        self._slots[(kind, entity_id)] = slot
+
+    def remove(self, kind, entity_id):
+        slot = self._slots.pop((kind, entity_id), None)
+        if slot is None:
+            return
+        mask = ~(1 << slot)
+        for key, value in self._docs[slot][2]:
+            facet = self._facets[key]
+            remaining = facet[value] & mask
+            if remaining:
+                facet[value] = remaining
+            else:
+                del facet[value]
+        self._populations[kind] &= mask
+        self._docs[slot] = None
+        self._free_slots.append(slot)
+
+    def _filter_bitsets(self, selected_filters):
+        bitsets = []
+        for key, value in selected_filters.items():
+            if not value or key not in self._facets:
+                continue
+            if key == "location":
+                value = normalize_finder_location(value)
+            bitsets.append(self._facets[key].get(value, 0))
+        return bitsets
+
+    def _slot_ids(self, bits):
+        ids = []
+        while bits:
+            low_bit = bits & -bits
+            ids.append(self._docs[low_bit.bit_length() - 1][1])
+            bits ^= low_bit
+        return ids
+
+    def matching_ids(self, kind, selected_filters):
+        """Ids of ``kind`` listings that match every selected filter."""
+        bits = self._populations[kind]
+        for bitset in self._filter_bitsets(selected_filters):
+            bits &= bitset
+        return set(self._slot_ids(bits))
+
+    def match_scores(self, kind, selected_filters):
+        """``{id: number of selected filters matched}`` for ``kind`` listings scoring above zero."""
+        population = self._populations[kind]
+        # Bit-sliced counter: planes[i] holds bit i of every slot's running score.
+        planes = []
+        for bitset in self._filter_bitsets(selected_filters):
+            carry = bitset & population
+            for index, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[index], carry = plane ^ carry, plane & carry
+            if carry:
+                planes.append(carry)
+
+        scores = {}
+        scored_bits = 0
+        for plane in planes:
+            scored_bits |= plane
+        while scored_bits:
+            low_bit = scored_bits & -scored_bits
+            scores[self._docs[low_bit.bit_length() - 1][1]] = sum(
+                1 << index for index, plane in enumerate(planes) if plane & low_bit
+            )
+            scored_bits ^= low_bit
+        return scores
+
+
+def _open_staff_posts():
+    return Post.objects.filter(is_history=False, status__in=["rescued", "under_care"])
+
+
+def _available_user_posts():
+    return UserAdoptionPost.objects.filter(status="available")
+
+
+def finder_querysets():
+    return {"staff": _open_staff_posts(), "user": _available_user_posts()}
+
+
+def _build_finder_index():
+    index = FinderFacetIndex()
+    for kind, queryset in finder_querysets().items():
+        for row in queryset.order_by("pk").values_list(*FINDER_FACET_FIELDS).iterator(chunk_size=1000):
+            index.upsert(kind, row[0], _facet_values(row))
+    return index
+
+
+def _replay_changes(index, changes):
+    ids_by_kind = {kind: set() for kind in FINDER_KINDS}
+    for kind, entity_id in changes:
+        ids_by_kind[kind].add(entity_id)
+    for kind, queryset in finder_querysets().items():
+        changed_ids = ids_by_kind[kind]
+        if not changed_ids:
+            continue
+        for row in queryset.filter(pk__in=changed_ids).values_list(*FINDER_FACET_FIELDS):
+            index.upsert(kind, row[0], _facet_values(row))
+            changed_ids.discard(row[0])
+        for entity_id in changed_ids:
+            index.remove(kind, entity_id)
+
+
+def pending_finder_changes(last_sequence, sequence):
+    """Change entries after ``last_sequence``, or None when they cannot all be replayed."""
+    if last_sequence is None or sequence is None or sequence < last_sequence:
+        return None
+    if sequence - last_sequence > FINDER_INDEX_MAX_REPLAY:
+        return None
+    keys = [
+        FINDER_INDEX_CHANGE_KEY.format(sequence=position)
+        for position in range(last_sequence + 1, sequence + 1)
+    ]
+    entries = cache.get_many(keys)
+    if len(entries) != len(keys):
+        return None
+    return [entries[key] for key in keys]
+
+
+def finder_change_sequence():
+    sequence = cache.get(FINDER_INDEX_SEQUENCE_KEY)
+    if sequence is None:
+        # Seed from the clock so an index built before the log was lost never looks current.
+        cache.add(FINDER_INDEX_SEQUENCE_KEY, time.time_ns() // 1000, None)
+        sequence = cache.get(FINDER_INDEX_SEQUENCE_KEY)
+    return sequence
+
+
+def get_finder_index():
+    sequence = finder_change_sequence()
+    if _finder_state["index"] is not None and _finder_state["sequence"] == sequence:
+        return _finder_state["index"]
+    with _finder_lock:
+        if _finder_state["index"] is not None and _finder_state["sequence"] == sequence:
+            return _finder_state["index"]
+        changes = None
+        if _finder_state["index"] is not None:
+            changes = pending_finder_changes(_finder_state["sequence"], sequence)
+        if changes is None:
+            _finder_state["index"] = _build_finder_index()
+        else:
+            _replay_changes(_finder_state["index"], changes)
+        _finder_state["sequence"] = sequence
+        return _finder_state["index"]
+
+
+def record_finder_change(kind, entity_id):
+    """Append one listing to the change log that every process replays."""
+    try:
+        sequence = cache.incr(FINDER_INDEX_SEQUENCE_KEY)
+    except ValueError:
+        # Restart from the clock so a process never mistakes a reset log for its own position.
+        cache.add(FINDER_INDEX_SEQUENCE_KEY, time.time_ns() // 1000, None)
+        sequence = cache.incr(FINDER_INDEX_SEQUENCE_KEY)
+    cache.set(
+        FINDER_INDEX_CHANGE_KEY.format(sequence=sequence),
+        (kind, entity_id),
+        FINDER_INDEX_CHANGE_TTL_SECONDS,
+    )
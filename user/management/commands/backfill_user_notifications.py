@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from user.notification_inbox import backfill_user_notifications
+
+
+class Command(BaseCommand):
+    help = "Seed member notification inboxes from existing announcements, posts and requests."
+
+    def handle(self, *args, **options):
+        counts = backfill_user_notifications()
+        summary = ", ".join(f"{kind}: {count}" for kind, count in counts.items()) or "nothing to copy"
+        self.stdout.write(self.style.SUCCESS(f"User notifications backfilled ({summary})."))
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from user.notification_inbox import fan_out_pending_broadcasts
+
+
+class Command(BaseCommand):
+    help = "Copy queued announcement and listing broadcasts into member notification inboxes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep running, checking the queue every --interval seconds.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=15,
+            help="Seconds to wait between queue checks with --loop (default: 15).",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent = fan_out_pending_broadcasts()
+            if sent:
+                self.stdout.write(self.style.SUCCESS(f"Fanned out {sent} broadcast notification(s)."))
+            elif not options["loop"]:
+                self.stdout.write("No broadcast notifications were queued.")
+
+            if not options["loop"]:
+                return
+            close_old_connections()
+            time.sleep(max(options["interval"], 1))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from user.search_index import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the home search token index for every feed listing."
+
+    def handle(self, *args, **options):
+        indexed = rebuild_search_index()
+        summary = ", ".join(f"{feed_type}: {count}" for feed_type, count in indexed.items())
+        self.stdout.write(self.style.SUCCESS(f"Feed search index rebuilt ({summary})."))
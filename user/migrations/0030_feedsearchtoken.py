@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0029_image_optimizer_derivatives'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('feed_type', models.CharField(choices=[('admin', 'Rescue Post'), ('announcement', 'Announcement'), ('user', 'Community Adoption Post'), ('missing', 'Missing Dog Post')], max_length=16)),
+                ('entity_id', models.PositiveIntegerField()),
+                ('token', models.CharField(max_length=40)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+            ],
+            options={
+                'db_table': 'user_feedsearchtoken',
+                'indexes': [models.Index(fields=['feed_type', 'token'], name='feedsearch_type_token_idx')],
+                'constraints': [models.UniqueConstraint(fields=('feed_type', 'entity_id', 'token'), name='feedsearch_entity_token_uniq')],
+            },
+        ),
+    ]
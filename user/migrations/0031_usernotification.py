@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0030_feedsearchtoken'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('incoming_user_request', 'Incoming adoption request'), ('accepted_request', 'Request accepted'), ('announcement', 'Announcement'), ('admin_post', 'Rescue post'), ('community_post', 'Community post')], max_length=32)),
+                ('key', models.CharField(max_length=80)),
+                ('title', models.CharField(max_length=120)),
+                ('message', models.CharField(blank=True, default='', max_length=255)),
+                ('url', models.CharField(max_length=500)),
+                ('created_at', models.DateTimeField()),
+                ('read_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inbox_notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', '-created_at'], name='usernotif_user_created_idx'), models.Index(fields=['key'], name='usernotif_key_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='usernotification_user_key_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def copy_profile_read_keys(apps, schema_editor):
+    Profile = apps.get_model("user", "Profile")
+    NotificationReadMarker = apps.get_model("user", "NotificationReadMarker")
+
+    now = timezone.now()
+    markers = []
+    for user_id, read_keys in Profile.objects.values_list("user_id", "notification_read_keys").iterator():
+        if not isinstance(read_keys, list):
+            continue
+        for key in {key.strip() for key in read_keys if isinstance(key, str) and key.strip()}:
+            markers.append(NotificationReadMarker(user_id=user_id, key=key[:80], read_at=now))
+    NotificationReadMarker.objects.bulk_create(markers, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('user', '0031_usernotification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationReadWatermark',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_read_watermark', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('read_through', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='NotificationReadMarker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=80)),
+                ('read_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_read_markers', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='notifreadmarker_user_key_uniq')],
+            },
+        ),
+        migrations.RunPython(copy_profile_read_keys, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='profile',
+            name='notification_read_keys',
+        ),
+    ]
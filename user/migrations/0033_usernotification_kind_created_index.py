@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0032_notification_read_markers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usernotification',
+            index=models.Index(fields=['kind', 'created_at'], name='usernotif_kind_created_idx'),
+        ),
+    ]
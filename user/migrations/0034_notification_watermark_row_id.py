@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:28
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+
+
+def watermark_times_to_row_ids(apps, schema_editor):
+    NotificationReadWatermark = apps.get_model("user", "NotificationReadWatermark")
+    UserNotification = apps.get_model("user", "UserNotification")
+
+    NotificationReadWatermark.objects.update(
+        read_through_notification_id=Subquery(
+            UserNotification.objects.filter(
+                user_id=OuterRef("user_id"),
+                created_at__lte=OuterRef("read_through"),
+            )
+            .order_by()
+            .values("user_id")
+            .annotate(last_id=Max("id"))
+            .values("last_id")[:1]
+        )
+    )
+    NotificationReadWatermark.objects.filter(read_through_notification_id__isnull=True).update(
+        read_through_notification_id=0
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0033_usernotification_kind_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationreadwatermark',
+            name='read_through_notification_id',
+            field=models.PositiveBigIntegerField(null=True, default=0),
+        ),
+        migrations.RunPython(watermark_times_to_row_ids, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='notificationreadwatermark',
+            name='read_through_notification_id',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RemoveField(
+            model_name='notificationreadwatermark',
+            name='read_through',
+        ),
+    ]
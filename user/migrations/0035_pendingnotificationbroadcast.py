@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0034_notification_watermark_row_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingNotificationBroadcast',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('incoming_user_request', 'Incoming adoption request'), ('accepted_request', 'Request accepted'), ('announcement', 'Announcement'), ('admin_post', 'Rescue post'), ('community_post', 'Community post')], max_length=32)),
+                ('key', models.CharField(max_length=80, unique=True)),
+                ('title', models.CharField(max_length=120)),
+                ('message', models.CharField(blank=True, default='', max_length=255)),
+                ('url', models.CharField(max_length=500)),
+                ('created_at', models.DateTimeField()),
+                ('exclude_user_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('queued_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
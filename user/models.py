@@ -17,7 +17,6 @@ class Profile(models.Model):
     age = models.IntegerField()
     consent_given = models.BooleanField(default=False)
     email_verified = models.BooleanField(default=True)
-    notification_read_keys = models.JSONField(default=list, blank=True)
     phone_number = models.CharField(max_length=20, blank=True)
     facebook_url = models.URLField(blank=True)
     profile_image = models.ImageField(
@@ -708,3 +707,114 @@ class DogSighting(models.Model):
 
     def __str__(self):
         return f"Sighting of {self.post.dog_name} by {self.reporter.username} ({self.status})"
+
+
+class FeedSearchToken(models.Model):
+    """One normalized word of a searchable feed listing; maintained by ``user.search_index``."""
+    FEED_TYPE_CHOICES = [
+        ("admin", "Rescue Post"),
+        ("announcement", "Announcement"),
+        ("user", "Community Adoption Post"),
+        ("missing", "Missing Dog Post"),
+    ]
+
+    feed_type = models.CharField(max_length=16, choices=FEED_TYPE_CHOICES)
+    entity_id = models.PositiveIntegerField()
+    token = models.CharField(max_length=40)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["feed_type", "entity_id", "token"],
+                name="feedsearch_entity_token_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["feed_type", "token"], name="feedsearch_type_token_idx"),
+        ]
+        db_table = "user_feedsearchtoken"
+
+    def __str__(self):
+        return f"{self.feed_type}:{self.entity_id} {self.token}"
+
+
+class UserNotification(models.Model):
+    """One bell entry for one member, written when its event happens (see ``user.notification_inbox``)."""
+    KIND_CHOICES = [
+        ("incoming_user_request", "Incoming adoption request"),
+        ("accepted_request", "Request accepted"),
+        ("announcement", "Announcement"),
+        ("admin_post", "Rescue post"),
+        ("community_post", "Community post"),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="inbox_notifications")
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    key = models.CharField(max_length=80)
+    title = models.CharField(max_length=120)
+    message = models.CharField(max_length=255, blank=True, default="")
+    url = models.CharField(max_length=500)
+    created_at = models.DateTimeField()
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="usernotification_user_key_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="usernotif_user_created_idx"),
+            models.Index(fields=["key"], name="usernotif_key_idx"),
+            models.Index(fields=["kind", "created_at"], name="usernotif_kind_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key}"
+
+
+class PendingNotificationBroadcast(models.Model):
+    """A broadcast queued on commit; ``fan_out_pending_broadcasts`` copies it into every inbox."""
+    kind = models.CharField(max_length=32, choices=UserNotification.KIND_CHOICES)
+    key = models.CharField(max_length=80, unique=True)
+    title = models.CharField(max_length=120)
+    message = models.CharField(max_length=255, blank=True, default="")
+    url = models.CharField(max_length=500)
+    created_at = models.DateTimeField()
+    exclude_user_id = models.PositiveIntegerField(null=True, blank=True)
+    queued_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.key
+
+
+class NotificationReadMarker(models.Model):
+    """One notification key a member has read; inserted once and never rewritten."""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="notification_read_markers")
+    key = models.CharField(max_length=80)
+    read_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="notifreadmarker_user_key_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key}"
+
+
+class NotificationReadWatermark(models.Model):
+    """Inbox rows with an id up to ``read_through_notification_id`` count as read for this member.
+
+    Ids follow insertion order, unlike ``created_at`` (the event time), so rows
+    written after a mark-all-seen stay unread even when their event is older.
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="notification_read_watermark",
+    )
+    read_through_notification_id = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id} read through notification {self.read_through_notification_id}"
@@ -0,0 +1,327 @@
+"""Fan-out-on-write inbox behind the member notification bell.
+
+Events write their ``UserNotification`` rows when they happen: request
+updates write one row for the member concerned, while announcements, rescue
+posts and community listings insert a row for every member in batches. The
+bell, the notifications page and ``open_notification`` then read one indexed
+query per member, and read state lives on the row. Each broadcast also prunes
+broadcast rows older than ``USER_NOTIFICATION_BROADCAST_RETENTION``, so
+inboxes do not grow by one row per member for every post ever published.
+
+Broadcasts are queued as ``PendingNotificationBroadcast`` rows once the save
+commits, and ``manage.py fan_out_user_notifications --loop`` copies them into
+inboxes outside the request. With ``USER_NOTIFICATION_FANOUT_INLINE`` set
+(the default under ``DEBUG``) the queue is drained right after the commit.
+
+Receivers in ``user.signals`` call the writers below. Run
+``manage.py backfill_user_notifications`` once to seed inboxes from the data
+that existed before the table.
+"""
+from datetime import timedelta
+from functools import partial
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from dogadoption_admin.models import DogAnnouncement, Post, PostRequest
+
+from .models import (
+    NotificationReadMarker,
+    PendingNotificationBroadcast,
+    UserAdoptionPost,
+    UserAdoptionRequest,
+    UserNotification,
+)
+from .notification_utils import (
+    invalidate_user_notification_content,
+    invalidate_user_notification_payload,
+    invalidate_user_notification_shared_content,
+    load_request_reviewed_at_map,
+)
+
+
+USER_NOTIFICATION_FANOUT_BATCH_SIZE = 1000
+# How many of the newest broadcasts ``backfill_user_notifications`` copies into each inbox.
+USER_NOTIFICATION_BACKFILL_BROADCAST_LIMITS = {
+    "announcement": 2,
+    "admin_post": 2,
+    "community_post": 3,
+}
+# Kinds written to every member; request notifications stay until their request changes.
+USER_NOTIFICATION_BROADCAST_KINDS = ("announcement", "admin_post", "community_post")
+USER_NOTIFICATION_BROADCAST_RETENTION = timedelta(days=30)
+_CONTENT_FIELDS = ("title", "message", "url")
+# Keys match what the bell used before the table existed, so stored read keys still apply.
+USER_NOTIFICATION_KEY_FORMATS = {
+    "announcement": "announcement-{id}",
+    "admin_post": "admin-post-{id}",
+    "community_post": "community-post-{id}",
+    "incoming_user_request": "incoming-user-request-{id}",
+    "accepted_request": "accepted-request-{id}",
+}
+
+
+def notification_key(kind, entity_id):
+    return USER_NOTIFICATION_KEY_FORMATS[kind].format(id=entity_id)
+
+
+def _clip(value, field_name):
+    return (value or "")[:UserNotification._meta.get_field(field_name).max_length]
+
+
+def _notification(kind, entity_id, title, message, url, created_at):
+    return {
+        "kind": kind,
+        "key": notification_key(kind, entity_id),
+        "title": _clip(title, "title"),
+        "message": _clip(message, "message"),
+        "url": _clip(url, "url"),
+        "created_at": created_at or timezone.now(),
+    }
+
+
+def announcement_notification(announcement):
+    content_preview = strip_tags(announcement.content or "").strip()
+    if len(content_preview) > 90:
+        content_preview = f"{content_preview[:87].rstrip()}..."
+    return _notification(
+        "announcement",
+        announcement.id,
+        "New update from admin staff",
+        announcement.title or content_preview or "New official announcement.",
+        reverse("user:announcement_detail", args=[announcement.id]),
+        announcement.created_at,
+    )
+
+
+def admin_post_notification(post):
+    message = strip_tags(post.caption or "").strip()[:90]
+    return _notification(
+        "admin_post",
+        post.id,
+        "New admin dog post",
+        message or "A rescued dog post was published by the admin staff.",
+        reverse("user:post_detail", args=[post.id]),
+        post.created_at,
+    )
+
+
+def community_post_notification(post):
+    location = f" in {post.location}" if post.location else ""
+    return _notification(
+        "community_post",
+        post.id,
+        "Random community post",
+        f"{post.owner.username} posted {post.dog_name}{location}.",
+        reverse("user:user_home"),
+        post.created_at,
+    )
+
+
+def incoming_request_notification(req):
+    dog_name = (req.post.dog_name or "this dog").strip() or "this dog"
+    return _notification(
+        "incoming_user_request",
+        req.id,
+        "New adoption request",
+        f"{req.requester.username} wants to adopt {dog_name}.",
+        reverse("user:user_adoption_requests"),
+        req.created_at,
+    )
+
+
+def accepted_request_notification(req, reviewed_at=None):
+    label = "Claim request accepted" if req.request_type == "claim" else "Adoption request accepted"
+    destination = reverse("user:my_redemptions") if req.request_type == "claim" else reverse("user:adopt_status")
+    schedule_text = (
+        f" Appointment: {req.scheduled_appointment_date.strftime('%b %d, %Y')}."
+        if req.scheduled_appointment_date
+        else ""
+    )
+    return _notification(
+        "accepted_request",
+        req.id,
+        label,
+        f"{strip_tags(req.post.caption)[:72]}{schedule_text}",
+        destination,
+        reviewed_at,
+    )
+
+
+def _member_ids(exclude_user_id=None):
+    members = User.objects.filter(is_active=True, is_staff=False)
+    if exclude_user_id:
+        members = members.exclude(pk=exclude_user_id)
+    return members.order_by("pk").values_list("pk", flat=True).iterator(
+        chunk_size=USER_NOTIFICATION_FANOUT_BATCH_SIZE
+    )
+
+
+def _insert_for_users(user_ids, notification):
+    user_ids = iter(user_ids)
+    inserted = 0
+    while True:
+        batch = list(islice(user_ids, USER_NOTIFICATION_FANOUT_BATCH_SIZE))
+        if not batch:
+            return inserted
+        UserNotification.objects.bulk_create(
+            [UserNotification(user_id=user_id, **notification) for user_id in batch],
+            ignore_conflicts=True,
+        )
+        inserted += len(batch)
+
+
+def notify_user(user_id, notification):
+    """Write (or refresh the text of) one member's notification; keeps its time and read state."""
+    content = {field: notification[field] for field in _CONTENT_FIELDS}
+    UserNotification.objects.update_or_create(
+        user_id=user_id,
+        key=notification["key"],
+        defaults=content,
+        create_defaults={
+            **content,
+            "kind": notification["kind"],
+            "created_at": notification["created_at"],
+        },
+    )
+    invalidate_user_notification_payload(user_id)
+
+
+def notify_members(notification, *, exclude_user_id=None):
+    """Queue a broadcast to every active member once the current transaction commits."""
+    transaction.on_commit(partial(_queue_broadcast, notification, exclude_user_id))
+
+
+def _queue_broadcast(notification, exclude_user_id):
+    # Later calls for a key that already went out only refresh the text.
+    if UserNotification.objects.filter(key=notification["key"]).exists():
+        refresh_notification(notification)
+        return
+    PendingNotificationBroadcast.objects.update_or_create(
+        key=notification["key"],
+        defaults={
+            "kind": notification["kind"],
+            "created_at": notification["created_at"],
+            "exclude_user_id": exclude_user_id,
+            **{field: notification[field] for field in _CONTENT_FIELDS},
+        },
+    )
+    if getattr(settings, "USER_NOTIFICATION_FANOUT_INLINE", False):
+        fan_out_pending_broadcasts()
+
+
+def fan_out_pending_broadcasts():
+    """Copy every queued broadcast into member inboxes; returns how many went out."""
+    sent = 0
+    for broadcast in PendingNotificationBroadcast.objects.order_by("pk"):
+        notification = {
+            "kind": broadcast.kind,
+            "key": broadcast.key,
+            "created_at": broadcast.created_at,
+            **{field: getattr(broadcast, field) for field in _CONTENT_FIELDS},
+        }
+        _insert_for_users(_member_ids(broadcast.exclude_user_id), notification)
+        PendingNotificationBroadcast.objects.filter(pk=broadcast.pk).delete()
+        sent += 1
+    if sent:
+        prune_broadcast_notifications()
+        invalidate_user_notification_content()
+    return sent
+
+
+def prune_broadcast_notifications(now=None):
+    """Delete broadcast rows older than the retention window; returns the number deleted."""
+    cutoff = (now or timezone.now()) - USER_NOTIFICATION_BROADCAST_RETENTION
+    deleted, _ = UserNotification.objects.filter(
+        kind__in=USER_NOTIFICATION_BROADCAST_KINDS,
+        created_at__lt=cutoff,
+    ).delete()
+    return deleted
+
+
+def refresh_notification(notification):
+    """Rewrite the text of every copy of a notification; a no-op when it has not changed."""
+    content = {field: notification[field] for field in _CONTENT_FIELDS}
+    PendingNotificationBroadcast.objects.filter(key=notification["key"]).exclude(**content).update(**content)
+    if UserNotification.objects.filter(key=notification["key"]).exclude(**content).update(**content):
+        invalidate_user_notification_shared_content()
+
+
+def withdraw_notifications(keys, *, user_id=None):
+    """Delete notifications whose event no longer applies, for one member or everyone."""
+    keys = list(keys)
+    rows = UserNotification.objects.filter(key__in=keys)
+    if user_id is not None:
+        rows = rows.filter(user_id=user_id)
+    else:
+        PendingNotificationBroadcast.objects.filter(key__in=keys).delete()
+    deleted, _ = rows.delete()
+    if not deleted:
+        return
+    if user_id is None:
+        invalidate_user_notification_content()
+    else:
+        invalidate_user_notification_payload(user_id)
+
+
+def backfill_user_notifications():
+    """Seed inboxes with what the bell used to synthesize; returns rows offered per kind."""
+    counts = {}
+
+    broadcasts = [
+        (announcement_notification(announcement), None)
+        for announcement in DogAnnouncement.objects.filter(created_by__is_staff=True).order_by("-created_at")[
+            :USER_NOTIFICATION_BACKFILL_BROADCAST_LIMITS["announcement"]
+        ]
+    ]
+    broadcasts.extend(
+        (admin_post_notification(post), None)
+        for post in Post.objects.filter(user__is_staff=True).order_by("-created_at")[
+            :USER_NOTIFICATION_BACKFILL_BROADCAST_LIMITS["admin_post"]
+        ]
+    )
+    broadcasts.extend(
+        (community_post_notification(post), post.owner_id)
+        for post in UserAdoptionPost.objects.filter(status="available")
+        .select_related("owner")
+        .order_by("-created_at")[:USER_NOTIFICATION_BACKFILL_BROADCAST_LIMITS["community_post"]]
+    )
+    for notification, owner_id in broadcasts:
+        inserted = _insert_for_users(_member_ids(owner_id), notification)
+        counts[notification["kind"]] = counts.get(notification["kind"], 0) + inserted
+
+    accepted_requests = list(
+        PostRequest.objects.filter(status="accepted").select_related("post")
+    )
+    reviewed_at_map = load_request_reviewed_at_map([req.id for req in accepted_requests])
+    for req in accepted_requests:
+        counts["accepted_request"] = counts.get("accepted_request", 0) + _insert_for_users(
+            [req.user_id],
+            accepted_request_notification(req, reviewed_at_map.get(req.id, req.created_at)),
+        )
+    for req in UserAdoptionRequest.objects.filter(status="pending").select_related("post", "requester"):
+        counts["incoming_user_request"] = counts.get("incoming_user_request", 0) + _insert_for_users(
+            [req.post.owner_id],
+            incoming_request_notification(req),
+        )
+
+    # Carry over what members had already read; those markers are then redundant with the rows.
+    already_read = NotificationReadMarker.objects.filter(
+        user_id=OuterRef("user_id"),
+        key=OuterRef("key"),
+    )
+    UserNotification.objects.filter(Exists(already_read), read_at__isnull=True).update(
+        read_at=timezone.now()
+    )
+    NotificationReadMarker.objects.filter(
+        Exists(UserNotification.objects.filter(user_id=OuterRef("user_id"), key=OuterRef("key")))
+    ).delete()
+
+    invalidate_user_notification_content()
+    return counts
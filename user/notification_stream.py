@@ -0,0 +1,112 @@
+"""Server-Sent Events channel for the user notification badge.
+
+The topbar keeps one ``EventSource`` open instead of polling the summary
+endpoint. While nothing changes, the stream only compares the global, shared
+and per-user notification version tokens in the cache, so an idle tab costs no
+database work. When any token moves, it builds the summary once and
+pushes it as a ``summary`` event whose id joins the tokens; a
+reconnecting browser sends that id back as ``Last-Event-ID`` and is not sent
+the same summary again.
+
+Under ASGI (``pet_adoption/asgi.py``) the stream is an async iterator that
+waits on the event loop without holding a worker thread, checking the tokens
+every ``USER_NOTIFICATIONS_STREAM_CHECK_SECONDS``. A WSGI server would pin a
+worker for the life of the stream, so pages served there never open it (see
+``user.context_processors``) and fetch the summary on load and when the
+dropdown opens; a direct request is answered once.
+"""
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+from .notification_utils import (
+    USER_NOTIFICATIONS_GLOBAL_VERSION_KEY,
+    USER_NOTIFICATIONS_REQUEST_VERSION_KEY,
+    USER_NOTIFICATIONS_SHARED_VERSION_KEY,
+    build_user_notification_summary,
+    clear_request_memo,
+)
+
+
+USER_NOTIFICATIONS_STREAM_CHECK_SECONDS = 10
+USER_NOTIFICATIONS_STREAM_KEEPALIVE_SECONDS = 20
+# Streams end after this long so proxies and deploys never see endless requests.
+USER_NOTIFICATIONS_STREAM_MAX_SECONDS = 60 * 5
+USER_NOTIFICATIONS_STREAM_RETRY_MS = 2000
+USER_NOTIFICATIONS_POLL_RETRY_MS = 30000
+
+
+def _version_keys(user_id):
+    return (
+        USER_NOTIFICATIONS_GLOBAL_VERSION_KEY,
+        USER_NOTIFICATIONS_SHARED_VERSION_KEY,
+        USER_NOTIFICATIONS_REQUEST_VERSION_KEY.format(user_id=user_id),
+    )
+
+
+def _event_id(version_keys, tokens):
+    return ":".join(str(tokens.get(key) or "0") for key in version_keys)
+
+
+def notification_event_id(user_id):
+    """Current ``Last-Event-ID`` for ``user_id``: the global, shared and per-user version tokens."""
+    version_keys = _version_keys(user_id)
+    return _event_id(version_keys, cache.get_many(version_keys))
+
+
+def format_sse_event(data=None, *, event=None, event_id=None, retry_ms=None, comment=None):
+    lines = []
+    if comment is not None:
+        lines.append(f": {comment}")
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    if data is not None:
+        lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+def _summary_event(request, event_id, retry_ms):
+    # A stream serves many summaries from one request, so nothing memoized on it may carry over.
+    clear_request_memo(request)
+    return format_sse_event(
+        build_user_notification_summary(request),
+        event="summary",
+        event_id=event_id,
+        retry_ms=retry_ms,
+    )
+
+
+def notification_poll_events(request, last_event_id):
+    """One-shot response for WSGI: the summary only if it changed since ``last_event_id``."""
+    event_id = notification_event_id(request.user.id)
+    if event_id == last_event_id:
+        yield format_sse_event(retry_ms=USER_NOTIFICATIONS_POLL_RETRY_MS, comment="unchanged")
+        return
+    yield _summary_event(request, event_id, USER_NOTIFICATIONS_POLL_RETRY_MS)
+
+
+async def notification_stream_events(request, last_event_id):
+    """Push a summary on connect (unless already seen) and on every version change after it."""
+    version_keys = _version_keys(request.user.id)
+    build_event = sync_to_async(_summary_event)
+    started = time.monotonic()
+    last_sent = started
+
+    yield format_sse_event(retry_ms=USER_NOTIFICATIONS_STREAM_RETRY_MS, comment="connected")
+    while time.monotonic() - started < USER_NOTIFICATIONS_STREAM_MAX_SECONDS:
+        event_id = _event_id(version_keys, await cache.aget_many(version_keys))
+        if event_id != last_event_id:
+            last_event_id = event_id
+            last_sent = time.monotonic()
+            yield await build_event(request, event_id, USER_NOTIFICATIONS_STREAM_RETRY_MS)
+        elif time.monotonic() - last_sent >= USER_NOTIFICATIONS_STREAM_KEEPALIVE_SECONDS:
+            last_sent = time.monotonic()
+            yield format_sse_event(comment="keepalive")
+        await asyncio.sleep(USER_NOTIFICATIONS_STREAM_CHECK_SECONDS)
@@ -2,35 +2,46 @@ from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
 from django.core.cache import cache
-from django.db.models.functions import Lower, Trim
+from django.db.models import Exists, Max, OuterRef
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.html import strip_tags
 
-from dogadoption_admin.models import Dog, DogAnnouncement, DogRegistration, Post, PostRequest, VaccinationRecord
-from user.models import Profile, UserAdoptionPost, UserAdoptionRequest
+from dogadoption_admin.models import Dog
+from user.models import NotificationReadMarker, NotificationReadWatermark, UserNotification
 
 
 USER_NOTIFICATIONS_CACHE_TTL_SECONDS = 20
 USER_NOTIFICATIONS_MAX_ITEMS = 8
-USER_NOTIFICATIONS_INCOMING_REQUEST_LIMIT = 4
-USER_NOTIFICATIONS_ACCEPTED_LIMIT = 4
-USER_NOTIFICATIONS_ADMIN_POST_SAMPLE_LIMIT = 2
-USER_NOTIFICATIONS_ANNOUNCEMENT_SAMPLE_LIMIT = 2
-USER_NOTIFICATIONS_COMMUNITY_POST_SAMPLE_LIMIT = 3
+# The notifications page shows this many of the newest inbox rows.
+USER_NOTIFICATIONS_LIST_LIMIT = 100
 USER_NOTIFICATIONS_SEEN_SESSION_KEY = "user_notifications_seen_at"
 USER_NOTIFICATIONS_READ_SESSION_KEY = "user_notifications_read_keys_v1"
 USER_NOTIFICATIONS_GLOBAL_VERSION_KEY = "user_notifications_global_version_v1"
+USER_NOTIFICATIONS_SHARED_VERSION_KEY = "user_notifications_shared_version_v1"
 USER_NOTIFICATIONS_REQUEST_VERSION_KEY = "user_notifications_request_version_v1:{user_id}"
 USER_NOTIFICATION_REQUEST_REVIEW_TS_KEY = "user_notification_request_reviewed_at_v1:{request_id}"
-USER_NOTIFICATIONS_ADMIN_POST_IDS_CACHE_KEY = "user_notifications_admin_post_ids_v1"
-USER_NOTIFICATIONS_ANNOUNCEMENT_IDS_CACHE_KEY = "user_notifications_announcement_ids_v1"
-USER_NOTIFICATIONS_COMMUNITY_POST_IDS_CACHE_KEY = "user_notifications_community_post_ids_v1"
 USER_NOTIFICATION_REVIEW_TIMESTAMP_TTL_SECONDS = 60 * 60 * 24 * 30
 USER_NOTIFICATIONS_MAX_READ_KEYS = 200
 USER_HOME_FEED_NAMESPACE_KEY = "user_home_feed_namespace_v1"
 USER_VACCINATION_REMINDER_LEAD_DAYS = 30
 USER_VACCINATION_REMINDER_MAX_ITEMS = 4
+# Reminders follow the calendar rather than an event, so they are built on read, not stored.
+USER_NOTIFICATION_SYNTHESIZED_KINDS = frozenset({"vaccination_due", "vaccination_expired"})
+# Broadcast rows hold the same text for every member, so per-user payloads keep only their
+# key, time and read state and the text is cached once per key for everyone.
+USER_NOTIFICATION_SHARED_KINDS = frozenset({"announcement", "admin_post", "community_post"})
+USER_NOTIFICATIONS_SHARED_CACHE_TTL_SECONDS = 60 * 60
+_SHARED_CONTENT_FIELDS = ("title", "message", "url")
+_REQUEST_MEMO_ATTR = "_user_context_memo"
+# Enough of a registered dog and its latest vaccination to work out the reminder status.
+USER_REGISTERED_DOG_VACCINATION_FIELDS = (
+    "id",
+    "name",
+    "date_registered",
+    "latest_vaccination__id",
+    "latest_vaccination__date",
+    "latest_vaccination__effective_expiry_date",
+)
 
 
 def _current_version_token():
@@ -50,7 +61,11 @@ def _payload_cache_key(user_id):
     request_version = _get_version_token(
         USER_NOTIFICATIONS_REQUEST_VERSION_KEY.format(user_id=user_id)
     )
-    return f"user_notifications_summary_v4:{user_id}:{global_version}:{request_version}"
+    return f"user_notifications_summary_v5:{user_id}:{global_version}:{request_version}"
+
+
+def _shared_content_cache_key(notification_key, versions):
+    return f"user_notification_shared_v1:{versions}:{notification_key}"
 
 
 def invalidate_user_notification_payload(user_id):
@@ -71,7 +86,7 @@ def remember_request_reviewed_at(request_id, reviewed_at):
     )
 
 
-def _get_request_reviewed_at_map(request_ids):
+def load_request_reviewed_at_map(request_ids):
     if not request_ids:
         return {}
     raw_map = cache.get_many(
@@ -99,11 +114,11 @@ def _get_request_reviewed_at_map(request_ids):
 
 def invalidate_user_notification_content():
     cache.set(USER_NOTIFICATIONS_GLOBAL_VERSION_KEY, _current_version_token(), None)
-    cache.delete_many([
-        USER_NOTIFICATIONS_ADMIN_POST_IDS_CACHE_KEY,
-        USER_NOTIFICATIONS_ANNOUNCEMENT_IDS_CACHE_KEY,
-        USER_NOTIFICATIONS_COMMUNITY_POST_IDS_CACHE_KEY,
-    ])
+
+
+def invalidate_user_notification_shared_content():
+    """Broadcast text changed but no inbox gained or lost a row; per-user payloads stay cached."""
+    cache.set(USER_NOTIFICATIONS_SHARED_VERSION_KEY, _current_version_token(), None)
 
 
 def _normalize_notification_read_keys(raw_value):
@@ -123,93 +138,81 @@ def _normalize_notification_read_keys(raw_value):
     return normalized[:USER_NOTIFICATIONS_MAX_READ_KEYS]
 
 
-def _load_profile_notification_read_keys(user):
-    if not user or not user.is_authenticated:
-        return []
-    try:
-        profile = Profile.objects.only("notification_read_keys").get(user_id=user.id)
-    except Profile.DoesNotExist:
-        return []
-    return _normalize_notification_read_keys(profile.notification_read_keys)
-
-
-def _persist_profile_notification_read_keys(user, keys_list):
-    """Persist read keys on the user's profile so state survives logout/login."""
-    if not user or not user.is_authenticated:
-        return
-    normalized = _normalize_notification_read_keys(keys_list)
-    profile, _ = Profile.objects.get_or_create(
-        user=user,
-        defaults={
-            "address": "",
-            "age": 18,
-            "consent_given": True,
-            "email_verified": True,
-        },
-    )
-    if profile.notification_read_keys == normalized:
-        return
-    profile.notification_read_keys = normalized
-    profile.save(update_fields=["notification_read_keys"])
+def _is_inbox_key(notification_key):
+    return notification_key.split("-", 1)[0] not in USER_NOTIFICATION_SYNTHESIZED_KINDS
 
 
-def _migrate_session_notification_keys_to_profile(request):
-    """Legacy session keys (pre–DB storage) merged into profile once, then dropped."""
+def _migrate_session_notification_keys(request):
+    """Legacy session keys (pre–DB storage) are stored as read markers once, then dropped."""
     raw_session = request.session.get(USER_NOTIFICATIONS_READ_SESSION_KEY)
     if not raw_session:
         return
-    session_keys = _normalize_notification_read_keys(raw_session)
-    if not session_keys:
-        request.session.pop(USER_NOTIFICATIONS_READ_SESSION_KEY, None)
-        request.session.modified = True
-        return
-    user = getattr(request, "user", None)
-    if not user or not user.is_authenticated:
-        return
-    profile_keys = _load_profile_notification_read_keys(user)
-    merged = _normalize_notification_read_keys(profile_keys + session_keys)
-    _persist_profile_notification_read_keys(user, merged)
     request.session.pop(USER_NOTIFICATIONS_READ_SESSION_KEY, None)
     request.session.modified = True
+    session_keys = _normalize_notification_read_keys(raw_session)
+    if session_keys:
+        mark_user_notifications_read(request, session_keys)
 
 
 def get_user_notification_read_keys(request):
+    """Reminder keys the member has read; inbox rows carry their own read state."""
     user = getattr(request, "user", None)
     if not user or not user.is_authenticated:
         return set()
 
-    _migrate_session_notification_keys_to_profile(request)
-    return set(_load_profile_notification_read_keys(user))
+    _migrate_session_notification_keys(request)
+    return set(
+        NotificationReadMarker.objects.filter(user_id=user.id).values_list("key", flat=True)
+    )
 
 
 def mark_user_notifications_read(request, notification_keys):
+    """Inbox keys set ``read_at`` on their rows; reminder keys append a read marker."""
     user = getattr(request, "user", None)
     if not user or not user.is_authenticated:
-        return set()
+        return
 
-    _migrate_session_notification_keys_to_profile(request)
-    normalized_existing = _load_profile_notification_read_keys(user)
-    existing_set = set(normalized_existing)
+    notification_keys = _normalize_notification_read_keys(notification_keys)
+    inbox_keys = [key for key in notification_keys if _is_inbox_key(key)]
+    if inbox_keys:
+        marked = UserNotification.objects.filter(
+            user_id=user.id,
+            key__in=inbox_keys,
+            read_at__isnull=True,
+        ).update(read_at=timezone.now())
+        if marked:
+            invalidate_user_notification_payload(user.id)
+    reminder_keys = [key for key in notification_keys if not _is_inbox_key(key)]
+    if reminder_keys:
+        NotificationReadMarker.objects.bulk_create(
+            [NotificationReadMarker(user_id=user.id, key=key) for key in reminder_keys],
+            ignore_conflicts=True,
+        )
 
-    updated = list(normalized_existing)
-    for key in notification_keys:
-        if not isinstance(key, str):
-            continue
-        normalized_key = key.strip()
-        if not normalized_key or normalized_key in existing_set:
-            continue
-        updated.append(normalized_key)
-        existing_set.add(normalized_key)
 
-    updated = updated[-USER_NOTIFICATIONS_MAX_READ_KEYS:]
-    if updated != normalized_existing:
-        _persist_profile_notification_read_keys(user, updated)
-    request.session.pop(USER_NOTIFICATIONS_READ_SESSION_KEY, None)
-    return set(updated)
+def mark_user_notification_read(request, notification_key):
+    mark_user_notifications_read(request, [notification_key])
 
 
-def mark_user_notification_read(request, notification_key):
-    return mark_user_notifications_read(request, [notification_key])
+def mark_all_user_notifications_read(request):
+    """Move the member's read-through watermark to their newest inbox row, plus markers for the reminders shown."""
+    user = getattr(request, "user", None)
+    if not user or not user.is_authenticated:
+        return
+    last_id = UserNotification.objects.filter(user_id=user.id).aggregate(last_id=Max("id"))["last_id"]
+    NotificationReadWatermark.objects.update_or_create(
+        user_id=user.id,
+        defaults={"read_through_notification_id": last_id or 0},
+    )
+    invalidate_user_notification_payload(user.id)
+    mark_user_notifications_read(
+        request,
+        [
+            item["key"]
+            for item in build_user_notification_payload(user, limit=None)["items"]
+            if item.get("kind") in USER_NOTIFICATION_SYNTHESIZED_KINDS
+        ],
+    )
 
 
 def get_user_home_feed_namespace():
@@ -217,23 +220,10 @@ def get_user_home_feed_namespace():
 
 
 def bump_user_home_feed_namespace():
+    """Orphan per-token feed rows; the candidate pools in ``user.feed_store`` survive the bump."""
     cache.set(USER_HOME_FEED_NAMESPACE_KEY, _current_version_token(), None)
 
 
-def _cached_newest_entity_ids(cache_key, base_qs, limit):
-    """Cache the newest entity ids by `created_at` (stable; avoids random resampling spikes)."""
-    cached_ids = cache.get(cache_key)
-    if cached_ids is not None:
-        return cached_ids
-
-    safe_limit = max(int(limit or 0), 1)
-    ids = list(
-        base_qs.order_by("-created_at").values_list("id", flat=True)[:safe_limit]
-    )
-    cache.set(cache_key, ids, USER_NOTIFICATIONS_CACHE_TTL_SECONDS)
-    return ids
-
-
 def _format_notification_time(dt):
     if not dt:
         return ""
@@ -251,10 +241,6 @@ def _format_notification_time(dt):
     return timezone.localtime(dt).strftime("%b %d, %Y")
 
 
-def _normalize_person_name(value):
-    return " ".join((value or "").split()).strip().casefold()
-
-
 def _registered_dog_anchor_id(dog_id):
     return f"registered-dog-{dog_id}"
 
@@ -263,97 +249,29 @@ def _registered_dog_detail_url(dog_id):
     return f"{reverse('user:edit_profile')}#{_registered_dog_anchor_id(dog_id)}"
 
 
-def _vaccination_effective_expiry_date(record):
-    candidates = [
-        expiry_date
-        for expiry_date in (
-            getattr(record, "vaccination_expiry_date", None),
-            getattr(record, "vaccine_expiry_date", None),
-        )
-        if expiry_date
-    ]
-    return min(candidates) if candidates else None
-
-
 def build_user_registered_dog_vaccination_status_map(user, dogs=None):
+    """Vaccination status per registered dog, read from ``Dog.latest_vaccination``.
+
+    Pass ``dogs`` loaded with ``select_related("latest_vaccination")`` to keep this to one query.
+    """
     if not user or not user.is_authenticated or user.is_staff:
         return {}
 
     registered_dogs = list(
         dogs
         if dogs is not None
-        else Dog.objects.filter(owner_user=user).only(
-            "id",
-            "name",
-            "owner_name",
-            "owner_name_key",
-            "date_registered",
+        else Dog.objects.filter(owner_user=user).select_related("latest_vaccination").only(
+            *USER_REGISTERED_DOG_VACCINATION_FIELDS
         )
     )
     if not registered_dogs:
         return {}
 
-    owner_keys = set()
-    pet_keys = set()
-    dog_signatures = {}
-    for dog in registered_dogs:
-        owner_key = _normalize_person_name(
-            getattr(dog, "owner_name_key", "") or getattr(dog, "owner_name", "")
-        )
-        pet_key = _normalize_person_name(getattr(dog, "name", ""))
-        signature = (owner_key, pet_key)
-        dog_signatures[dog.id] = signature
-        if owner_key and pet_key:
-            owner_keys.add(owner_key)
-            pet_keys.add(pet_key)
-
-    if not owner_keys or not pet_keys:
-        return {}
-
-    registration_signature_by_id = {}
-    registration_ids = []
-    matching_registrations = DogRegistration.objects.annotate(
-        owner_name_normalized=Lower(Trim("owner_name")),
-        pet_name_normalized=Lower(Trim("name_of_pet")),
-    ).filter(
-        owner_name_normalized__in=owner_keys,
-        pet_name_normalized__in=pet_keys,
-    ).only("id", "owner_name", "name_of_pet")
-    for registration in matching_registrations:
-        signature = (
-            getattr(registration, "owner_name_normalized", ""),
-            getattr(registration, "pet_name_normalized", ""),
-        )
-        registration_signature_by_id[registration.id] = signature
-        registration_ids.append(registration.id)
-
-    if not registration_ids:
-        return {}
-
-    latest_vaccination_by_signature = {}
-    vaccinations = (
-        VaccinationRecord.objects.filter(registration_id__in=registration_ids)
-        .only(
-            "id",
-            "registration_id",
-            "date",
-            "vaccine_name",
-            "vaccine_expiry_date",
-            "vaccination_expiry_date",
-        )
-        .order_by("-date", "-id")
-    )
-    for vaccination in vaccinations:
-        signature = registration_signature_by_id.get(vaccination.registration_id)
-        if signature and signature not in latest_vaccination_by_signature:
-            latest_vaccination_by_signature[signature] = vaccination
-
     today = timezone.localdate()
     status_map = {}
     for dog in registered_dogs:
-        signature = dog_signatures.get(dog.id)
-        vaccination = latest_vaccination_by_signature.get(signature)
-        expiry_date = _vaccination_effective_expiry_date(vaccination) if vaccination else None
+        vaccination = dog.latest_vaccination
+        expiry_date = vaccination.effective_expiry_date if vaccination else None
         days_until_expiry = (expiry_date - today).days if expiry_date else None
         has_vaccination_record = vaccination is not None and expiry_date is not None
 
@@ -393,11 +311,43 @@ def build_user_registered_dog_vaccination_status_map(user, dogs=None):
     return status_map
 
 
-def build_user_vaccination_reminders(user, *, limit=USER_VACCINATION_REMINDER_MAX_ITEMS):
+def _request_memo(request, name, build):
+    """Evaluate ``build()`` at most once per request, however many templates render."""
+    memo = request.__dict__.setdefault(_REQUEST_MEMO_ATTR, {})
+    if name not in memo:
+        memo[name] = build()
+    return memo[name]
+
+
+def clear_request_memo(request):
+    """Forget values memoized on ``request``; for long-lived requests that rebuild them over time."""
+    request.__dict__.pop(_REQUEST_MEMO_ATTR, None)
+
+
+def build_user_vaccination_reminders(user, *, limit=USER_VACCINATION_REMINDER_MAX_ITEMS, request=None):
+    """Expired and due-soon reminders, worst first; loaded once per ``request`` when one is given."""
+    if request is None:
+        reminder_rows = _load_user_vaccination_reminders(user)
+    else:
+        # The home feed and the notification payload of one page share this.
+        reminder_rows = _request_memo(
+            request, "vaccination_reminders", lambda: _load_user_vaccination_reminders(user)
+        )
+    if limit is not None:
+        return reminder_rows[:limit]
+    return list(reminder_rows)
+
+
+def _load_user_vaccination_reminders(user):
+    # Only dogs whose cover ends inside the reminder window can be expired or due soon.
+    reminder_window_end = timezone.localdate() + timedelta(days=USER_VACCINATION_REMINDER_LEAD_DAYS)
     dogs = list(
-        Dog.objects.filter(owner_user=user).only(
-            "id", "name", "owner_name", "owner_name_key", "date_registered",
+        Dog.objects.filter(
+            owner_user=user,
+            latest_vaccination__effective_expiry_date__lte=reminder_window_end,
         )
+        .select_related("latest_vaccination")
+        .only(*USER_REGISTERED_DOG_VACCINATION_FIELDS)
     )
     status_map = build_user_registered_dog_vaccination_status_map(user, dogs=dogs)
     if not status_map:
@@ -428,13 +378,11 @@ def build_user_vaccination_reminders(user, *, limit=USER_VACCINATION_REMINDER_MA
             row["pet_name"].casefold(),
         )
     )
-    if limit is not None:
-        reminder_rows = reminder_rows[:limit]
     return reminder_rows
 
 
-def build_user_vaccination_reminder_summary(user):
-    reminders = build_user_vaccination_reminders(user, limit=None)
+def build_user_vaccination_reminder_summary(user, *, request=None):
+    reminders = build_user_vaccination_reminders(user, limit=None, request=request)
     return {
         "items": reminders[:USER_VACCINATION_REMINDER_MAX_ITEMS],
         "expired_count": sum(1 for item in reminders if item["status_key"] == "expired"),
@@ -443,183 +391,8 @@ def build_user_vaccination_reminder_summary(user):
     }
 
 
-def _post_phase_url(post):
-    return reverse("user:post_detail", args=[post.id])
-
-
-def _build_request_acceptance_items(user):
-    requests = list(
-        PostRequest.objects.filter(
-            user_id=user.id,
-            status="accepted",
-        )
-        .select_related("post")
-        .only(
-            "id",
-            "request_type",
-            "scheduled_appointment_date",
-            "created_at",
-            "post_id",
-            "post__caption",
-            "post__location",
-        )
-        .order_by("-created_at")[:USER_NOTIFICATIONS_ACCEPTED_LIMIT]
-    )
-    reviewed_at_map = _get_request_reviewed_at_map([req.id for req in requests])
-
-    items = []
-    for req in requests:
-        reviewed_at = reviewed_at_map.get(req.id, req.created_at)
-        label = "Claim request accepted" if req.request_type == "claim" else "Adoption request accepted"
-        destination = reverse("user:my_redemptions") if req.request_type == "claim" else reverse("user:adopt_status")
-        schedule_text = (
-            f" Appointment: {req.scheduled_appointment_date.strftime('%b %d, %Y')}."
-            if req.scheduled_appointment_date
-            else ""
-        )
-        items.append({
-            "key": f"accepted-request-{req.id}",
-            "kind": "accepted_request",
-            "title": label,
-            "message": f"{strip_tags(req.post.caption)[:72]}{schedule_text}",
-            "url": destination,
-            "created_at": reviewed_at,
-            "created_label": _format_notification_time(reviewed_at),
-        })
-    return items
-
-
-def _build_incoming_user_request_items(user):
-    requests = list(
-        UserAdoptionRequest.objects.filter(
-            post__owner_id=user.id,
-            status="pending",
-        )
-        .select_related("post", "requester")
-        .only(
-            "id",
-            "created_at",
-            "post_id",
-            "post__dog_name",
-            "requester_id",
-            "requester__username",
-        )
-        .order_by("-created_at")[:USER_NOTIFICATIONS_INCOMING_REQUEST_LIMIT]
-    )
-
-    items = []
-    for req in requests:
-        dog_name = (req.post.dog_name or "this dog").strip() or "this dog"
-        items.append({
-            "key": f"incoming-user-request-{req.id}",
-            "kind": "incoming_user_request",
-            "title": "New adoption request",
-            "message": f"{req.requester.username} wants to adopt {dog_name}.",
-            "url": reverse("user:user_adoption_requests"),
-            "created_at": req.created_at,
-            "created_label": _format_notification_time(req.created_at),
-        })
-    return items
-
-
-def _build_announcement_items():
-    announcement_ids = _cached_newest_entity_ids(
-        USER_NOTIFICATIONS_ANNOUNCEMENT_IDS_CACHE_KEY,
-        DogAnnouncement.objects.filter(created_by__is_staff=True),
-        USER_NOTIFICATIONS_ANNOUNCEMENT_SAMPLE_LIMIT,
-    )
-    announcements = {
-        announcement.id: announcement
-        for announcement in DogAnnouncement.objects.select_related("created_by")
-        .only("id", "title", "content", "created_at", "created_by__username")
-        .filter(id__in=announcement_ids)
-    }
-
-    items = []
-    for announcement_id in announcement_ids:
-        announcement = announcements.get(announcement_id)
-        if not announcement:
-            continue
-        content_preview = strip_tags(announcement.content or "").strip()
-        if len(content_preview) > 90:
-            content_preview = f"{content_preview[:87].rstrip()}..."
-        items.append({
-            "key": f"announcement-{announcement.id}",
-            "kind": "announcement",
-            "title": "New update from admin staff",
-            "message": announcement.title or content_preview or "New official announcement.",
-            "url": reverse("user:announcement_detail", args=[announcement.id]),
-            "created_at": announcement.created_at,
-            "created_label": _format_notification_time(announcement.created_at),
-        })
-    return items
-
-
-def _build_admin_post_items():
-    admin_post_ids = _cached_newest_entity_ids(
-        USER_NOTIFICATIONS_ADMIN_POST_IDS_CACHE_KEY,
-        Post.objects.filter(user__is_staff=True),
-        USER_NOTIFICATIONS_ADMIN_POST_SAMPLE_LIMIT,
-    )
-    posts = {
-        post.id: post
-        for post in Post.objects.select_related("user")
-        .only("id", "caption", "location", "status", "claim_days", "created_at", "user_id")
-        .filter(id__in=admin_post_ids)
-    }
-
-    items = []
-    for post_id in admin_post_ids:
-        post = posts.get(post_id)
-        if not post:
-            continue
-        message = strip_tags(post.caption or "").strip()[:90]
-        items.append({
-            "key": f"admin-post-{post.id}",
-            "kind": "admin_post",
-            "title": "New admin dog post",
-            "message": message or "A rescued dog post was published by the admin staff.",
-            "url": _post_phase_url(post),
-            "created_at": post.created_at,
-            "created_label": _format_notification_time(post.created_at),
-        })
-    return items
-
-
-def _build_community_post_items(user):
-    community_post_ids = _cached_newest_entity_ids(
-        USER_NOTIFICATIONS_COMMUNITY_POST_IDS_CACHE_KEY,
-        UserAdoptionPost.objects.filter(status="available"),
-        USER_NOTIFICATIONS_COMMUNITY_POST_SAMPLE_LIMIT,
-    )
-    community_posts = {
-        post.id: post
-        for post in UserAdoptionPost.objects.select_related("owner")
-        .only("id", "dog_name", "location", "created_at", "owner_id", "owner__username")
-        .filter(id__in=community_post_ids)
-        .exclude(owner_id=user.id)
-    }
-
-    items = []
-    for post_id in community_post_ids:
-        post = community_posts.get(post_id)
-        if not post:
-            continue
-        location = f" in {post.location}" if post.location else ""
-        items.append({
-            "key": f"community-post-{post.id}",
-            "kind": "community_post",
-            "title": "Random community post",
-            "message": f"{post.owner.username} posted {post.dog_name}{location}.",
-            "url": reverse("user:user_home"),
-            "created_at": post.created_at,
-            "created_label": _format_notification_time(post.created_at),
-        })
-    return items
-
-
-def _build_vaccination_reminder_items(user):
-    reminders = build_user_vaccination_reminders(user, limit=USER_VACCINATION_REMINDER_MAX_ITEMS)
+def _build_vaccination_reminder_items(user, request=None):
+    reminders = build_user_vaccination_reminders(user, limit=USER_VACCINATION_REMINDER_MAX_ITEMS, request=request)
     if not reminders:
         return []
 
@@ -659,20 +432,33 @@ def _build_vaccination_reminder_items(user):
     return items
 
 
+def _reminder_read_keys(request, payload):
+    """Stored read keys, loaded only when the payload holds reminders (inbox rows carry their own state)."""
+    if any(item.get("kind") in USER_NOTIFICATION_SYNTHESIZED_KINDS for item in payload.get("items", [])):
+        return get_user_notification_read_keys(request)
+    return set()
+
+
+def _is_unread(item, notification_key, read_keys):
+    if not notification_key or item.get("is_read"):
+        return False
+    return notification_key not in read_keys
+
+
 def build_user_notification_summary(request):
-    """Build badge count and dropdown rows, applying per-session read keys to cached payload."""
+    """Build badge count and dropdown rows; inbox rows carry read state, reminders use stored read keys."""
     user = getattr(request, "user", None)
     if not user or not user.is_authenticated or user.is_staff:
         return {"unread_count": 0, "notifications": []}
 
-    payload = build_user_notification_payload(user, limit=USER_NOTIFICATIONS_MAX_ITEMS)
-    read_keys = get_user_notification_read_keys(request)
+    payload = build_user_notification_payload(user, limit=USER_NOTIFICATIONS_MAX_ITEMS, request=request)
+    read_keys = _reminder_read_keys(request, payload)
     notifications = []
     unread_count = 0
     for item in payload.get("items", []):
         notification_key = (item.get("key", "") or "").strip()
         target_url = item.get("url") or reverse("user:user_home")
-        is_unread = bool(notification_key and notification_key not in read_keys)
+        is_unread = _is_unread(item, notification_key, read_keys)
         if is_unread:
             unread_count += 1
         notifications.append({
@@ -733,14 +519,14 @@ def build_user_notifications_page_list(request, *, sort_mode="date"):
     if sort_mode not in {"date", "type"}:
         sort_mode = "date"
 
-    payload = build_user_notification_payload(user, limit=None)
-    read_keys = get_user_notification_read_keys(request)
+    payload = build_user_notification_payload(user, limit=None, request=request)
+    read_keys = _reminder_read_keys(request, payload)
     rows = []
     for item in payload.get("items", []):
         notification_key = (item.get("key", "") or "").strip()
         target_url = item.get("url") or reverse("user:user_home")
         created_at = item.get("created_at")
-        is_unread = bool(notification_key and notification_key not in read_keys)
+        is_unread = _is_unread(item, notification_key, read_keys)
         kind = item.get("kind", "notification")
         rows.append(
             {
@@ -783,35 +569,102 @@ def build_user_notifications_page_list(request, *, sort_mode="date"):
     return unread + read
 
 
-def build_user_notification_payload(user, *, limit=USER_NOTIFICATIONS_MAX_ITEMS):
-    """Aggregated notification items; ``limit=None`` returns every synthesized row (full-page views)."""
+def _build_inbox_items(user):
+    rows = (
+        UserNotification.objects.filter(user_id=user.id)
+        .annotate(
+            below_watermark=Exists(
+                NotificationReadWatermark.objects.filter(
+                    user_id=OuterRef("user_id"),
+                    read_through_notification_id__gte=OuterRef("id"),
+                )
+            )
+        )
+        .order_by("-created_at", "-id")
+        .values_list("kind", "key", "title", "message", "url", "created_at", "read_at", "below_watermark")
+        [:USER_NOTIFICATIONS_LIST_LIMIT]
+    )
+    items = []
+    for kind, key, title, message, url, created_at, read_at, below_watermark in rows:
+        item = {
+            "key": key,
+            "kind": kind,
+            "created_at": created_at,
+            "created_label": _format_notification_time(created_at),
+            "is_read": read_at is not None or below_watermark,
+        }
+        if kind not in USER_NOTIFICATION_SHARED_KINDS:
+            item.update(title=title, message=message, url=url)
+        items.append(item)
+    return items
+
+
+def _hydrate_shared_items(user, items):
+    """Fill broadcast text from the shared cache; keys it lacks load from the member's own rows."""
+    keys = [item["key"] for item in items if item["kind"] in USER_NOTIFICATION_SHARED_KINDS]
+    if not keys:
+        return items
+
+    versions = ":".join(
+        _get_version_token(version_key)
+        for version_key in (USER_NOTIFICATIONS_GLOBAL_VERSION_KEY, USER_NOTIFICATIONS_SHARED_VERSION_KEY)
+    )
+    cache_keys = {key: _shared_content_cache_key(key, versions) for key in keys}
+    cached = cache.get_many(list(cache_keys.values()))
+    content = {key: cached[cache_key] for key, cache_key in cache_keys.items() if cache_key in cached}
+    missing = [key for key in keys if key not in content]
+    if missing:
+        loaded = {
+            row[0]: dict(zip(_SHARED_CONTENT_FIELDS, row[1:]))
+            for row in UserNotification.objects.filter(user_id=user.id, key__in=missing).values_list(
+                "key", *_SHARED_CONTENT_FIELDS
+            )
+        }
+        cache.set_many(
+            {cache_keys[key]: value for key, value in loaded.items()},
+            USER_NOTIFICATIONS_SHARED_CACHE_TTL_SECONDS,
+        )
+        content.update(loaded)
+
+    return [
+        {**item, **content.get(item["key"], {})} if item["kind"] in USER_NOTIFICATION_SHARED_KINDS else item
+        for item in items
+    ]
+
+
+def build_user_notification_payload(user, *, limit=USER_NOTIFICATIONS_MAX_ITEMS, request=None):
+    """Inbox rows plus vaccination reminders, newest first; ``limit=None`` returns every row (full-page views)."""
     if not user or not user.is_authenticated or user.is_staff:
         return {"items": []}
 
     cache_key = _payload_cache_key(user.id)
     cached = cache.get(cache_key)
     if cached is None:
-        items = []
-        seen_keys = set()
-        for bucket in (
-            _build_incoming_user_request_items(user),
-            _build_request_acceptance_items(user),
-            _build_vaccination_reminder_items(user),
-            _build_announcement_items(),
-            _build_admin_post_items(),
-            _build_community_post_items(user),
-        ):
-            for item in bucket:
-                if item["key"] in seen_keys:
-                    continue
-                seen_keys.add(item["key"])
-                items.append(item)
-
+        items = _build_inbox_items(user) + _build_vaccination_reminder_items(user, request)
         items.sort(key=lambda item: item["created_at"] or timezone.now(), reverse=True)
         cached = {"items": items}
         cache.set(cache_key, cached, USER_NOTIFICATIONS_CACHE_TTL_SECONDS)
 
-    items = cached["items"]
-    if limit is None:
-        return {"items": list(items)}
-    return {"items": list(items[:limit])}
+    items = cached["items"] if limit is None else cached["items"][:limit]
+    return {"items": _hydrate_shared_items(user, items)}
+
+
+def find_user_notification_url(user, notification_key):
+    """Destination of one of ``user``'s notifications, or ``""`` when it no longer exists."""
+    if not notification_key:
+        return ""
+    if _is_inbox_key(notification_key):
+        return (
+            UserNotification.objects.filter(user_id=user.id, key=notification_key)
+            .values_list("url", flat=True)
+            .first()
+            or ""
+        )
+    return next(
+        (
+            item.get("url") or ""
+            for item in build_user_notification_payload(user, limit=None)["items"]
+            if item.get("key") == notification_key
+        ),
+        "",
+    )
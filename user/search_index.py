@@ -0,0 +1,238 @@
+"""Token index behind home search.
+
+Every live feed listing is split into lower-cased words stored in
+``FeedSearchToken`` with a per-field weight. Searches match each query word as
+a token prefix through the ``(feed_type, token)`` index, so lookups stay
+index range scans instead of ``icontains`` scans across joined tables.
+
+Unlike the old ``icontains`` search, every query word must match, and a word
+only matches the start of a listing word (``"bant"`` finds "Bantay", ``"tay"``
+does not); mid-word matches would need a ``LIKE '%x%'`` scan the index cannot
+serve.
+
+Signals in ``user.signals`` reindex a listing whenever it is saved and drop it
+once it leaves the feed; an owner rename reindexes their listings when the
+user is saved with ``update_fields`` naming a name field, as the profile views
+do. ``manage.py rebuild_feed_search_index`` backfills.
+"""
+import re
+
+from django.db import transaction
+from django.db.models import Case, IntegerField, Max, Q, Sum, Value, When
+
+from dogadoption_admin.models import DogAnnouncement, Post
+
+from .models import FeedSearchToken, MissingDogPost, UserAdoptionPost
+
+
+SEARCH_TOKEN_MAX_LENGTH = 40
+SEARCH_QUERY_MAX_TERMS = 6
+SEARCH_TITLE_WEIGHT = 3
+SEARCH_LABEL_WEIGHT = 2
+SEARCH_TEXT_WEIGHT = 1
+# Saves limited to these fields cannot change what a listing is searchable by.
+SEARCH_INDEX_IRRELEVANT_FIELDS = frozenset({"view_count", "is_pinned", "pinned_at"})
+SEARCH_OWNER_NAME_FIELDS = ("username", "first_name", "last_name")
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    return [
+        token[:SEARCH_TOKEN_MAX_LENGTH]
+        for token in _TOKEN_PATTERN.findall(str(text or "").casefold())
+    ]
+
+
+def query_terms(query):
+    terms = []
+    for token in tokenize(query):
+        if token not in terms:
+            terms.append(token)
+    return terms[:SEARCH_QUERY_MAX_TERMS]
+
+
+def _owner_name_fields(user):
+    if user is None:
+        return []
+    return [
+        (user.username, SEARCH_TEXT_WEIGHT),
+        (user.first_name, SEARCH_TEXT_WEIGHT),
+        (user.last_name, SEARCH_TEXT_WEIGHT),
+    ]
+
+
+def _dog_attribute_fields(post):
+    return [
+        (post.display_breed, SEARCH_TITLE_WEIGHT),
+        (post.breed, SEARCH_LABEL_WEIGHT),
+        (post.breed_other, SEARCH_LABEL_WEIGHT),
+        (post.location, SEARCH_LABEL_WEIGHT),
+        (post.display_age_group, SEARCH_TEXT_WEIGHT),
+        (post.age_group, SEARCH_TEXT_WEIGHT),
+        (post.display_size_group, SEARCH_TEXT_WEIGHT),
+        (post.size_group, SEARCH_TEXT_WEIGHT),
+        (post.display_coat_length, SEARCH_TEXT_WEIGHT),
+        (post.coat_length, SEARCH_TEXT_WEIGHT),
+        (post.gender, SEARCH_TEXT_WEIGHT),
+        (post.display_colors, SEARCH_TEXT_WEIGHT),
+        (post.color_other, SEARCH_TEXT_WEIGHT),
+    ]
+
+
+def _document_fields(feed_type, instance):
+    if feed_type == "admin":
+        return [
+            (instance.caption, SEARCH_TITLE_WEIGHT),
+            (instance.status, SEARCH_TEXT_WEIGHT),
+            *_dog_attribute_fields(instance),
+            *_owner_name_fields(instance.user),
+        ]
+    if feed_type == "announcement":
+        return [
+            (instance.title, SEARCH_TITLE_WEIGHT),
+            (instance.category, SEARCH_LABEL_WEIGHT),
+            (instance.get_category_display(), SEARCH_LABEL_WEIGHT),
+            (instance.content, SEARCH_TEXT_WEIGHT),
+            *_owner_name_fields(instance.created_by),
+        ]
+    return [
+        (instance.dog_name, SEARCH_TITLE_WEIGHT),
+        (instance.description, SEARCH_TEXT_WEIGHT),
+        *_dog_attribute_fields(instance),
+        *_owner_name_fields(instance.owner),
+    ]
+
+
+def _document_tokens(feed_type, instance):
+    """Return ``{token: weight}``, keeping the highest weight of a repeated word."""
+    weights = {}
+    for text, weight in _document_fields(feed_type, instance):
+        for token in tokenize(text):
+            if weight > weights.get(token, 0):
+                weights[token] = weight
+    return weights
+
+
+def is_searchable(feed_type, instance):
+    """Only listings that can appear in the feed keep index rows."""
+    if feed_type == "admin":
+        return not instance.is_history and instance.status not in ("reunited", "adopted")
+    if feed_type == "user":
+        return instance.status == "available"
+    if feed_type == "missing":
+        return instance.status == "missing"
+    return True
+
+
+def _token_rows(feed_type, instances):
+    rows = []
+    for instance in instances:
+        if not is_searchable(feed_type, instance):
+            continue
+        rows.extend(
+            FeedSearchToken(
+                feed_type=feed_type,
+                entity_id=instance.pk,
+                token=token,
+                weight=weight,
+            )
+            for token, weight in _document_tokens(feed_type, instance).items()
+        )
+    return rows
+
+
+def reindex_entities(feed_type, instances):
+    """Replace the index rows of ``instances`` in two statements."""
+    instances = list(instances)
+    if not instances:
+        return
+    rows = _token_rows(feed_type, instances)
+    with transaction.atomic():
+        FeedSearchToken.objects.filter(
+            feed_type=feed_type,
+            entity_id__in=[instance.pk for instance in instances],
+        ).delete()
+        FeedSearchToken.objects.bulk_create(rows, batch_size=500)
+
+
+def reindex_entity(feed_type, instance):
+    if instance is None or not instance.pk:
+        return
+    reindex_entities(feed_type, [instance])
+
+
+def remove_entity(feed_type, entity_id):
+    FeedSearchToken.objects.filter(feed_type=feed_type, entity_id=entity_id).delete()
+
+
+def _indexable_querysets():
+    return {
+        "admin": Post.objects.select_related("user"),
+        "announcement": DogAnnouncement.objects.select_related("created_by"),
+        "user": UserAdoptionPost.objects.select_related("owner"),
+        "missing": MissingDogPost.objects.select_related("owner"),
+    }
+
+
+def reindex_owner_entities(user_id):
+    """Refresh every listing that carries this user's name (after a rename)."""
+    owner_filters = {
+        "admin": {"user_id": user_id},
+        "announcement": {"created_by_id": user_id},
+        "user": {"owner_id": user_id},
+        "missing": {"owner_id": user_id},
+    }
+    for feed_type, queryset in _indexable_querysets().items():
+        reindex_entities(feed_type, queryset.filter(**owner_filters[feed_type]))
+
+
+def rebuild_search_index(batch_size=500):
+    """Rebuild every feed type from scratch; returns ``{feed_type: indexed listings}``."""
+    indexed = {}
+    for feed_type, queryset in _indexable_querysets().items():
+        FeedSearchToken.objects.filter(feed_type=feed_type).delete()
+        batch = []
+        total = 0
+        for instance in queryset.order_by("pk").iterator(chunk_size=batch_size):
+            batch.append(instance)
+            if len(batch) >= batch_size:
+                FeedSearchToken.objects.bulk_create(_token_rows(feed_type, batch), batch_size=500)
+                total += len(batch)
+                batch = []
+        if batch:
+            FeedSearchToken.objects.bulk_create(_token_rows(feed_type, batch), batch_size=500)
+            total += len(batch)
+        indexed[feed_type] = total
+    return indexed
+
+
+def search_ranked_ids(feed_type, query, limit):
+    """
+    Return ``[(entity_id, score)]`` for listings matching every query word, best first.
+
+    Each word matches as a token prefix; the score sums the weights of the
+    matched tokens, so title and breed hits outrank description hits.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return []
+    any_term = Q()
+    term_matches = {}
+    for index, term in enumerate(terms):
+        any_term |= Q(token__startswith=term)
+        term_matches[f"term_{index}"] = Max(
+            Case(
+                When(token__startswith=term, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        )
+    return list(
+        FeedSearchToken.objects.filter(feed_type=feed_type)
+        .filter(any_term)
+        .values("entity_id")
+        .annotate(score=Sum("weight"), **term_matches)
+        .filter(**{name: 1 for name in term_matches})
+        .order_by("-score", "-entity_id")
+        .values_list("entity_id", "score")[:limit]
+    )
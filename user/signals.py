@@ -0,0 +1,336 @@
+from functools import partial
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from dogadoption_admin.models import (
+    DogAnnouncement,
+    DogAnnouncementImage,
+    Post,
+    PostImage,
+    PostRequest,
+)
+from dogadoption_admin.phase_scheduler import post_phase_changed
+
+from .feed_store import (
+    ADMIN_POOL_IRRELEVANT_FIELDS,
+    discard_feed_pool_entry,
+    invalidate_feed_card,
+    resync_admin_post_pool_entry,
+    sync_admin_post_pool_entry,
+    sync_recent_pool_entry,
+)
+from .finder_index import FINDER_INDEX_IRRELEVANT_FIELDS, record_finder_change
+from .models import MissingDogPost, UserAdoptionImage, UserAdoptionPost, UserAdoptionRequest
+from .notification_inbox import (
+    accepted_request_notification,
+    admin_post_notification,
+    announcement_notification,
+    community_post_notification,
+    incoming_request_notification,
+    notification_key,
+    notify_members,
+    notify_user,
+    refresh_notification,
+    withdraw_notifications,
+)
+from .notification_utils import bump_user_home_feed_namespace
+from .search_index import (
+    SEARCH_INDEX_IRRELEVANT_FIELDS,
+    SEARCH_OWNER_NAME_FIELDS,
+    reindex_entity,
+    reindex_owner_entities,
+    remove_entity,
+)
+
+
+@receiver(post_save, sender=Post, dispatch_uid="feed_pool_sync_admin_post")
+def sync_admin_post_feed_pool(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= ADMIN_POOL_IRRELEVANT_FIELDS:
+        return
+    invalidate_feed_card("admin", instance.pk)
+    sync_admin_post_pool_entry(instance)
+
+
+@receiver(post_delete, sender=Post, dispatch_uid="feed_pool_discard_admin_post")
+def discard_admin_post_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("admin", instance.pk)
+    discard_feed_pool_entry("admin", instance.pk)
+
+
+@receiver(post_save, sender=PostRequest, dispatch_uid="feed_pool_sync_post_request")
+def sync_post_request_feed_pool(sender, instance, **kwargs):
+    # Cards carry the pending claim/adopt state, so any request change rebuilds the card.
+    invalidate_feed_card("admin", instance.post_id)
+    # Only an accepted request takes a post out of the feed; pending rows leave it untouched.
+    if instance.status == "accepted":
+        discard_feed_pool_entry("admin", instance.post_id)
+
+
+@receiver(post_delete, sender=PostRequest, dispatch_uid="feed_pool_resync_post_request")
+def resync_post_request_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("admin", instance.post_id)
+    if instance.status == "accepted":
+        resync_admin_post_pool_entry(instance.post_id)
+
+
+@receiver(post_phase_changed, dispatch_uid="feed_refresh_post_phase_changed")
+def refresh_feed_on_post_phase_change(sender, transitions, **kwargs):
+    # Cards and pools re-check claim vs adopt on read; only closing changes what is listed.
+    closed_post_ids = {
+        transition.post_id for transition in transitions if transition.to_phase == "closed"
+    }
+    if not closed_post_ids:
+        return
+    for post_id in closed_post_ids:
+        discard_feed_pool_entry("admin", post_id)
+    bump_user_home_feed_namespace()
+
+
+@receiver(post_save, sender=DogAnnouncement, dispatch_uid="feed_pool_sync_announcement")
+def sync_announcement_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("announcement", instance.pk)
+    sync_recent_pool_entry(
+        "announcement",
+        instance,
+        owner_id=instance.created_by_id,
+        is_live=True,
+    )
+
+
+@receiver(post_delete, sender=DogAnnouncement, dispatch_uid="feed_pool_discard_announcement")
+def discard_announcement_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("announcement", instance.pk)
+    discard_feed_pool_entry("announcement", instance.pk)
+
+
+@receiver(post_save, sender=UserAdoptionPost, dispatch_uid="feed_pool_sync_user_post")
+def sync_user_adoption_post_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("user", instance.pk)
+    sync_recent_pool_entry(
+        "user",
+        instance,
+        owner_id=instance.owner_id,
+        is_live=instance.status == "available",
+    )
+
+
+@receiver(post_delete, sender=UserAdoptionPost, dispatch_uid="feed_pool_discard_user_post")
+def discard_user_adoption_post_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("user", instance.pk)
+    discard_feed_pool_entry("user", instance.pk)
+
+
+@receiver(post_save, sender=MissingDogPost, dispatch_uid="feed_pool_sync_missing_post")
+def sync_missing_dog_post_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("missing", instance.pk)
+    sync_recent_pool_entry(
+        "missing",
+        instance,
+        owner_id=instance.owner_id,
+        is_live=instance.status == "missing",
+    )
+
+
+@receiver(post_delete, sender=MissingDogPost, dispatch_uid="feed_pool_discard_missing_post")
+def discard_missing_dog_post_feed_pool(sender, instance, **kwargs):
+    invalidate_feed_card("missing", instance.pk)
+    discard_feed_pool_entry("missing", instance.pk)
+
+
+@receiver(post_save, sender=PostImage, dispatch_uid="feed_card_post_image_saved")
+@receiver(post_delete, sender=PostImage, dispatch_uid="feed_card_post_image_deleted")
+def invalidate_post_image_feed_card(sender, instance, **kwargs):
+    invalidate_feed_card("admin", instance.post_id)
+
+
+@receiver(
+    post_save,
+    sender=DogAnnouncementImage,
+    dispatch_uid="feed_card_announcement_image_saved",
+)
+@receiver(
+    post_delete,
+    sender=DogAnnouncementImage,
+    dispatch_uid="feed_card_announcement_image_deleted",
+)
+def invalidate_announcement_image_feed_card(sender, instance, **kwargs):
+    invalidate_feed_card("announcement", instance.announcement_id)
+
+
+@receiver(post_save, sender=UserAdoptionImage, dispatch_uid="feed_card_user_image_saved")
+@receiver(post_delete, sender=UserAdoptionImage, dispatch_uid="feed_card_user_image_deleted")
+def invalidate_user_adoption_image_feed_card(sender, instance, **kwargs):
+    invalidate_feed_card("user", instance.post_id)
+
+
+@receiver(post_save, sender=UserAdoptionRequest, dispatch_uid="feed_card_user_request_saved")
+@receiver(post_delete, sender=UserAdoptionRequest, dispatch_uid="feed_card_user_request_deleted")
+def invalidate_user_adoption_request_feed_card(sender, instance, **kwargs):
+    # Cards show the request count for community listings.
+    invalidate_feed_card("user", instance.post_id)
+
+
+@receiver(post_save, sender=Post, dispatch_uid="search_index_admin_post_saved")
+def reindex_admin_post_search(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= SEARCH_INDEX_IRRELEVANT_FIELDS:
+        return
+    reindex_entity("admin", instance)
+
+
+@receiver(post_save, sender=DogAnnouncement, dispatch_uid="search_index_announcement_saved")
+def reindex_announcement_search(sender, instance, **kwargs):
+    reindex_entity("announcement", instance)
+
+
+@receiver(post_save, sender=UserAdoptionPost, dispatch_uid="search_index_user_post_saved")
+def reindex_user_adoption_post_search(sender, instance, **kwargs):
+    reindex_entity("user", instance)
+
+
+@receiver(post_save, sender=MissingDogPost, dispatch_uid="search_index_missing_post_saved")
+def reindex_missing_dog_post_search(sender, instance, **kwargs):
+    reindex_entity("missing", instance)
+
+
+@receiver(post_delete, sender=Post, dispatch_uid="search_index_admin_post_deleted")
+@receiver(post_delete, sender=DogAnnouncement, dispatch_uid="search_index_announcement_deleted")
+@receiver(post_delete, sender=UserAdoptionPost, dispatch_uid="search_index_user_post_deleted")
+@receiver(post_delete, sender=MissingDogPost, dispatch_uid="search_index_missing_post_deleted")
+def remove_deleted_listing_search(sender, instance, **kwargs):
+    feed_type = {
+        Post: "admin",
+        DogAnnouncement: "announcement",
+        UserAdoptionPost: "user",
+        MissingDogPost: "missing",
+    }[sender]
+    remove_entity(feed_type, instance.pk)
+
+
+# Other processes replay the change log against the database, so entries are
+# only written once the row they point at has committed.
+@receiver(post_save, sender=Post, dispatch_uid="finder_index_admin_post_saved")
+def record_admin_post_finder_change(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= FINDER_INDEX_IRRELEVANT_FIELDS:
+        return
+    transaction.on_commit(partial(record_finder_change, "staff", instance.pk))
+
+
+@receiver(post_delete, sender=Post, dispatch_uid="finder_index_admin_post_deleted")
+def record_deleted_admin_post_finder_change(sender, instance, **kwargs):
+    transaction.on_commit(partial(record_finder_change, "staff", instance.pk))
+
+
+@receiver(post_save, sender=UserAdoptionPost, dispatch_uid="finder_index_user_post_saved")
+@receiver(post_delete, sender=UserAdoptionPost, dispatch_uid="finder_index_user_post_deleted")
+def record_user_adoption_post_finder_change(sender, instance, **kwargs):
+    transaction.on_commit(partial(record_finder_change, "user", instance.pk))
+
+
+@receiver(pre_save, sender=User, dispatch_uid="search_index_owner_name_snapshot")
+def snapshot_owner_name_for_search(sender, instance, update_fields=None, **kwargs):
+    instance._search_index_previous_names = None
+    # Only saves that name a name field can rename; full saves (logins, admin edits) skip the lookup.
+    if not instance.pk or update_fields is None or not set(update_fields) & set(SEARCH_OWNER_NAME_FIELDS):
+        return
+    instance._search_index_previous_names = (
+        User.objects.filter(pk=instance.pk)
+        .values_list(*SEARCH_OWNER_NAME_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=User, dispatch_uid="search_index_owner_renamed")
+def reindex_renamed_owner_search(sender, instance, created=False, **kwargs):
+    previous_names = getattr(instance, "_search_index_previous_names", None)
+    if created or previous_names is None:
+        return
+    if previous_names != tuple(getattr(instance, field) for field in SEARCH_OWNER_NAME_FIELDS):
+        reindex_owner_entities(instance.pk)
+
+
+# Saves touching only other fields cannot change what a notification says.
+ADMIN_POST_NOTIFICATION_FIELDS = frozenset({"caption"})
+POST_REQUEST_NOTIFICATION_FIELDS = frozenset({"status", "scheduled_appointment_date"})
+COMMUNITY_POST_NOTIFICATION_FIELDS = frozenset({"status", "dog_name", "location", "owner", "owner_id"})
+
+
+@receiver(post_save, sender=DogAnnouncement, dispatch_uid="user_inbox_announcement_saved")
+def notify_members_of_announcement(sender, instance, created=False, **kwargs):
+    if created:
+        if instance.created_by.is_staff:
+            notify_members(announcement_notification(instance))
+        return
+    refresh_notification(announcement_notification(instance))
+
+
+@receiver(post_save, sender=Post, dispatch_uid="user_inbox_admin_post_saved")
+def notify_members_of_admin_post(sender, instance, created=False, update_fields=None, **kwargs):
+    if created:
+        if instance.user.is_staff:
+            notify_members(admin_post_notification(instance))
+        return
+    if update_fields is None or set(update_fields) & ADMIN_POST_NOTIFICATION_FIELDS:
+        refresh_notification(admin_post_notification(instance))
+
+
+@receiver(post_save, sender=UserAdoptionPost, dispatch_uid="user_inbox_user_post_saved")
+def notify_members_of_community_post(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & COMMUNITY_POST_NOTIFICATION_FIELDS:
+        return
+    if instance.status == "available":
+        notify_members(community_post_notification(instance), exclude_user_id=instance.owner_id)
+    else:
+        withdraw_notifications([notification_key("community_post", instance.pk)])
+
+
+@receiver(post_delete, sender=DogAnnouncement, dispatch_uid="user_inbox_announcement_deleted")
+@receiver(post_delete, sender=Post, dispatch_uid="user_inbox_admin_post_deleted")
+@receiver(post_delete, sender=UserAdoptionPost, dispatch_uid="user_inbox_user_post_deleted")
+def withdraw_deleted_listing_notifications(sender, instance, **kwargs):
+    kind = {
+        DogAnnouncement: "announcement",
+        Post: "admin_post",
+        UserAdoptionPost: "community_post",
+    }[sender]
+    withdraw_notifications([notification_key(kind, instance.pk)])
+
+
+@receiver(post_save, sender=PostRequest, dispatch_uid="user_inbox_post_request_saved")
+def notify_requester_of_review(sender, instance, created=False, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & POST_REQUEST_NOTIFICATION_FIELDS:
+        return
+    if instance.status == "accepted":
+        notify_user(instance.user_id, accepted_request_notification(instance))
+    elif not created:
+        withdraw_notifications(
+            [notification_key("accepted_request", instance.pk)],
+            user_id=instance.user_id,
+        )
+
+
+@receiver(post_delete, sender=PostRequest, dispatch_uid="user_inbox_post_request_deleted")
+def withdraw_deleted_post_request_notification(sender, instance, **kwargs):
+    withdraw_notifications(
+        [notification_key("accepted_request", instance.pk)],
+        user_id=instance.user_id,
+    )
+
+
+@receiver(post_save, sender=UserAdoptionRequest, dispatch_uid="user_inbox_user_request_saved")
+def notify_owner_of_adoption_request(sender, instance, created=False, **kwargs):
+    if instance.status == "pending":
+        if created:
+            notify_user(instance.post.owner_id, incoming_request_notification(instance))
+        return
+    withdraw_notifications(
+        [notification_key("incoming_user_request", instance.pk)],
+        user_id=instance.post.owner_id,
+    )
+
+
+@receiver(post_delete, sender=UserAdoptionRequest, dispatch_uid="user_inbox_user_request_deleted")
+def withdraw_deleted_adoption_request_notification(sender, instance, **kwargs):
+    withdraw_notifications([notification_key("incoming_user_request", instance.pk)])
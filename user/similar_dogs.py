@@ -0,0 +1,247 @@
+"""Per-process "dogs like this" recommendations over open rescue and community listings.
+
+Each listing the finder can show is one row of small integer codes (breed,
+age, size, gender, coat, barangay) plus a color bit row. Scoring a listing
+against all others is a handful of vectorized NumPy comparisons, and the
+top ``k`` come from ``argpartition``.
+
+The matrix follows the finder change log (see ``user.finder_index``): a
+process replays the listings changed since its last read and rewrites only
+those rows.
+"""
+import threading
+
+import numpy as np
+from django.utils import timezone
+
+from dogadoption_admin.models import Post
+
+from .finder_index import (
+    FINDER_FACET_FIELDS,
+    finder_change_sequence,
+    finder_querysets,
+    normalize_finder_location,
+    pending_finder_changes,
+)
+
+
+SIMILAR_DOG_KINDS = ("staff", "user")
+SIMILAR_DOG_WEIGHTS = {
+    "breed": 3.0,
+    "age_group": 1.5,
+    "size_group": 1.5,
+    "gender": 0.5,
+    "coat_length": 1.0,
+    "colors": 2.0,
+    "location": 1.0,
+}
+SIMILAR_DOG_INITIAL_CAPACITY = 256
+# Columns of the integer code matrix; 0 means "not listed".
+_CODE_COLUMNS = ("breed", "age_group", "size_group", "gender", "coat_length", "location")
+_ORDINAL_COLUMNS = ("age_group", "size_group")
+_CHOICE_CODES = {
+    # "Other" breeds and colors share a code but say nothing about each other, so they stay unlisted.
+    "breed": {
+        value: code
+        for code, (value, _label) in enumerate(Post.BREED_CHOICES, start=1)
+        if value != Post.BREED_OTHER
+    },
+    "age_group": {value: code for code, (value, _label) in enumerate(Post.AGE_GROUP_CHOICES, start=1)},
+    "size_group": {value: code for code, (value, _label) in enumerate(Post.SIZE_GROUP_CHOICES, start=1)},
+    "gender": {value: code for code, (value, _label) in enumerate(Post.GENDER_CHOICES, start=1)},
+    "coat_length": {value: code for code, (value, _label) in enumerate(Post.COAT_LENGTH_CHOICES, start=1)},
+}
+_COLOR_BITS = {
+    value: bit
+    for bit, value in enumerate(value for value, _label in Post.COLOR_CHOICES if value != Post.COLOR_OTHER)
+}
+_ORDINAL_SPANS = {
+    "age_group": max(len(Post.AGE_GROUP_CHOICES) - 1, 1),
+    "size_group": max(len(Post.SIZE_GROUP_CHOICES) - 1, 1),
+}
+
+_similar_state = {"sequence": None, "matrix": None}
+_similar_lock = threading.Lock()
+
+
+class SimilarDogMatrix:
+    """Row-per-listing feature matrix with free-slot reuse, grown by doubling."""
+
+    def __init__(self, capacity=SIMILAR_DOG_INITIAL_CAPACITY):
+        self._slots = {}
+        self._free_slots = []
+        self._size = 0
+        self._location_codes = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.codes = np.zeros((capacity, len(_CODE_COLUMNS)), dtype=np.int16)
+        self.colors = np.zeros((capacity, len(_COLOR_BITS)), dtype=np.float32)
+        self.kinds = np.zeros(capacity, dtype=np.int8)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.closes = np.full(capacity, -np.inf)
+        self.valid = np.zeros(capacity, dtype=bool)
+
+    def _grow(self):
+        old = (self.codes, self.colors, self.kinds, self.ids, self.closes, self.valid)
+        self._allocate(len(self.valid) * 2)
+        for new_array, old_array in zip(
+            (self.codes, self.colors, self.kinds, self.ids, self.closes, self.valid),
+            old,
+        ):
+            new_array[:len(old_array)] = old_array
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _location_code(self, location):
+        location = normalize_finder_location(location)
+        if not location:
+            return 0
+        return self._location_codes.setdefault(location, len(self._location_codes) + 1)
+
+    def upsert(self, kind, row, closes_ts):
+        """Write one ``FINDER_FACET_FIELDS`` row; ``closes_ts`` is when it stops being listed."""
+        entity_id = row[0]
+        slot = self._slots.get((kind, entity_id))
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                if self._size == len(self.valid):
+                    self._grow()
+                slot = self._size
+                self._size += 1
+            self._slots[(kind, entity_id)] = slot
+
+        values = dict(zip(FINDER_FACET_FIELDS, row))
+        self.codes[slot] = [
+            self._location_code(values["location"])
+            if column == "location"
+            else _CHOICE_CODES[column].get(values[column] or "", 0)
+            for column in _CODE_COLUMNS
+        ]
+        raw_colors = values["colors"] or []
+        if isinstance(raw_colors, str):
+            raw_colors = [raw_colors]
+        self.colors[slot] = 0
+        for color in raw_colors:
+            if color in _COLOR_BITS:
+                self.colors[slot, _COLOR_BITS[color]] = 1
+        self.kinds[slot] = SIMILAR_DOG_KINDS.index(kind)
+        self.ids[slot] = entity_id
+        self.closes[slot] = closes_ts
+        self.valid[slot] = True
+
+    def remove(self, kind, entity_id):
+        slot = self._slots.pop((kind, entity_id), None)
+        if slot is None:
+            return
+        self.valid[slot] = False
+        self._free_slots.append(slot)
+
+    def similar(self, kind, entity_id, limit, now_ts=None):
+        """Top ``limit`` ``(kind, id)`` pairs most like the given listing, best first."""
+        slot = self._slots.get((kind, entity_id))
+        if slot is None or limit <= 0:
+            return []
+        size = self._size
+        codes = self.codes[:size]
+        target = self.codes[slot]
+        scores = np.zeros(size, dtype=np.float32)
+        for column_index, column in enumerate(_CODE_COLUMNS):
+            column_codes = codes[:, column_index]
+            target_code = target[column_index]
+            if not target_code:
+                continue
+            listed = column_codes > 0
+            if column in _ORDINAL_COLUMNS:
+                closeness = 1.0 - np.abs(column_codes - target_code) / _ORDINAL_SPANS[column]
+                scores += SIMILAR_DOG_WEIGHTS[column] * np.where(listed, closeness, 0.0)
+            else:
+                scores += SIMILAR_DOG_WEIGHTS[column] * (column_codes == target_code)
+
+        colors = self.colors[:size]
+        target_colors = self.colors[slot]
+        shared = colors @ target_colors
+        union = colors.sum(axis=1) + target_colors.sum() - shared
+        scores += SIMILAR_DOG_WEIGHTS["colors"] * np.divide(
+            shared,
+            union,
+            out=np.zeros(size, dtype=np.float32),
+            where=union > 0,
+        )
+
+        now_ts = timezone.now().timestamp() if now_ts is None else now_ts
+        eligible = self.valid[:size] & (self.closes[:size] >= now_ts) & (scores > 0)
+        eligible[slot] = False
+        candidates = np.flatnonzero(eligible)
+        if not len(candidates):
+            return []
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        # Best score first; newer ids win ties so fresh listings surface.
+        ordered = candidates[np.lexsort((-self.ids[candidates], -scores[candidates]))]
+        return [
+            (SIMILAR_DOG_KINDS[self.kinds[index]], int(self.ids[index]))
+            for index in ordered
+        ]
+
+
+def _closes_timestamp(kind, phase_ends_at):
+    if kind == "user":
+        return np.inf
+    return phase_ends_at.timestamp() if phase_ends_at else -np.inf
+
+
+def _load_rows(matrix, kind, queryset):
+    fields = (*FINDER_FACET_FIELDS, "phase_ends_at") if kind == "staff" else FINDER_FACET_FIELDS
+    loaded_ids = set()
+    for row in queryset.values_list(*fields).iterator(chunk_size=1000):
+        phase_ends_at = row[len(FINDER_FACET_FIELDS)] if kind == "staff" else None
+        matrix.upsert(kind, row[:len(FINDER_FACET_FIELDS)], _closes_timestamp(kind, phase_ends_at))
+        loaded_ids.add(row[0])
+    return loaded_ids
+
+
+def _build_similar_dog_matrix():
+    matrix = SimilarDogMatrix()
+    for kind, queryset in finder_querysets().items():
+        _load_rows(matrix, kind, queryset.order_by("pk"))
+    return matrix
+
+
+def _replay_changes(matrix, changes):
+    ids_by_kind = {kind: set() for kind in SIMILAR_DOG_KINDS}
+    for kind, entity_id in changes:
+        ids_by_kind[kind].add(entity_id)
+    for kind, queryset in finder_querysets().items():
+        changed_ids = ids_by_kind[kind]
+        if not changed_ids:
+            continue
+        loaded_ids = _load_rows(matrix, kind, queryset.filter(pk__in=changed_ids))
+        for entity_id in changed_ids - loaded_ids:
+            matrix.remove(kind, entity_id)
+
+
+def get_similar_dog_matrix():
+    sequence = finder_change_sequence()
+    if _similar_state["matrix"] is not None and _similar_state["sequence"] == sequence:
+        return _similar_state["matrix"]
+    with _similar_lock:
+        if _similar_state["matrix"] is not None and _similar_state["sequence"] == sequence:
+            return _similar_state["matrix"]
+        changes = None
+        if _similar_state["matrix"] is not None:
+            changes = pending_finder_changes(_similar_state["sequence"], sequence)
+        if changes is None:
+            _similar_state["matrix"] = _build_similar_dog_matrix()
+        else:
+            _replay_changes(_similar_state["matrix"], changes)
+        _similar_state["sequence"] = sequence
+        return _similar_state["matrix"]
+
+
+def similar_dogs(kind, entity_id, limit):
+    return get_similar_dog_matrix().similar(kind, entity_id, limit)
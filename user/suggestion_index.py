@@ -0,0 +1,138 @@
+"""Per-process prefix index behind search-as-you-type suggestions.
+
+The trie holds breed labels, Bayawan barangays, live dog names and listing
+locations. Every node keeps its best few suggestions, so a lookup is one walk
+down the typed prefix with no database or cache round-trip. The trie is
+rebuilt lazily the first time it is read after the home feed namespace moves.
+"""
+import re
+import threading
+from collections import Counter
+
+from dogadoption_admin.barangays import BAYAWAN_BARANGAYS
+from dogadoption_admin.models import Post
+
+from .models import MissingDogPost, UserAdoptionPost
+from .notification_utils import get_user_home_feed_namespace
+
+
+SUGGESTION_NODE_LIMIT = 10
+SUGGESTION_MAX_PREFIX_LENGTH = 24
+SUGGESTION_MAX_LABEL_LENGTH = 80
+SUGGESTION_KIND_PRIORITY = {"breed": 0, "barangay": 1, "location": 2, "dog_name": 3}
+_NON_WORD_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+
+_suggestion_state = {"namespace": None, "trie": None}
+_suggestion_lock = threading.Lock()
+
+
+def normalize_suggestion_text(text):
+    return " ".join(_NON_WORD_PATTERN.sub(" ", str(text or "").casefold()).split())
+
+
+def _clean_label(value):
+    return " ".join(str(value or "").split())[:SUGGESTION_MAX_LABEL_LENGTH]
+
+
+class SuggestionTrie:
+    """Prefix trie whose nodes carry their top ``SUGGESTION_NODE_LIMIT`` entries."""
+
+    __slots__ = ("_root",)
+
+    def __init__(self, entries):
+        # Node layout: [children, ranked suggestions]; suggestions are (label, kind) pairs.
+        self._root = [{}, []]
+        ranked_entries = sorted(
+            entries,
+            key=lambda entry: (
+                SUGGESTION_KIND_PRIORITY[entry[1]],
+                -entry[2],
+                entry[0].casefold(),
+            ),
+        )
+        seen_labels = set()
+        for label, kind, _count in ranked_entries:
+            label_key = label.casefold()
+            if label_key in seen_labels:
+                continue
+            seen_labels.add(label_key)
+            self._insert(label, kind)
+
+    def _insert(self, label, kind):
+        normalized = normalize_suggestion_text(label)
+        if not normalized:
+            return
+        word_starts = [0] + [
+            index + 1 for index, char in enumerate(normalized) if char == " "
+        ]
+        visited = set()
+        for start in word_starts:
+            node = self._root
+            for char in normalized[start:start + SUGGESTION_MAX_PREFIX_LENGTH]:
+                node = node[0].setdefault(char, [{}, []])
+                # Entries arrive best first, so a node's list fills in rank order.
+                if id(node) not in visited and len(node[1]) < SUGGESTION_NODE_LIMIT:
+                    node[1].append((label, kind))
+                    visited.add(id(node))
+
+    def lookup(self, prefix, limit=SUGGESTION_NODE_LIMIT):
+        node = self._root
+        for char in normalize_suggestion_text(prefix)[:SUGGESTION_MAX_PREFIX_LENGTH]:
+            node = node[0].get(char)
+            if node is None:
+                return []
+        if node is self._root:
+            return []
+        return node[1][:limit]
+
+
+def _suggestion_entries():
+    entries = [
+        (label, "breed", 1)
+        for value, label in Post.BREED_CHOICES
+        if value != Post.BREED_OTHER
+    ]
+    entries.extend((name, "barangay", 1) for name in BAYAWAN_BARANGAYS)
+
+    live_querysets = (
+        Post.objects.filter(is_history=False).exclude(status__in=["reunited", "adopted"]),
+        UserAdoptionPost.objects.filter(status="available"),
+        MissingDogPost.objects.filter(status="missing"),
+    )
+    other_breeds = Counter()
+    locations = Counter()
+    for queryset in live_querysets:
+        for breed, breed_other, location in queryset.values_list("breed", "breed_other", "location"):
+            if breed == Post.BREED_OTHER and _clean_label(breed_other):
+                other_breeds[_clean_label(breed_other)] += 1
+            if _clean_label(location):
+                locations[_clean_label(location)] += 1
+
+    dog_names = Counter()
+    for queryset in live_querysets[1:]:
+        for dog_name in queryset.values_list("dog_name", flat=True):
+            if _clean_label(dog_name):
+                dog_names[_clean_label(dog_name)] += 1
+
+    entries.extend((label, "breed", count) for label, count in other_breeds.items())
+    entries.extend((label, "location", count) for label, count in locations.items())
+    entries.extend((label, "dog_name", count) for label, count in dog_names.items())
+    return entries
+
+
+def get_suggestion_trie():
+    namespace = get_user_home_feed_namespace()
+    if _suggestion_state["trie"] is not None and _suggestion_state["namespace"] == namespace:
+        return _suggestion_state["trie"]
+    with _suggestion_lock:
+        if _suggestion_state["trie"] is None or _suggestion_state["namespace"] != namespace:
+            _suggestion_state["trie"] = SuggestionTrie(_suggestion_entries())
+            _suggestion_state["namespace"] = namespace
+        return _suggestion_state["trie"]
+
+
+def search_suggestions(prefix, limit=SUGGESTION_NODE_LIMIT):
+    return [
+        {"label": label, "kind": kind}
+        for label, kind in get_suggestion_trie().lookup(prefix, limit)
+    ]
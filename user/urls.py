@@ -16,6 +16,7 @@ urlpatterns = [
     path('notifications/', views.notifications_list, name='notifications_list'),
     path('notifications/open/', views.open_notification, name='open_notification'),
     path('notifications/summary/', views.notification_summary, name='notification_summary'),
+    path('notifications/stream/', views.notification_stream, name='notification_stream'),
     path('notifications/read/', views.mark_notification_read, name='mark_notification_read'),
     path('notifications/seen/', views.mark_notifications_seen, name='mark_notifications_seen'),
     path('sign-up/', views.signup_view, name="signup"),
@@ -33,7 +34,9 @@ urlpatterns = [
 
     # Navigation 1/5: Home
     path('', views.user_home, name="user_home"),
+    path('feed/next/', views.home_feed_next, name='home_feed_next'),
     path('search/', views.home_search, name='home_search'),
+    path('search/suggest/', views.home_search_suggestions, name='home_search_suggestions'),
     path('post/create/', views.create_post, name='create_post'),
     path('user-adopt/requests/', views.user_adoption_requests, name='user_adoption_requests'),
     path('user-adopt/<useradoptpostid:post_id>/', views.adopt_user_post, name='adopt_user_post'),
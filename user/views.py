@@ -4,6 +4,7 @@ from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.tokens import default_token_generator
 from django.contrib.auth.validators import ASCIIUsernameValidator
 from django.contrib.auth.password_validation import validate_password
+from django.core import signing
 from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
 from django.views.decorators.http import require_POST, require_http_methods
@@ -24,7 +25,8 @@ import re
 import random
 import secrets
 import shutil
-from django.http import JsonResponse, QueryDict
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, QueryDict, StreamingHttpResponse
 from django.core.files.base import ContentFile
 from django.conf import settings
 from django.core.cache import cache
@@ -39,6 +41,7 @@ from django.utils.http import (
     urlsafe_base64_decode,
     urlsafe_base64_encode,
 )
+from django.template.loader import render_to_string
 from django.templatetags.static import static
 from django.utils.html import strip_tags
 from urllib.parse import urlencode
@@ -51,6 +54,7 @@ logger = logging.getLogger(__name__)
 from dogadoption_admin.access import get_admin_access, get_staff_landing_url, is_route_allowed
 from dogadoption_admin.barangays import BAYAWAN_BARANGAYS
 from dogadoption_admin.citation_subitems import citation_fee_total, normalize_subitems
+from dogadoption_admin.phase_scheduler import phase_scheduler_is_live
 from dogadoption_admin.models import (
     AdminNotification,
     AnnouncementComment,
@@ -74,23 +78,38 @@ from .models import UserAdoptionPost, UserAdoptionImage, UserAdoptionRequest, Mi
 # Forms and notification helpers
 from .forms import DogSightingForm, MissingDogPostForm, RescueFinderForm, UserAdoptionPostForm
 from .avatar_cache import invalidate_cached_profile_avatar
+from .finder_index import get_finder_index, normalize_finder_location
+from .search_index import search_ranked_ids
+from .similar_dogs import similar_dogs
+from .suggestion_index import SUGGESTION_NODE_LIMIT, search_suggestions
+from .feed_store import (
+    FEED_CARD_TTL_SECONDS,
+    FEED_POOL_CANDIDATE_LIMITS,
+    PackedFeedRows,
+    feed_card_cache_key,
+    get_feed_candidate_pools,
+    pool_candidate_ids,
+)
 from .auth_modal_session import (
     build_home_auth_modal_url as _build_home_auth_modal_url_impl,
     redirect_modal_login_error,
     redirect_modal_signup_error,
 )
+from .notification_inbox import notification_key, withdraw_notifications
+from .notification_stream import notification_poll_events, notification_stream_events
 from .notification_utils import (
+    USER_REGISTERED_DOG_VACCINATION_FIELDS,
     build_user_notifications_page_list,
-    build_user_notification_payload,
     build_user_notification_summary,
     build_user_registered_dog_vaccination_status_map,
     build_user_vaccination_reminder_summary,
     bump_user_home_feed_namespace,
+    find_user_notification_url,
     get_user_home_feed_namespace,
     invalidate_user_notification_content,
     invalidate_user_notification_payload,
+    mark_all_user_notifications_read,
     mark_user_notification_read,
-    mark_user_notifications_read,
 )
 
 # Administrative and user models above are shared across multiple public flows.
@@ -103,6 +122,7 @@ from .notification_utils import (
 ACTIVE_BARANGAY_LOOKUP_CACHE_KEY = "user_active_barangay_lookup"
 ACTIVE_BARANGAY_LOOKUP_CACHE_TTL_SECONDS = 300
 HOME_FEED_SESSION_TOKEN_KEY = "user_home_feed_token"
+HOME_FEED_CURSOR_SALT = "user-home-feed-cursor"
 BARANGAY_API_DEFAULT_LIMIT = 200
 BARANGAY_API_MAX_LIMIT = 200
 DEFAULT_REQUEST_CITY = "Bayawan City"
@@ -1199,6 +1219,7 @@ def _build_profile_registered_dogs(profile_user):
     registered_dogs_limit = 12
     registered_dogs_qs = list(
         Dog.objects.filter(owner_user=profile_user)
+        .select_related("latest_vaccination")
         .prefetch_related(
             Prefetch(
                 "images",
@@ -1206,14 +1227,12 @@ def _build_profile_registered_dogs(profile_user):
             )
         )
         .only(
-            "id",
-            "name",
+            *USER_REGISTERED_DOG_VACCINATION_FIELDS,
             "species",
             "sex",
             "age",
             "neutering_status",
             "color",
-            "date_registered",
             "owner_address",
             "barangay",
         )
@@ -1523,11 +1542,7 @@ def logout_view(request):
 @user_only
 def mark_notifications_seen(request):
     """Mark the latest user notifications as read for the current session."""
-    payload = build_user_notification_payload(request.user, limit=None)
-    mark_user_notifications_read(
-        request,
-        [item.get("key", "") for item in payload.get("items", [])],
-    )
+    mark_all_user_notifications_read(request)
     summary = build_user_notification_summary(request)
     return JsonResponse({"ok": True, "unread_count": summary["unread_count"]})
 
@@ -1560,6 +1575,24 @@ def notification_summary(request):
     return JsonResponse(build_user_notification_summary(request))
 
 
+@user_only
+def notification_stream(request):
+    """Push notification summaries as Server-Sent Events whenever the user's versions change."""
+    last_event_id = (
+        request.headers.get("Last-Event-ID")
+        or request.GET.get("last_event_id")
+        or ""
+    ).strip()
+    if isinstance(request, ASGIRequest):
+        events = notification_stream_events(request, last_event_id)
+    else:
+        events = notification_poll_events(request, last_event_id)
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @user_only
 def notifications_list(request):
     """Full notifications page: newest first within unread/read groups; optional sort by type."""
@@ -1581,23 +1614,12 @@ def notifications_list(request):
 def open_notification(request):
     """Mark one user notification as read, then continue to its destination."""
     notification_key = (request.GET.get("key") or "").strip()
-    payload = build_user_notification_payload(request.user, limit=None)
-    matching_item = next(
-        (
-            item for item in payload.get("items", [])
-            if item.get("key", "").strip() == notification_key
-        ),
-        None,
-    )
+    target = find_user_notification_url(request.user, notification_key)
 
     if notification_key:
         mark_user_notification_read(request, notification_key)
 
-    target = (
-        matching_item.get("url")
-        if matching_item and matching_item.get("url")
-        else request.GET.get("next", "")
-    )
+    target = target or request.GET.get("next", "")
     if not url_has_allowed_host_and_scheme(
         target,
         allowed_hosts={request.get_host()},
@@ -1780,8 +1802,12 @@ def _featured_time_left_context(phase, phase_payload):
     return "Before the adoption window closes."
 
 
-def _post_phase_payload(post):
-    phase = post.current_phase() if hasattr(post, "current_phase") else "closed"
+def _post_phase_payload(post, phase_state=None):
+    """Countdown payload for one post; pass a ``Post.compute_phases`` entry to skip per-post date math."""
+    if phase_state is not None:
+        phase = phase_state["phase"]
+    else:
+        phase = post.current_phase() if hasattr(post, "current_phase") else "closed"
     is_pending_review = (
         phase in {"claim", "adopt"}
         and bool(getattr(post, f"has_pending_{phase}_request", False))
@@ -1793,7 +1819,9 @@ def _post_phase_payload(post):
     )
     days = hours = minutes = 0
     if phase in {"claim", "adopt"}:
-        days, hours, minutes = _split_time_left(post.time_left())
+        days, hours, minutes = _split_time_left(
+            phase_state["time_left"] if phase_state is not None else post.time_left()
+        )
     return {
         "phase": phase,
         "days_left": days,
@@ -1897,7 +1925,7 @@ def _finder_default_purpose(listing_mode):
 
 
 def _normalize_rescue_location(value):
-    return " ".join((value or "").split()).casefold()
+    return normalize_finder_location(value)
 
 
 def _merge_rescue_finder_locations(*location_groups):
@@ -1924,27 +1952,6 @@ def _rescue_finder_choice_map(field):
     }
 
 
-def _rescue_finder_post_matches(post, key, value):
-    if not value:
-        return False
-    if key == "color":
-        raw_colors = post.colors or []
-        if isinstance(raw_colors, str):
-            raw_colors = [raw_colors]
-        return value in raw_colors
-    if key == "location":
-        return _normalize_rescue_location(post.location) == _normalize_rescue_location(value)
-    return getattr(post, key, "") == value
-
-
-def _rescue_finder_match_score(post, selected_filters):
-    return sum(
-        1
-        for key, value in selected_filters.items()
-        if value and _rescue_finder_post_matches(post, key, value)
-    )
-
-
 def _rescue_finder_phase_priority(phase, preferred_phase):
     if preferred_phase in {"claim", "adopt"}:
         return 0 if phase == preferred_phase else 1
@@ -2206,20 +2213,11 @@ def _finder_maybe_redirect_for_highlight(
     highlight_val = f"{kind}:{hid}"
 
     def _find_index(entries):
-        if kind == "user":
-            return next(
-                (
-                    i
-                    for i, e in enumerate(entries)
-                    if e[0] == "user" and e[1].get("post_id") == hid
-                ),
-                None,
-            )
         return next(
             (
                 i
                 for i, e in enumerate(entries)
-                if e[0] == "staff" and e[1]["post"].id == hid
+                if e[0] == kind and e[1]["post_id"] == hid
             ),
             None,
         )
@@ -2293,6 +2291,7 @@ def _build_rescue_finder_card_item(
     match_score,
     *,
     viewer_request_map=None,
+    phase_state=None,
 ):
     phase = phase_payload["phase"]
     days = phase_payload["days_left"]
@@ -2300,11 +2299,18 @@ def _build_rescue_finder_card_item(
     minutes = phase_payload["minutes_left"]
     pending_review_until_label = phase_payload["pending_review_until_label"]
     location_label = " ".join((post.location or "").split()) or "Location not listed"
-    countdown_deadline = (
-        post.claim_deadline()
-        if phase == "claim"
-        else post.adoption_deadline()
-    )
+    if phase_state is not None:
+        countdown_deadline = (
+            phase_state["claim_deadline"]
+            if phase == "claim"
+            else phase_state["adoption_deadline"]
+        )
+    else:
+        countdown_deadline = (
+            post.claim_deadline()
+            if phase == "claim"
+            else post.adoption_deadline()
+        )
     countdown_deadline_local = (
         timezone.localtime(countdown_deadline)
         if countdown_deadline and timezone.is_aware(countdown_deadline)
@@ -2326,6 +2332,7 @@ def _build_rescue_finder_card_item(
     cta_flags = _staff_post_public_cta_flags(phase, request.user, vf)
     return {
         "post": post,
+        "post_id": post.id,
         "phase": phase,
         "phase_label": "Redeem" if phase == "claim" else "Adopt",
         "phase_title": phase_title,
@@ -2422,6 +2429,10 @@ def _filter_public_posts(posts_qs, listing_mode, filter_type):
     posts = list(posts_qs)
     Post.attach_active_appointment_dates(posts)
     active_statuses = ["rescued", "under_care"]
+    phase_by_id = {
+        post.id: state["phase"]
+        for post, state in zip(posts, Post.compute_phases(posts))
+    }
 
     if listing_mode == "claim":
         allowed_filters = {"all", "ready_claim", "reunited"}
@@ -2432,7 +2443,7 @@ def _filter_public_posts(posts_qs, listing_mode, filter_type):
             posts = [
                 post
                 for post in posts
-                if post.status in active_statuses and post.current_phase() == "claim"
+                if post.status in active_statuses and phase_by_id[post.id] == "claim"
             ]
         elif filter_type == "reunited":
             posts = [post for post in posts if post.status == "reunited"]
@@ -2441,7 +2452,7 @@ def _filter_public_posts(posts_qs, listing_mode, filter_type):
                 post
                 for post in posts
                 if post.status == "reunited"
-                or (post.status in active_statuses and post.current_phase() == "claim")
+                or (post.status in active_statuses and phase_by_id[post.id] == "claim")
             ]
         return posts, filter_type
 
@@ -2453,7 +2464,7 @@ def _filter_public_posts(posts_qs, listing_mode, filter_type):
         posts = [
             post
             for post in posts
-            if post.status in active_statuses and post.current_phase() == "adopt"
+            if post.status in active_statuses and phase_by_id[post.id] == "adopt"
         ]
     elif filter_type == "adopted":
         posts = [post for post in posts if post.status == "adopted"]
@@ -2462,7 +2473,7 @@ def _filter_public_posts(posts_qs, listing_mode, filter_type):
             post
             for post in posts
             if post.status == "adopted"
-            or (post.status in active_statuses and post.current_phase() == "adopt")
+            or (post.status in active_statuses and phase_by_id[post.id] == "adopt")
         ]
 
     return posts, filter_type
@@ -2491,15 +2502,15 @@ def _finder_unified_sort_key(entry):
         return (
             deadline_ts,
             -item.get("match_score", 0),
-            0 if item.get("main_image_url") else 1,
+            0 if item["has_image"] else 1,
             -item["created_at"].timestamp(),
             item["post_id"],
         )
     return (
         deadline_ts,
         -item.get("match_score", 0),
-        0 if item.get("main_image_url") else 1,
-        item["post"].id,
+        0 if item["has_image"] else 1,
+        item["post_id"],
     )
 
 
@@ -2521,29 +2532,209 @@ def _finder_unified_entries(selected_purpose, claim_items, adopt_items, user_ado
     return parts
 
 
+def _finder_staff_sort_rows():
+    """
+    Sort inputs for every rescue post inside a claim/adopt window.
+
+    Reads only the columns the phase math needs plus an image-exists flag, so
+    no cards, image URLs or share links are built for posts off the page.
+    """
+    light_posts = list(
+        Post.objects.filter(
+            is_history=False,
+            status__in=["rescued", "under_care"],
+            phase_ends_at__gte=timezone.now(),
+        )
+        .only(
+            "id",
+            "status",
+            "location",
+            "created_at",
+            "claim_days",
+            "phase_override",
+            "phase_override_started_at",
+        )
+        .annotate(has_image=Exists(PostImage.objects.filter(post_id=OuterRef("pk"))))
+    )
+    rows = []
+    for post, phase_state in zip(light_posts, Post.compute_phases(light_posts)):
+        phase = phase_state["phase"]
+        if phase not in {"claim", "adopt"}:
+            continue
+        if _split_time_left(phase_state["time_left"]) == (0, 0, 0):
+            continue
+        deadline = (
+            phase_state["claim_deadline"]
+            if phase == "claim"
+            else phase_state["adoption_deadline"]
+        )
+        rows.append({
+            "post_id": post.id,
+            "phase": phase,
+            "phase_state": phase_state,
+            "location": post.location,
+            "has_image": post.has_image,
+            "match_score": 0,
+            "sort_deadline_ts": deadline.timestamp() if deadline else float("inf"),
+        })
+    return rows
+
+
+def _finder_user_sort_rows(selected_filters, finder_index):
+    user_qs = UserAdoptionPost.objects.filter(status="available")
+    if any(selected_filters.values()):
+        user_qs = user_qs.filter(pk__in=finder_index.matching_ids("user", selected_filters))
+    match_scores = finder_index.match_scores("user", selected_filters)
+    return [
+        {
+            "post_id": post_id,
+            "created_at": created_at,
+            "has_image": has_image,
+            "match_score": match_scores.get(post_id, 0),
+            "sort_deadline_ts": float("inf"),
+        }
+        for post_id, created_at, has_image in user_qs.annotate(
+            has_image=Exists(UserAdoptionImage.objects.filter(post_id=OuterRef("pk")))
+        ).values_list("id", "created_at", "has_image")
+    ]
+
+
+def _build_finder_user_adoption_item(request, upost, match_score):
+    location_label = " ".join((upost.location or "").split()) or "Location not listed"
+    return {
+        "post": upost,
+        "post_id": upost.id,
+        "dog_name": upost.dog_name,
+        "breed_label": upost.display_breed or "Unknown Breed",
+        "age_label": upost.display_age_group or "Age not listed",
+        "size_label": upost.display_size_group or "Size not listed",
+        "gender_label": upost.get_gender_display() if upost.gender else "Gender not listed",
+        "coat_label": upost.display_coat_length or "Coat not listed",
+        "color_label": upost.display_colors or "Color not listed",
+        "location_label": location_label,
+        "description": upost.description or "",
+        "owner_username": upost.owner.username,
+        "owner_full_name": upost.owner.get_full_name(),
+        "main_image_url": _first_prefetched_image_url(upost.images.all()),
+        "lightbox_image_json": json.dumps(_prefetched_image_urls(upost.images.all())),
+        "match_score": match_score,
+        "created_at": upost.created_at,
+        "detail_url": reverse("user:user_adoption_post_detail", args=[upost.id]),
+        "share_url": _finder_share_url_user_adoption(request, upost.id),
+        "is_vaccinated": upost.is_vaccinated,
+        "is_registered": upost.is_registered,
+        "sort_deadline_ts": float("inf"),
+    }
+
+
+def _hydrate_finder_entries(request, entries):
+    """Build full cards for ``(kind, sort_row)`` entries only; returns ``{(kind, post_id): card}``."""
+    staff_rows = {row["post_id"]: row for kind, row in entries if kind == "staff"}
+    user_rows = {row["post_id"]: row for kind, row in entries if kind == "user"}
+
+    cards = {}
+    if staff_rows:
+        staff_posts = list(_base_public_post_queryset().filter(pk__in=staff_rows))
+        Post.attach_active_appointment_dates(staff_posts)
+        viewer_staff_request_map = _viewer_staff_post_request_map(
+            request.user,
+            [post.id for post in staff_posts],
+        )
+        for post in staff_posts:
+            row = staff_rows[post.id]
+            cards[("staff", post.id)] = _build_rescue_finder_card_item(
+                request,
+                post,
+                _post_phase_payload(post, row["phase_state"]),
+                row["match_score"],
+                viewer_request_map=viewer_staff_request_map,
+                phase_state=row["phase_state"],
+            )
+    if user_rows:
+        user_posts = (
+            UserAdoptionPost.objects.filter(pk__in=user_rows)
+            .select_related("owner", "owner__profile")
+            .prefetch_related(
+                Prefetch(
+                    "images",
+                    queryset=UserAdoptionImage.objects.only("id", "post_id", "image").order_by("id"),
+                )
+            )
+        )
+        for upost in user_posts:
+            cards[("user", upost.id)] = _build_finder_user_adoption_item(
+                request,
+                upost,
+                user_rows[upost.id]["match_score"],
+            )
+    return cards
+
+
+def _build_similar_dog_items(pairs):
+    """Compact cards for ``(kind, id)`` pairs from ``similar_dogs``, kept in the given order."""
+    staff_ids = [entity_id for kind, entity_id in pairs if kind == "staff"]
+    user_ids = [entity_id for kind, entity_id in pairs if kind == "user"]
+    items = {}
+    if staff_ids:
+        staff_posts = (
+            Post.objects.filter(pk__in=staff_ids)
+            .only("id", "caption", "breed", "breed_other", "location")
+            .prefetch_related(
+                Prefetch(
+                    "images",
+                    queryset=PostImage.objects.only("id", "post_id", "image").order_by("id"),
+                )
+            )
+        )
+        for post in staff_posts:
+            items[("staff", post.id)] = {
+                "kind": "staff",
+                "title": _rescue_finder_title(post),
+                "breed_label": post.display_breed or "Unknown Breed",
+                "location_label": " ".join((post.location or "").split()) or "Location not listed",
+                "image_url": _first_prefetched_image_url(post.images.all()),
+                "detail_url": reverse("user:post_detail", args=[post.id]),
+            }
+    if user_ids:
+        user_posts = (
+            UserAdoptionPost.objects.filter(pk__in=user_ids)
+            .only("id", "dog_name", "breed", "breed_other", "location")
+            .prefetch_related(
+                Prefetch(
+                    "images",
+                    queryset=UserAdoptionImage.objects.only("id", "post_id", "image").order_by("id"),
+                )
+            )
+        )
+        for upost in user_posts:
+            items[("user", upost.id)] = {
+                "kind": "user",
+                "title": upost.dog_name,
+                "breed_label": upost.display_breed or "Unknown Breed",
+                "location_label": " ".join((upost.location or "").split()) or "Location not listed",
+                "image_url": _first_prefetched_image_url(upost.images.all()),
+                "detail_url": reverse("user:user_adoption_post_detail", args=[upost.id]),
+            }
+    return [items[pair] for pair in pairs if pair in items]
+
+
 def _build_public_post_listing(request, listing_mode):
-    """Build the rescue finder page using real rescue-post phases and profile filters."""
+    """
+    Build the rescue finder page using real rescue-post phases and profile filters.
+
+    Sorting and pagination run over narrow sort rows; only the visible page
+    (and the recommended card) is hydrated into full cards.
+    """
     preferred_purpose = _finder_default_purpose(listing_mode)
-    raw_open_posts = list(
-        _base_public_post_queryset()
-        .filter(status__in=["rescued", "under_care"])
-    )
-    Post.attach_active_appointment_dates(raw_open_posts)
+    finder_index = get_finder_index()
 
-    open_post_rows = []
+    staff_rows = _finder_staff_sort_rows()
     location_map = {}
     phase_counts = {"all": 0, "claim": 0, "adopt": 0}
-    for post in raw_open_posts:
-        phase_payload = _post_phase_payload(post)
-        phase = phase_payload["phase"]
-        if phase not in {"claim", "adopt"}:
-            continue
-        if _is_post_time_expired(post, phase_payload):
-            continue
-        open_post_rows.append((post, phase_payload))
+    for row in staff_rows:
         phase_counts["all"] += 1
-        phase_counts[phase] += 1
-        location_value = " ".join((post.location or "").split())
+        phase_counts[row["phase"]] += 1
+        location_value = " ".join((row["location"] or "").split())
         if location_value:
             location_map.setdefault(_normalize_rescue_location(location_value), location_value)
 
@@ -2568,122 +2759,52 @@ def _build_public_post_listing(request, listing_mode):
     active_filter_chips = _build_rescue_finder_selected_chips(finder_form, selected_filters)
     active_filter_count = len(active_filter_chips)
 
-    open_post_ids = [p.id for p, _ in open_post_rows]
-    viewer_staff_request_map = _viewer_staff_post_request_map(request.user, open_post_ids)
+    staff_match_scores = finder_index.match_scores("staff", selected_filters)
+    for row in staff_rows:
+        row["match_score"] = staff_match_scores.get(row["post_id"], 0)
+    claim_rows = [row for row in staff_rows if row["phase"] == "claim"]
+    adopt_rows = [row for row in staff_rows if row["phase"] == "adopt"]
+    user_rows = _finder_user_sort_rows(selected_filters, finder_index)
 
-    claim_items = []
-    adopt_items = []
-
-    def _staff_finder_sort_key(item):
-        ts = item.get("sort_deadline_ts")
-        if ts is None:
-            ts = float("inf")
-        return (
-            ts,
-            -item["match_score"],
-            0 if item["main_image_url"] else 1,
-            item["post"].id,
-        )
-    for post, phase_payload in open_post_rows:
-        phase = phase_payload["phase"]
-        match_score = _rescue_finder_match_score(post, selected_filters)
-        card = _build_rescue_finder_card_item(
-            request,
-            post,
-            phase_payload,
-            match_score,
-            viewer_request_map=viewer_staff_request_map,
-        )
-        if phase == "claim":
-            claim_items.append(card)
-        else:
-            adopt_items.append(card)
-    claim_items.sort(key=_staff_finder_sort_key)
-    adopt_items.sort(key=_staff_finder_sort_key)
-
-    user_adoption_qs = (
-        UserAdoptionPost.objects
-        .filter(status="available")
-        .select_related("owner", "owner__profile")
-        .prefetch_related(
-            Prefetch(
-                "images",
-                queryset=UserAdoptionImage.objects.only("id", "post_id", "image").order_by("id"),
-            )
-        )
-        .order_by("-created_at")
-    )
-    user_adoption_items = []
-    for upost in user_adoption_qs:
-        if any(
-            selected_filters[k]
-            and not _rescue_finder_post_matches(upost, k, selected_filters[k])
-            for k in selected_filters
-        ):
-            continue
-        match_score = _rescue_finder_match_score(upost, selected_filters)
-        location_label = " ".join((upost.location or "").split()) or "Location not listed"
-        detail_url = reverse("user:user_adoption_post_detail", args=[upost.id])
-        user_adoption_items.append({
-            "post": upost,
-            "post_id": upost.id,
-            "dog_name": upost.dog_name,
-            "breed_label": upost.display_breed or "Unknown Breed",
-            "age_label": upost.display_age_group or "Age not listed",
-            "size_label": upost.display_size_group or "Size not listed",
-            "gender_label": upost.get_gender_display() if upost.gender else "Gender not listed",
-            "coat_label": upost.display_coat_length or "Coat not listed",
-            "color_label": upost.display_colors or "Color not listed",
-            "location_label": location_label,
-            "description": upost.description or "",
-            "owner_username": upost.owner.username,
-            "owner_full_name": upost.owner.get_full_name(),
-            "main_image_url": _first_prefetched_image_url(upost.images.all()),
-            "lightbox_image_json": json.dumps(_prefetched_image_urls(upost.images.all())),
-            "match_score": match_score,
-            "created_at": upost.created_at,
-            "detail_url": detail_url,
-            "share_url": _finder_share_url_user_adoption(request, upost.id),
-            "is_vaccinated": upost.is_vaccinated,
-            "is_registered": upost.is_registered,
-            "sort_deadline_ts": float("inf"),
-        })
-
-    user_adopt_count = len(user_adoption_items)
+    user_adopt_count = len(user_rows)
     phase_counts["adopt"] += user_adopt_count
     phase_counts["all"] += user_adopt_count
 
     unified_entries_all = _finder_unified_entries(
-        selected_purpose, claim_items, adopt_items, user_adoption_items
+        selected_purpose, claim_rows, adopt_rows, user_rows
     )
-    recommended_posts = []
+    recommended_entry = None
     if active_filter_count:
-        best_item = None
-        best_score = -1
-        for entry_kind, entry_item in unified_entries_all:
-            if entry_kind != "staff":
-                continue
-            sc = entry_item.get("match_score", 0)
-            if sc > best_score:
-                best_score = sc
-                best_item = entry_item
-        if best_item is not None and best_score > 0:
-            recommended_posts = [best_item]
+        best_score = 0
+        for entry_kind, entry_row in unified_entries_all:
+            if entry_kind == "staff" and entry_row["match_score"] > best_score:
+                best_score = entry_row["match_score"]
+                recommended_entry = (entry_kind, entry_row)
 
     unified_paginator = Paginator(unified_entries_all, RESCUE_FINDER_PAGE_SIZE)
     unified_page_obj = unified_paginator.get_page(request.GET.get("page", 1))
-    page_pairs = list(unified_page_obj.object_list)
+    page_entries = list(unified_page_obj.object_list)
+    cards = _hydrate_finder_entries(
+        request,
+        page_entries + ([recommended_entry] if recommended_entry else []),
+    )
+    page_pairs = [
+        (kind, cards[(kind, row["post_id"])])
+        for kind, row in page_entries
+        if (kind, row["post_id"]) in cards
+    ]
+    unified_page_obj.object_list = page_pairs
+    recommended_posts = []
+    if recommended_entry and ("staff", recommended_entry[1]["post_id"]) in cards:
+        recommended_posts = [cards[("staff", recommended_entry[1]["post_id"])]]
+
     finder_unified_rows = [{"kind": k, "item": item} for k, item in page_pairs]
     hl_kind, hl_id = _parse_finder_highlight(request.GET.get("highlight"))
     for row in finder_unified_rows:
         item = row["item"]
-        is_hl = False
-        if hl_kind and hl_id:
-            if row["kind"] == "staff" and hl_kind == "staff" and item["post"].id == hl_id:
-                is_hl = True
-            elif row["kind"] == "user" and hl_kind == "user" and item["post_id"] == hl_id:
-                is_hl = True
-        item["is_share_highlight"] = is_hl
+        item["is_share_highlight"] = bool(
+            hl_kind and hl_id and row["kind"] == hl_kind and item["post_id"] == hl_id
+        )
     posts = [item for k, item in page_pairs if k == "staff"]
     claim_posts = [
         item for k, item in page_pairs if k == "staff" and item["phase"] == "claim"
@@ -2720,9 +2841,9 @@ def _build_public_post_listing(request, listing_mode):
 
     highlight_redirect = _finder_maybe_redirect_for_highlight(
         request,
-        claim_items,
-        adopt_items,
-        user_adoption_items,
+        claim_rows,
+        adopt_rows,
+        user_rows,
         selected_purpose,
     )
 
@@ -2789,7 +2910,7 @@ def _build_public_post_listing(request, listing_mode):
 def _build_home_featured_rescue_sections(request, *, appointment_dates=None):
     raw_open_posts = list(
         _base_public_post_queryset()
-        .filter(status__in=["rescued", "under_care"])
+        .filter(status__in=["rescued", "under_care"], phase_ends_at__gte=timezone.now())
         [:HOME_FEATURED_CANDIDATE_LIMIT]
     )
     Post.attach_active_appointment_dates(raw_open_posts, appointment_dates)
@@ -3017,7 +3138,11 @@ def _build_home_spotlight_card(
 def _build_home_pinned_rescue_spotlights(request, *, appointment_dates=None):
     pinned_posts = list(
         _base_public_post_queryset()
-        .filter(is_pinned=True, status__in=["rescued", "under_care"])
+        .filter(
+            is_pinned=True,
+            status__in=["rescued", "under_care"],
+            phase_ends_at__gte=timezone.now(),
+        )
         .order_by("-pinned_at", "-created_at")[:HOME_SPOTLIGHT_DISPLAY_LIMIT]
     )
     pinned_viewer_map = _viewer_staff_post_request_map(
@@ -3046,7 +3171,11 @@ def _build_home_pinned_rescue_spotlights(request, *, appointment_dates=None):
     if remaining_slots > 0:
         fallback_candidates = list(
             _base_public_post_queryset()
-            .filter(is_pinned=False, status__in=["rescued", "under_care"])
+            .filter(
+                is_pinned=False,
+                status__in=["rescued", "under_care"],
+                phase_ends_at__gte=timezone.now(),
+            )
             [:HOME_SPOTLIGHT_FALLBACK_CANDIDATE_LIMIT]
         )
         Post.attach_active_appointment_dates(fallback_candidates, appointment_dates)
@@ -3514,12 +3643,15 @@ def _user_post_requests(user, request_type):
 
 
 FEED_CACHE_TTL_SECONDS = 90
-FEED_CACHE_VERSION = "v6"
+# Writes bump the feed namespace and a live phase scheduler bumps it when a post
+# closes, so rows only outlive the short TTL while one is running.
+FEED_CACHE_SCHEDULED_TTL_SECONDS = 60 * 60
+FEED_CACHE_VERSION = "v8"
 FEED_POSTS_PER_PAGE = 12
-FEED_ADMIN_CANDIDATE_LIMIT = 700
-FEED_ANNOUNCEMENT_CANDIDATE_LIMIT = 300
-FEED_USER_CANDIDATE_LIMIT = 400
-FEED_MISSING_CANDIDATE_LIMIT = 300
+FEED_ADMIN_CANDIDATE_LIMIT = FEED_POOL_CANDIDATE_LIMITS["admin"]
+FEED_ANNOUNCEMENT_CANDIDATE_LIMIT = FEED_POOL_CANDIDATE_LIMITS["announcement"]
+FEED_USER_CANDIDATE_LIMIT = FEED_POOL_CANDIDATE_LIMITS["user"]
+FEED_MISSING_CANDIDATE_LIMIT = FEED_POOL_CANDIDATE_LIMITS["missing"]
 # Keep full candidate windows so pagination can continue for larger feeds.
 FEED_ADMIN_SAMPLE_LIMIT = FEED_ADMIN_CANDIDATE_LIMIT
 FEED_ANNOUNCEMENT_SAMPLE_LIMIT = FEED_ANNOUNCEMENT_CANDIDATE_LIMIT
@@ -3547,6 +3679,10 @@ CLAIMS_PAGE_SIZE = USER_APP_SMALL_LIST_PAGE_SIZE
 ADOPT_STATUS_ITEMS_PER_PAGE = USER_APP_SMALL_LIST_PAGE_SIZE
 
 
+def _phase_aware_cache_ttl(ttl_seconds):
+    return FEED_CACHE_SCHEDULED_TTL_SECONDS if phase_scheduler_is_live() else ttl_seconds
+
+
 def _normalized_feed_query(raw_query):
     return " ".join((raw_query or "").strip().split())
 
@@ -3608,12 +3744,57 @@ def _build_pagination_tokens(page_obj, *, edge_count=1, sibling_count=1):
     return tokens
 
 
-def _feed_cache_key(prefix, query, feed_token="", viewer_id=None):
+def _feed_cache_key(prefix, query, feed_token=""):
+    """Feed keys are shared by every viewer; per-viewer rows are removed on read."""
     namespace = get_user_home_feed_namespace()
     query_hash = hashlib.md5(query.encode("utf-8")).hexdigest() if query else "all"
     token_hash = hashlib.md5(feed_token.encode("utf-8")).hexdigest() if feed_token else "default"
-    viewer_key = str(viewer_id) if viewer_id else "anon"
-    return f"user_home:{prefix}:{FEED_CACHE_VERSION}:{namespace}:{query_hash}:{token_hash}:{viewer_key}"
+    return f"user_home:{prefix}:{FEED_CACHE_VERSION}:{namespace}:{query_hash}:{token_hash}"
+
+
+# Feed types a member can own, with the model and status that keep a listing live.
+VIEWER_OWNED_FEED_SOURCES = {
+    "user": (UserAdoptionPost, "available"),
+    "missing": (MissingDogPost, "missing"),
+}
+
+
+def _viewer_own_feed_ids(rows, viewer_id):
+    """
+    Ids among ``rows`` of the viewer's own live community posts, which never appear in their feed.
+
+    Owners come from the candidate pool rows; only ids outside the pools (older
+    search hits) are looked up in the database.
+    """
+    if not viewer_id:
+        return {}
+    row_ids = {feed_type: set() for feed_type in VIEWER_OWNED_FEED_SOURCES}
+    for row in rows:
+        if row["feed_type"] in row_ids:
+            row_ids[row["feed_type"]].add(row["id"])
+
+    own_ids = {}
+    pools = get_feed_candidate_pools([feed_type for feed_type, ids in row_ids.items() if ids])
+    for feed_type, pool in pools.items():
+        owners = {entity_id: owner_id for _created_ts, entity_id, owner_id, _closes_ts in pool}
+        ids = {entity_id for entity_id in row_ids[feed_type] if owners.get(entity_id) == viewer_id}
+        unpooled_ids = row_ids[feed_type] - owners.keys()
+        if unpooled_ids:
+            model, live_status = VIEWER_OWNED_FEED_SOURCES[feed_type]
+            ids.update(
+                model.objects.filter(id__in=unpooled_ids, owner_id=viewer_id, status=live_status)
+                .values_list("id", flat=True)
+            )
+        if ids:
+            own_ids[feed_type] = ids
+    return own_ids
+
+
+def _exclude_viewer_feed_rows(rows, viewer_id):
+    own_ids = _viewer_own_feed_ids(rows, viewer_id)
+    if not own_ids:
+        return rows
+    return rows.without(own_ids)
 
 
 def _normalized_feed_token(raw_token):
@@ -3640,6 +3821,24 @@ def _resolve_home_feed_token(request, raw_token=""):
     return generated_token
 
 
+def _encode_home_feed_cursor(query, offset):
+    """Signed cursor pointing at ``offset`` in the ranked search rows for ``query``."""
+    return signing.dumps({"q": query, "o": offset}, salt=HOME_FEED_CURSOR_SALT)
+
+
+def _decode_home_feed_cursor(raw_cursor):
+    """Return ``(query, offset)`` or None for a missing or tampered cursor."""
+    try:
+        payload = signing.loads(raw_cursor or "", salt=HOME_FEED_CURSOR_SALT)
+        query = _normalized_search_query(payload["q"])
+        offset = int(payload["o"])
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        return None
+    if offset < 0:
+        return None
+    return query, offset
+
+
 def _redirect_to_user_home_with_fresh_feed():
     return redirect(f"{reverse('user:user_home')}?feed_token={_fresh_feed_token()}")
 
@@ -3664,61 +3863,61 @@ def _sample_recent_ids_with_cache(cache_key, base_qs, candidate_limit, sample_li
         sampled_ids = list(candidate_ids)
 
     rng.shuffle(sampled_ids)
-    cache.set(cache_key, sampled_ids, FEED_CACHE_TTL_SECONDS)
+    cache.set(cache_key, sampled_ids, _phase_aware_cache_ttl(FEED_CACHE_TTL_SECONDS))
     return sampled_ids
 
 
-def _sample_ids_with_cache(cache_key, candidate_ids, sample_limit):
-    cached_ids = cache.get(cache_key)
-    if cached_ids is not None:
-        return cached_ids
-
-    rng = _feed_rng(cache_key)
+def _sample_ids(seed_key, candidate_ids, sample_limit):
+    rng = _feed_rng(seed_key)
     if len(candidate_ids) > sample_limit:
         sampled_ids = rng.sample(candidate_ids, sample_limit)
     else:
         sampled_ids = list(candidate_ids)
 
     rng.shuffle(sampled_ids)
-    cache.set(cache_key, sampled_ids, FEED_CACHE_TTL_SECONDS)
     return sampled_ids
 
 
-def _active_admin_posts_queryset(query=""):
+def _sample_ids_with_cache(cache_key, candidate_ids, sample_limit):
+    cached_ids = cache.get(cache_key)
+    if cached_ids is not None:
+        return cached_ids
+
+    sampled_ids = _sample_ids(cache_key, candidate_ids, sample_limit)
+    cache.set(cache_key, sampled_ids, _phase_aware_cache_ttl(FEED_CACHE_TTL_SECONDS))
+    return sampled_ids
+
+
+def _search_candidate_ids(feed_type, query, limit):
+    return [entity_id for entity_id, _score in search_ranked_ids(feed_type, query, limit)]
+
+
+def _active_admin_posts_queryset(query="", candidate_ids=None):
     accepted_post_requests = PostRequest.objects.filter(
         post_id=OuterRef("pk"),
         status="accepted",
         request_type__in=["claim", "adopt"],
     )
+    # ``phase_ends_at`` is stored on save, so closed windows never leave the database.
     admin_qs = Post.with_pending_request_state(
-        Post.objects.filter(is_history=False).exclude(status__in=["reunited", "adopted"])
+        Post.objects.filter(is_history=False, phase_ends_at__gte=timezone.now())
+        .exclude(status__in=["reunited", "adopted"])
         .annotate(
             has_accepted_request=Exists(accepted_post_requests),
         )
     ).filter(has_accepted_request=False)
-    if query:
-        admin_qs = admin_qs.filter(
-            Q(user__username__icontains=query)
-            | Q(user__first_name__icontains=query)
-            | Q(user__last_name__icontains=query)
-            | Q(caption__icontains=query)
-            | Q(location__icontains=query)
-            | Q(status__icontains=query)
-        )
+    if query and candidate_ids is None:
+        candidate_ids = _search_candidate_ids("admin", query, FEED_ADMIN_CANDIDATE_LIMIT)
+    if candidate_ids is not None:
+        admin_qs = admin_qs.filter(id__in=candidate_ids)
     return admin_qs.order_by("-created_at", "-id")
 
 
-def _active_admin_posts(query="", candidate_limit=None):
-    admin_qs = _active_admin_posts_queryset(query)
+def _active_admin_posts(query="", candidate_limit=None, candidate_ids=None):
+    admin_qs = _active_admin_posts_queryset(query, candidate_ids=candidate_ids)
     if candidate_limit is not None:
         admin_qs = admin_qs[:candidate_limit]
-    posts = list(admin_qs)
-    Post.attach_active_appointment_dates(posts)
-    return [
-        post
-        for post in posts
-        if post.current_phase() in {"claim", "adopt"}
-    ]
+    return list(admin_qs)
 
 
 def _active_admin_candidate_ids_with_cache(query):
@@ -3734,216 +3933,185 @@ def _active_admin_candidate_ids_with_cache(query):
             candidate_limit=FEED_ADMIN_CANDIDATE_LIMIT,
         )
     ]
-    cache.set(cache_key, active_ids, FEED_CACHE_TTL_SECONDS)
+    cache.set(cache_key, active_ids, _phase_aware_cache_ttl(FEED_CACHE_TTL_SECONDS))
     return active_ids
 
 
+def _build_pooled_home_rows(seed_key, *, dogs_only=False):
+    """Unfiltered feed rows drawn from the signal-maintained candidate pools (no table scans)."""
+    feed_types = ["admin", "user", "missing"]
+    if not dogs_only:
+        feed_types.append("announcement")
+    pools = get_feed_candidate_pools(feed_types)
+    now = timezone.now()
+    sample_limits = {
+        "admin": FEED_ADMIN_SAMPLE_LIMIT,
+        "announcement": FEED_ANNOUNCEMENT_SAMPLE_LIMIT,
+        "user": FEED_USER_SAMPLE_LIMIT,
+        "missing": FEED_MISSING_SAMPLE_LIMIT,
+    }
+
+    mixed_pairs = []
+    for feed_type in feed_types:
+        candidate_ids = pool_candidate_ids(pools[feed_type], now=now)
+        sampled_ids = _sample_ids(
+            f"{seed_key}:{feed_type}",
+            candidate_ids,
+            sample_limits[feed_type],
+        )
+        mixed_pairs.extend((feed_type, entity_id) for entity_id in sampled_ids)
+    _feed_rng(seed_key).shuffle(mixed_pairs)
+    return PackedFeedRows.from_pairs(mixed_pairs)
+
+
 def _build_random_home_rows(query, feed_token="", dogs_only=False, viewer_id=None):
-    feed_scope = "dogs_only" if dogs_only else "mixed"
-    mixed_cache_key = _feed_cache_key(
-        f"{feed_scope}_rows",
-        query,
-        feed_token,
-        viewer_id=viewer_id,
+    return _exclude_viewer_feed_rows(
+        _build_shared_home_rows(query, feed_token=feed_token, dogs_only=dogs_only),
+        viewer_id,
     )
+
+
+def _build_shared_home_rows(query, feed_token="", dogs_only=False):
+    feed_scope = "dogs_only" if dogs_only else "mixed"
+    mixed_cache_key = _feed_cache_key(f"{feed_scope}_rows", query, feed_token)
     cached_rows = cache.get(mixed_cache_key)
     if cached_rows is not None:
         return cached_rows
 
+    if not query:
+        mixed_rows = _build_pooled_home_rows(mixed_cache_key, dogs_only=dogs_only)
+        cache.set(mixed_cache_key, mixed_rows, _phase_aware_cache_ttl(FEED_CACHE_TTL_SECONDS))
+        return mixed_rows
+
     active_admin_candidate_ids = _active_admin_candidate_ids_with_cache(query)
     announcement_qs = DogAnnouncement.objects.all()
     user_qs = UserAdoptionPost.objects.filter(status="available")
     missing_qs = MissingDogPost.objects.filter(status="missing")
-    if viewer_id:
-        user_qs = user_qs.exclude(owner_id=viewer_id)
-        missing_qs = missing_qs.exclude(owner_id=viewer_id)
 
     if query:
-        announcement_qs = announcement_qs.filter(
-            Q(title__icontains=query)
-            | Q(content__icontains=query)
-            | Q(category__icontains=query)
-        )
+        if not dogs_only:
+            announcement_qs = announcement_qs.filter(id__in=_search_candidate_ids(
+                "announcement", query, FEED_ANNOUNCEMENT_CANDIDATE_LIMIT
+            ))
         user_qs = user_qs.filter(
-            Q(dog_name__icontains=query)
-            | Q(description__icontains=query)
-            | Q(location__icontains=query)
-            | Q(breed__icontains=query)
-            | Q(breed_other__icontains=query)
-            | Q(age_group__icontains=query)
-            | Q(size_group__icontains=query)
-            | Q(gender__icontains=query)
-            | Q(coat_length__icontains=query)
-            | Q(color_other__icontains=query)
+            id__in=_search_candidate_ids("user", query, FEED_USER_CANDIDATE_LIMIT)
         )
         missing_qs = missing_qs.filter(
-            Q(dog_name__icontains=query)
-            | Q(description__icontains=query)
-            | Q(location__icontains=query)
+            id__in=_search_candidate_ids("missing", query, FEED_MISSING_CANDIDATE_LIMIT)
         )
 
     admin_ids = _sample_ids_with_cache(
-        _feed_cache_key(f"{feed_scope}_admin_ids", query, viewer_id=viewer_id),
+        _feed_cache_key(f"{feed_scope}_admin_ids", query),
         active_admin_candidate_ids,
         sample_limit=FEED_ADMIN_SAMPLE_LIMIT,
     )
     announcement_ids = []
     if not dogs_only:
         announcement_ids = _sample_recent_ids_with_cache(
-            _feed_cache_key(f"{feed_scope}_announcement_ids", query, viewer_id=viewer_id),
+            _feed_cache_key(f"{feed_scope}_announcement_ids", query),
             announcement_qs,
             candidate_limit=FEED_ANNOUNCEMENT_CANDIDATE_LIMIT,
             sample_limit=FEED_ANNOUNCEMENT_SAMPLE_LIMIT,
         )
     user_ids = _sample_recent_ids_with_cache(
-        _feed_cache_key(f"{feed_scope}_user_ids", query, viewer_id=viewer_id),
+        _feed_cache_key(f"{feed_scope}_user_ids", query),
         user_qs,
         candidate_limit=FEED_USER_CANDIDATE_LIMIT,
         sample_limit=FEED_USER_SAMPLE_LIMIT,
     )
     missing_ids = _sample_recent_ids_with_cache(
-        _feed_cache_key(f"{feed_scope}_missing_ids", query, viewer_id=viewer_id),
+        _feed_cache_key(f"{feed_scope}_missing_ids", query),
         missing_qs,
         candidate_limit=FEED_MISSING_CANDIDATE_LIMIT,
         sample_limit=FEED_MISSING_SAMPLE_LIMIT,
     )
 
-    mixed_rows = [{"id": post_id, "feed_type": "admin"} for post_id in admin_ids]
-    mixed_rows.extend({"id": ann_id, "feed_type": "announcement"} for ann_id in announcement_ids)
-    mixed_rows.extend({"id": user_id, "feed_type": "user"} for user_id in user_ids)
-    mixed_rows.extend({"id": missing_id, "feed_type": "missing"} for missing_id in missing_ids)
+    mixed_pairs = [("admin", post_id) for post_id in admin_ids]
+    mixed_pairs.extend(("announcement", ann_id) for ann_id in announcement_ids)
+    mixed_pairs.extend(("user", user_id) for user_id in user_ids)
+    mixed_pairs.extend(("missing", missing_id) for missing_id in missing_ids)
     # Seeded shuffling keeps pagination stable for one browsing session without DB-level random ordering.
-    _feed_rng(mixed_cache_key).shuffle(mixed_rows)
-    cache.set(mixed_cache_key, mixed_rows, FEED_CACHE_TTL_SECONDS)
+    _feed_rng(mixed_cache_key).shuffle(mixed_pairs)
+    mixed_rows = PackedFeedRows.from_pairs(mixed_pairs)
+    cache.set(mixed_cache_key, mixed_rows, _phase_aware_cache_ttl(FEED_CACHE_TTL_SECONDS))
     return mixed_rows
 
 
-def _build_search_rows_cache_key(query, dogs_only, viewer_id=None):
+def _build_search_rows_cache_key(query, dogs_only):
     prefix = "search_dogs_only" if dogs_only else "search_mixed"
-    return _feed_cache_key(f"{prefix}:keyword_only", query, viewer_id=viewer_id)
+    return _feed_cache_key(f"{prefix}:keyword_only", query)
 
 
 def _build_search_home_rows(query, dogs_only=False, viewer_id=None):
+    return _exclude_viewer_feed_rows(
+        _build_shared_search_rows(query, dogs_only=dogs_only),
+        viewer_id,
+    )
+
+
+def _build_shared_search_rows(query, dogs_only=False):
     has_filters = bool(query)
     if not has_filters:
-        return []
+        return PackedFeedRows()
 
-    cache_key = _build_search_rows_cache_key(query, dogs_only, viewer_id=viewer_id)
+    cache_key = _build_search_rows_cache_key(query, dogs_only)
     cached_rows = cache.get(cache_key)
     if cached_rows is not None:
         return cached_rows
 
-    admin_posts = _active_admin_posts(
-        query,
-        candidate_limit=SEARCH_CANDIDATE_LIMIT,
-    )
-    announcement_qs = DogAnnouncement.objects.all()
-    user_qs = UserAdoptionPost.objects.filter(status="available")
-    missing_qs = MissingDogPost.objects.filter(status="missing")
-    if viewer_id:
-        user_qs = user_qs.exclude(owner_id=viewer_id)
-        missing_qs = missing_qs.exclude(owner_id=viewer_id)
-
-    if query:
-        announcement_filters = (
-            Q(title__icontains=query)
-            | Q(content__icontains=query)
-            | Q(category__icontains=query)
-            | Q(created_by__username__icontains=query)
-            | Q(created_by__first_name__icontains=query)
-            | Q(created_by__last_name__icontains=query)
-        )
-        user_filters = (
-            Q(dog_name__icontains=query)
-            | Q(description__icontains=query)
-            | Q(location__icontains=query)
-            | Q(breed__icontains=query)
-            | Q(breed_other__icontains=query)
-            | Q(age_group__icontains=query)
-            | Q(size_group__icontains=query)
-            | Q(gender__icontains=query)
-            | Q(coat_length__icontains=query)
-            | Q(color_other__icontains=query)
-            | Q(owner__username__icontains=query)
-            | Q(owner__first_name__icontains=query)
-            | Q(owner__last_name__icontains=query)
-        )
-        missing_filters = (
-            Q(dog_name__icontains=query)
-            | Q(description__icontains=query)
-            | Q(location__icontains=query)
-            | Q(owner__username__icontains=query)
-            | Q(owner__first_name__icontains=query)
-            | Q(owner__last_name__icontains=query)
-        )
-
-        announcement_qs = announcement_qs.filter(announcement_filters)
-        user_qs = user_qs.filter(user_filters)
-        missing_qs = missing_qs.filter(missing_filters)
+    feed_types = ["admin", "user", "missing"]
+    if not dogs_only:
+        feed_types.append("announcement")
+    scores = {
+        feed_type: dict(search_ranked_ids(feed_type, query, SEARCH_CANDIDATE_LIMIT))
+        for feed_type in feed_types
+    }
+    live_querysets = {
+        "announcement": DogAnnouncement.objects.all(),
+        "user": UserAdoptionPost.objects.filter(status="available"),
+        "missing": MissingDogPost.objects.filter(status="missing"),
+    }
 
-    admin_rows = [
-        {"id": post.id, "created_at": post.created_at}
-        for post in admin_posts
+    # Best index score first; ``created_at`` only breaks ties and is not cached.
+    ranked = [
+        (scores["admin"][post.id], post.created_at, post.id, "admin")
+        for post in _active_admin_posts(candidate_ids=list(scores["admin"]))
     ]
-    announcement_rows = []
-    if not dogs_only:
-        announcement_rows = list(
-            announcement_qs.order_by("-created_at").values("id", "created_at")[:SEARCH_CANDIDATE_LIMIT]
+    for feed_type in feed_types[1:]:
+        if not scores[feed_type]:
+            continue
+        ranked.extend(
+            (scores[feed_type][entity_id], created_at, entity_id, feed_type)
+            for entity_id, created_at in live_querysets[feed_type]
+            .filter(id__in=list(scores[feed_type]))
+            .values_list("id", "created_at")
         )
-    user_rows = list(
-        user_qs.order_by("-created_at").values("id", "created_at")[:SEARCH_CANDIDATE_LIMIT]
-    )
-    missing_rows = list(
-        missing_qs.order_by("-created_at").values("id", "created_at")[:SEARCH_CANDIDATE_LIMIT]
-    )
-
-    rows = [{"id": row["id"], "feed_type": "admin", "created_at": row["created_at"]} for row in admin_rows]
-    rows.extend(
-        {"id": row["id"], "feed_type": "announcement", "created_at": row["created_at"]}
-        for row in announcement_rows
-    )
-    rows.extend(
-        {"id": row["id"], "feed_type": "user", "created_at": row["created_at"]}
-        for row in user_rows
-    )
-    rows.extend(
-        {"id": row["id"], "feed_type": "missing", "created_at": row["created_at"]}
-        for row in missing_rows
-    )
-    rows.sort(key=lambda row: (row["created_at"], row["id"]), reverse=True)
+    ranked.sort(key=lambda row: row[:3], reverse=True)
+    rows = PackedFeedRows.from_pairs((feed_type, entity_id) for *_, entity_id, feed_type in ranked)
+    # Search rows also go stale on edits and renames, which the phase scheduler does not track.
     cache.set(cache_key, rows, SEARCH_CACHE_TTL_SECONDS)
     return rows
 
 
-def _hydrate_home_feed_items(request, feed_rows, *, appointment_dates=None):
-    if not feed_rows:
-        return []
-
-    ids_by_type = {
-        "admin": [row["id"] for row in feed_rows if row["feed_type"] == "admin"],
-        "announcement": [row["id"] for row in feed_rows if row["feed_type"] == "announcement"],
-        "user": [row["id"] for row in feed_rows if row["feed_type"] == "user"],
-        "missing": [row["id"] for row in feed_rows if row["feed_type"] == "missing"],
-    }
+def _load_home_feed_cards(ids_by_type):
+    """
+    Build the viewer-independent part of each feed card, keyed by ``(feed_type, id)``.
 
-    user_request_counts = {}
-    if ids_by_type["user"]:
-        user_request_counts = dict(
-            UserAdoptionRequest.objects.filter(post_id__in=ids_by_type["user"])
-            .values("post_id")
-            .annotate(total=Count("id"))
-            .values_list("post_id", "total")
-        )
+    Nothing here may depend on the request, the viewer or the current time; those
+    fields are layered on in ``_hydrate_home_feed_items`` after the card cache read.
+    """
+    cards = {}
+    default_admin_avatar_url = static("images/officialseal.webp")
+    default_profile_avatar_url = static("images/default-user-image.jpg")
 
-    admin_map = {
-        post.id: post
-        for post in Post.with_pending_request_state(
+    if ids_by_type["admin"]:
+        for p in Post.with_pending_request_state(
             Post.objects.select_related(
                 "user", "user__profile"
             ).only(
                 "id", "caption", "breed", "breed_other", "age_group", "size_group", "gender",
                 "coat_length", "colors", "color_other", "location", "status", "rescued_date",
-                "created_at", "claim_days",
+                "created_at", "claim_days", "phase_override", "phase_override_started_at",
                 "user__id", "user__username", "user__first_name", "user__last_name",
                 "user__profile__profile_image",
             )
@@ -3953,11 +4121,23 @@ def _hydrate_home_feed_items(request, feed_rows, *, appointment_dates=None):
                 queryset=PostImage.objects.only("id", "post_id", "image").order_by("id"),
                 to_attr="prefetched_images",
             )
-        ).filter(id__in=ids_by_type["admin"])
-    }
-    announcement_map = {
-        post.id: post
-        for post in DogAnnouncement.objects.select_related(
+        ).filter(id__in=ids_by_type["admin"]):
+            gallery_images = list(getattr(p, "prefetched_images", []))
+            cards[("admin", p.id)] = {
+                "post": p,
+                "post_type": "admin",
+                "author_avatar_url": _profile_image_url_or_default(
+                    p.user, default_admin_avatar_url
+                ),
+                "pending_state_label": "",
+                "pending_state_detail": "",
+                "image_count": len(gallery_images),
+                "gallery_images": gallery_images,
+                "main_image": gallery_images[0] if gallery_images else None,
+            }
+
+    if ids_by_type["announcement"]:
+        for p in DogAnnouncement.objects.select_related(
             "created_by", "created_by__profile"
         ).only(
             "id", "title", "content", "category", "created_at", "background_image",
@@ -3969,11 +4149,30 @@ def _hydrate_home_feed_items(request, feed_rows, *, appointment_dates=None):
                 queryset=DogAnnouncementImage.objects.only("id", "announcement_id", "image").order_by("id"),
                 to_attr="prefetched_images",
             )
-        ).filter(id__in=ids_by_type["announcement"])
-    }
-    user_map = {
-        post.id: post
-        for post in UserAdoptionPost.objects.select_related(
+        ).filter(id__in=ids_by_type["announcement"]):
+            announcement_images = list(getattr(p, "prefetched_images", []))
+            first_image_url = _first_prefetched_image_url(announcement_images)
+            cards[("announcement", p.id)] = {
+                "post": p,
+                "post_type": "announcement",
+                "author_avatar_url": _profile_image_url_or_default(
+                    p.created_by, default_admin_avatar_url
+                ),
+                "content_display": _clean_announcement_text_for_display(p.content),
+                "main_image_url": first_image_url or _safe_media_url(p.background_image),
+                "image_count": len(announcement_images),
+                "gallery_images": announcement_images,
+                "has_media": bool(p.background_image or announcement_images),
+            }
+
+    if ids_by_type["user"]:
+        user_request_counts = dict(
+            UserAdoptionRequest.objects.filter(post_id__in=ids_by_type["user"])
+            .values("post_id")
+            .annotate(total=Count("id"))
+            .values_list("post_id", "total")
+        )
+        for p in UserAdoptionPost.objects.select_related(
             "owner", "owner__profile"
         ).only(
             "id",
@@ -4002,11 +4201,42 @@ def _hydrate_home_feed_items(request, feed_rows, *, appointment_dates=None):
                 queryset=UserAdoptionImage.objects.only("id", "post_id", "image").order_by("id"),
                 to_attr="prefetched_images",
             )
-        ).filter(id__in=ids_by_type["user"])
-    }
-    missing_map = {
-        post.id: post
-        for post in MissingDogPost.objects.select_related(
+        ).filter(id__in=ids_by_type["user"]):
+            post_images = list(getattr(p, "prefetched_images", []))
+            cards[("user", p.id)] = {
+                "post": p,
+                "post_type": "user",
+                "days_left": 0,
+                "hours_left": 0,
+                "minutes_left": 0,
+                "is_open_for_adoption": False,
+                "phase": "closed",
+                "image_count": len(post_images),
+                "gallery_images": post_images,
+                "main_image": post_images[0] if post_images else None,
+                "request_count": int(user_request_counts.get(p.id, 0)),
+                "author_name": p.owner.get_full_name() or p.owner.username,
+                "author_avatar_url": _profile_image_url_or_default(
+                    p.owner,
+                    default_profile_avatar_url,
+                ),
+                "owner_request_url": f"{reverse('user:edit_profile')}#post-requests-{p.id}",
+                "post_id": p.id,
+                "dog_name": p.dog_name,
+                "breed_label": p.display_breed or "Unknown Breed",
+                "age_label": p.display_age_group or "Age not listed",
+                "size_label": p.display_size_group or "Size not listed",
+                "gender_label": p.get_gender_display() if p.gender else "Gender not listed",
+                "coat_label": p.display_coat_length or "Coat not listed",
+                "color_label": p.display_colors or "Color not listed",
+                "location_label": " ".join((p.location or "").split()) or "Location not listed",
+                "main_image_url": _first_prefetched_image_url(post_images),
+                "is_vaccinated": p.is_vaccinated,
+                "is_registered": p.is_registered,
+            }
+
+    if ids_by_type["missing"]:
+        for p in MissingDogPost.objects.select_related(
             "owner", "owner__profile"
         ).only(
             "id",
@@ -4027,191 +4257,161 @@ def _hydrate_home_feed_items(request, feed_rows, *, appointment_dates=None):
             "owner__first_name",
             "owner__last_name",
             "owner__profile__profile_image",
-        ).filter(id__in=ids_by_type["missing"])
+        ).filter(id__in=ids_by_type["missing"]):
+            cards[("missing", p.id)] = {
+                "post": p,
+                "post_type": "missing",
+                "days_left": 0,
+                "hours_left": 0,
+                "minutes_left": 0,
+                "is_open_for_adoption": False,
+                "phase": "closed",
+                "image_count": 1 if p.image else 0,
+                "main_image": None,
+                "author_name": p.owner.get_full_name() or p.owner.username,
+                "author_avatar_url": _profile_image_url_or_default(
+                    p.owner,
+                    default_profile_avatar_url,
+                ),
+            }
+
+    return cards
+
+
+def _get_home_feed_cards(feed_rows):
+    """Cached base cards for ``feed_rows``: one ``get_many``, then load only the misses."""
+    card_keys = {
+        (row["feed_type"], row["id"]): feed_card_cache_key(row["feed_type"], row["id"])
+        for row in feed_rows
+    }
+    cached = cache.get_many(list(card_keys.values()))
+    cards = {
+        entity_key: cached[cache_key]
+        for entity_key, cache_key in card_keys.items()
+        if cache_key in cached
     }
 
-    if admin_map:
-        Post.attach_active_appointment_dates(admin_map.values(), appointment_dates)
-    viewer_staff_request_map = _viewer_staff_post_request_map(
-        request.user, ids_by_type["admin"]
-    )
+    ids_by_type = {"admin": [], "announcement": [], "user": [], "missing": []}
+    for feed_type, entity_id in card_keys:
+        if (feed_type, entity_id) not in cards:
+            ids_by_type[feed_type].append(entity_id)
+    if any(ids_by_type.values()):
+        loaded = _load_home_feed_cards(ids_by_type)
+        if loaded:
+            cache.set_many(
+                {card_keys[entity_key]: card for entity_key, card in loaded.items()},
+                FEED_CARD_TTL_SECONDS,
+            )
+        cards.update(loaded)
+    return cards
+
+
+def _hydrate_home_feed_items(request, feed_rows, *, appointment_dates=None):
+    if not feed_rows:
+        return []
+
+    cards = _get_home_feed_cards(feed_rows)
+    admin_ids = [
+        entity_id for feed_type, entity_id in cards if feed_type == "admin"
+    ]
+    user_ids = [
+        entity_id for feed_type, entity_id in cards if feed_type == "user"
+    ]
+
+    admin_phase_states = {}
+    if admin_ids:
+        admin_posts = [cards[("admin", post_id)]["post"] for post_id in admin_ids]
+        Post.attach_active_appointment_dates(admin_posts, appointment_dates)
+        admin_phase_states = dict(zip(admin_ids, Post.compute_phases(admin_posts)))
+    viewer_staff_request_map = _viewer_staff_post_request_map(request.user, admin_ids)
     viewer_user_adoption_post_ids = set()
-    if getattr(request.user, "is_authenticated", False) and ids_by_type["user"]:
+    if getattr(request.user, "is_authenticated", False) and user_ids:
         viewer_user_adoption_post_ids = set(
             UserAdoptionRequest.objects.filter(
-                requester=request.user, post_id__in=ids_by_type["user"]
+                requester=request.user, post_id__in=user_ids
             ).values_list("post_id", flat=True)
         )
 
     combined_posts = []
-    default_admin_avatar_url = static("images/officialseal.webp")
-    default_profile_avatar_url = static("images/default-user-image.jpg")
     current_url_name = getattr(getattr(request, "resolver_match", None), "url_name", "")
     profile_back_label = "Back to Search" if current_url_name == "home_search" else "Back to Feed"
     profile_return_url = request.get_full_path()
     for row in feed_rows:
         post_type = row["feed_type"]
-        post_id = row["id"]
+        card = cards.get((post_type, row["id"]))
+        if not card:
+            continue
+        p = card["post"]
 
         if post_type == "admin":
-            p = admin_map.get(post_id)
-            if not p:
-                continue
-            gallery_images = list(getattr(p, "prefetched_images", []))
-            main_image = gallery_images[0] if gallery_images else None
-
-            phase_payload = _post_phase_payload(p)
+            phase_state = admin_phase_states[p.id]
+            phase_payload = _post_phase_payload(p, phase_state)
             phase = phase_payload["phase"]
             if _is_post_time_expired(p, phase_payload):
                 continue
-            is_open_for_adoption = phase in ["claim", "adopt"]
 
             deadline = None
             if phase == "claim":
-                deadline = p.claim_deadline()
+                deadline = phase_state["claim_deadline"]
             elif phase == "adopt":
-                deadline = p.adoption_deadline()
+                deadline = phase_state["adoption_deadline"]
 
             vf = viewer_staff_request_map.get(
                 p.id, {"claim": False, "adopt": False}
             )
-            cta = _staff_post_public_cta_flags(phase, request.user, vf)
-
             combined_posts.append({
-                "post": p,
-                "post_type": "admin",
-                "author_avatar_url": _profile_image_url_or_default(
-                    p.user, default_admin_avatar_url
-                ),
+                **card,
                 "days_left": phase_payload["days_left"],
                 "hours_left": phase_payload["hours_left"],
                 "minutes_left": phase_payload["minutes_left"],
-                "is_open_for_adoption": is_open_for_adoption,
+                "is_open_for_adoption": phase in ["claim", "adopt"],
                 "phase": phase,
                 "is_pending_review": phase_payload["is_pending_review"],
                 "show_countdown": phase in {"claim", "adopt"} and bool(deadline),
                 "pending_review_until": phase_payload["pending_review_until"],
                 "pending_review_until_label": phase_payload["pending_review_until_label"],
-                "pending_state_label": "",
-                "pending_state_detail": "",
                 "posted_label": _format_posted_label(p.created_at),
                 "deadline_iso": deadline.isoformat() if deadline else "",
-                "image_count": len(gallery_images),
-                "gallery_images": gallery_images,
-                "main_image": main_image,
                 "share_url": _finder_share_url_staff(request, p, phase_payload),
                 "viewer_has_claim_request": vf["claim"],
                 "viewer_has_adopt_request": vf["adopt"],
-                **cta,
+                **_staff_post_public_cta_flags(phase, request.user, vf),
             })
             continue
 
         if post_type == "announcement":
-            p = announcement_map.get(post_id)
-            if not p:
-                continue
-            announcement_images = list(getattr(p, "prefetched_images", []))
-            first_image_url = _first_prefetched_image_url(announcement_images)
-            main_image_url = first_image_url or _safe_media_url(p.background_image)
-
             combined_posts.append({
-                "post": p,
-                "post_type": "announcement",
-                "author_avatar_url": _profile_image_url_or_default(
-                    p.created_by, default_admin_avatar_url
-                ),
-                "content_display": _clean_announcement_text_for_display(p.content),
+                **card,
                 "posted_label": _format_posted_label(p.created_at),
-                "main_image_url": main_image_url,
-                "image_count": len(announcement_images),
-                "gallery_images": announcement_images,
-                "has_media": bool(p.background_image or announcement_images),
                 "share_url": _announcement_feed_share_url(request, p.id),
             })
             continue
 
-        if post_type == "user":
-            p = user_map.get(post_id)
-            if not p:
-                continue
-            post_images = list(getattr(p, "prefetched_images", []))
-            main_image = post_images[0] if post_images else None
-            profile_url = _build_profile_destination_url(
-                request,
-                p.owner_id,
-                next_url=profile_return_url,
-                back_label=profile_back_label,
-            )
+        profile_url = _build_profile_destination_url(
+            request,
+            p.owner_id,
+            next_url=profile_return_url,
+            back_label=profile_back_label,
+        )
 
+        if post_type == "user":
             has_user_adoption_request = p.id in viewer_user_adoption_post_ids
-            show_user_adoption_request_cta = (
-                not getattr(request.user, "is_authenticated", False)
-                or not has_user_adoption_request
-            )
-
             combined_posts.append({
-                "post": p,
-                "post_type": "user",
-                "days_left": 0,
-                "hours_left": 0,
-                "minutes_left": 0,
-                "is_open_for_adoption": False,
-                "phase": "closed",
+                **card,
                 "posted_label": _format_posted_label(p.created_at),
-                "image_count": len(post_images),
-                "gallery_images": post_images,
-                "main_image": main_image,
-                "request_count": int(user_request_counts.get(p.id, 0)),
-                "author_name": p.owner.get_full_name() or p.owner.username,
-                "author_avatar_url": _profile_image_url_or_default(
-                    p.owner,
-                    default_profile_avatar_url,
-                ),
                 "author_profile_url": profile_url,
-                "owner_request_url": f"{reverse('user:edit_profile')}#post-requests-{p.id}",
                 "share_url": _finder_share_url_user_adoption(request, p.id),
                 "viewer_has_user_adoption_request": has_user_adoption_request,
-                "show_user_adoption_request_cta": show_user_adoption_request_cta,
-                "post_id": p.id,
-                "dog_name": p.dog_name,
-                "breed_label": p.display_breed or "Unknown Breed",
-                "age_label": p.display_age_group or "Age not listed",
-                "size_label": p.display_size_group or "Size not listed",
-                "gender_label": p.get_gender_display() if p.gender else "Gender not listed",
-                "coat_label": p.display_coat_length or "Coat not listed",
-                "color_label": p.display_colors or "Color not listed",
-                "location_label": " ".join((p.location or "").split()) or "Location not listed",
-                "main_image_url": _first_prefetched_image_url(post_images),
-                "is_vaccinated": p.is_vaccinated,
-                "is_registered": p.is_registered,
+                "show_user_adoption_request_cta": (
+                    not getattr(request.user, "is_authenticated", False)
+                    or not has_user_adoption_request
+                ),
             })
             continue
 
-        p = missing_map.get(post_id)
-        if not p:
-            continue
-        profile_url = _build_profile_destination_url(
-            request,
-            p.owner_id,
-            next_url=profile_return_url,
-            back_label=profile_back_label,
-        )
         combined_posts.append({
-            "post": p,
-            "post_type": "missing",
-            "days_left": 0,
-            "hours_left": 0,
-            "minutes_left": 0,
-            "is_open_for_adoption": False,
-            "phase": "closed",
+            **card,
             "posted_label": _format_posted_label(p.created_at),
-            "image_count": 1 if p.image else 0,
-            "main_image": None,
-            "author_name": p.owner.get_full_name() or p.owner.username,
-            "author_avatar_url": _profile_image_url_or_default(
-                p.owner,
-                default_profile_avatar_url,
-            ),
             "author_profile_url": profile_url,
             "share_url": _missing_dog_public_share_url(request, p.id),
         })
@@ -4496,7 +4696,7 @@ def edit_profile(request):
         profile.phone_number = request.POST.get("phone_number", "").strip()
         profile.facebook_url = request.POST.get("facebook_url", "").strip()
 
-        user.save()
+        user.save(update_fields=["first_name", "last_name"])
         profile.save()
 
         messages.success(request, "Profile updated successfully")
@@ -4630,7 +4830,7 @@ def _build_user_home_context(
         ),
         "home_missing_posts": home_missing_posts,
         "vaccination_reminder_summary": (
-            build_user_vaccination_reminder_summary(request.user)
+            build_user_vaccination_reminder_summary(request.user, request=request)
             if request.user.is_authenticated and not request.user.is_staff
             else {"items": [], "expired_count": 0, "due_soon_count": 0, "profile_url": ""}
         ),
@@ -4702,6 +4902,59 @@ def user_home(request):
     return render(request, "home/user_home.html", context)
 
 
+def home_feed_next(request):
+    """Return the next hydrated search result cards as JSON for the "Load more" button."""
+    if request.user.is_authenticated and request.user.is_staff:
+        return JsonResponse({"ok": False, "error": "Forbidden"}, status=403)
+
+    cursor = _decode_home_feed_cursor(request.GET.get("cursor"))
+    if cursor is None:
+        return JsonResponse({"ok": False, "error": "Invalid cursor."}, status=400)
+    query, offset = cursor
+
+    # Same cached rows as ``home_search``, so the cursor continues exactly where the page ended.
+    search_rows = _build_search_home_rows(
+        query=query,
+        dogs_only=True,
+        viewer_id=getattr(request.user, "id", None),
+    )
+    next_offset = offset + SEARCH_RESULTS_PER_PAGE
+    posts = _hydrate_home_feed_items(
+        request,
+        search_rows[offset:next_offset],
+        appointment_dates=Post.active_appointment_dates(),
+    )
+
+    html = ""
+    if posts:
+        html = render_to_string(
+            "home/_feed_cards.html",
+            {"posts": posts, "search_mode": True},
+            request=request,
+        )
+    return JsonResponse({
+        "ok": True,
+        "html": html,
+        "count": len(posts),
+        "next_cursor": (
+            _encode_home_feed_cursor(query, next_offset) if next_offset < len(search_rows) else ""
+        ),
+    })
+
+
+def home_search_suggestions(request):
+    """Return search-as-you-type suggestions from the in-process prefix index."""
+    prefix = _normalized_search_query(request.GET.get("q"))
+    limit = _parse_positive_int(
+        request.GET.get("limit"),
+        SUGGESTION_NODE_LIMIT,
+        SUGGESTION_NODE_LIMIT,
+    )
+    response = JsonResponse({"suggestions": search_suggestions(prefix, limit) if prefix else []})
+    response["Cache-Control"] = "private, max-age=60"
+    return response
+
+
 def home_search(request):
     """Search the public home feed across staff and user-created posts."""
     if request.user.is_authenticated and request.user.is_staff:
@@ -4730,10 +4983,15 @@ def home_search(request):
     else:
         empty_message = "Enter a keyword to begin searching."
 
+    feed_next_cursor = ""
+    if page_obj.has_next():
+        feed_next_cursor = _encode_home_feed_cursor(query, page_obj.end_index())
+
     context = {
         "posts": posts,
         "page_obj": page_obj,
         "pagination_query": _pagination_query_without_page(request.GET),
+        "feed_next_cursor": feed_next_cursor,
         "query": query,
         "result_count": result_count,
         "search_performed": search_performed,
@@ -4875,9 +5133,13 @@ def user_adoption_request_action(request, req_id, action):
     if action == "accept":
         req.status = "approved"
         req.save(update_fields=["status"])
-        UserAdoptionRequest.objects.filter(
-            post=req.post
-        ).exclude(id=req.id).update(status="rejected")
+        other_requests = UserAdoptionRequest.objects.filter(post=req.post).exclude(id=req.id)
+        rejected_pending_ids = list(other_requests.filter(status="pending").values_list("id", flat=True))
+        other_requests.update(status="rejected")
+        withdraw_notifications(
+            [notification_key("incoming_user_request", request_id) for request_id in rejected_pending_ids],
+            user_id=request.user.id,
+        )
         req.post.status = "adopted"
         req.post.save(update_fields=["status"])
         bump_user_home_feed_namespace()
@@ -4974,6 +5236,9 @@ def post_detail(request, post_id):
         'detail': detail,
         'back_url': back_url,
         'back_label': back_label,
+        'similar_dogs': _build_similar_dog_items(
+            similar_dogs("staff", post.id, RESCUE_FINDER_RECOMMENDATION_LIMIT)
+        ),
     })
 
 